@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Render the splash-screen logo into `src/igntui/ui/components/splash_logo.py`.
+
+The TUI used to import pyfiglet and render a FIGlet font on every launch. The
+rendering never changes, so it is done here instead and the result is checked
+in: pyfiglet is a dev dependency, and nothing at runtime depends on it.
+
+    render_splash_logo.py           rewrite the module
+    render_splash_logo.py --check   exit 1 if the module is stale (CI runs this)
+
+One variant is rendered per font, widest first; the splash draws the widest
+one that fits the terminal.
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+TARGET = ROOT / "src" / "igntui" / "ui" / "components" / "splash_logo.py"
+
+TEXT = "igntui"
+FONTS = ("slant", "small")
+
+
+def render() -> str:
+    import pyfiglet
+
+    variants = []
+    for font in FONTS:
+        rendered = pyfiglet.Figlet(font=font, width=1000).renderText(TEXT)
+        lines = [line.rstrip() for line in rendered.rstrip("\n").split("\n")]
+        while lines and not lines[0]:
+            lines.pop(0)
+        variants.append((font, lines))
+    # Narrower than every font: the name itself.
+    variants.append(("plain", [TEXT]))
+    variants.sort(key=lambda variant: -max(len(line) for line in variant[1]))
+
+    out = [
+        "#!/usr/bin/env python3",
+        '"""The splash-screen logo, pre-rendered. Generated; do not edit.',
+        "",
+        "Regenerate with `python scripts/render_splash_logo.py`.",
+        '"""',
+        "",
+        "# One tuple of lines per font, widest first.",
+        "LOGOS: tuple[tuple[str, ...], ...] = (",
+    ]
+    for font, lines in variants:
+        width = max(len(line) for line in lines)
+        out.append(f"    # {font}, {width} columns")
+        # Double-quoted, as `ruff format` would write them.
+        quoted = [json.dumps(line) for line in lines]
+        if len(quoted) == 1:
+            out.append(f"    ({quoted[0]},),")
+        else:
+            out.append("    (")
+            out.extend(f"        {line}," for line in quoted)
+            out.append("    ),")
+    out.append(")")
+    return "\n".join(out) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="fail if the module is stale")
+    args = parser.parse_args()
+
+    expected = render()
+    current = TARGET.read_text(encoding="utf-8") if TARGET.exists() else None
+    if args.check:
+        if current != expected:
+            print(f"{TARGET.relative_to(ROOT)} is stale; run scripts/render_splash_logo.py")
+            return 1
+        return 0
+    if current != expected:
+        TARGET.write_text(expected, encoding="utf-8")
+        print(f"wrote {TARGET.relative_to(ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
+"""igntui: generate .gitignore files from gitignore.io templates.
 
+Importing the package is kept cheap on purpose: completion scripts and git
+hooks run `igntui` constantly, and every module imported here is paid for by
+every one of those runs. The public names below are loaded on first access
+(PEP 562), so `import igntui` costs the version string and nothing else.
+"""
 
-import platform
+import importlib
 import sys
-from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.5.0"
 __author__ = "Mohammad Abu Mattar"
@@ -14,29 +20,58 @@ provided by gitignore.io with advanced search, caching, and performance features
 
 
 def get_version_string() -> str:
+    import platform
+
     python_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
     os_name = platform.system()
     os_version = platform.release()
     return f"igntui/{__version__} Python/{python_version} {os_name}/{os_version}"
 
 
-from .core.api import APIResponse, GitIgnoreAPI
-from .core.cache import CacheManager, TemplateCache
-from .core.config import config
-from .core.search import SearchManager, SearchMode
-from .main import cli_main, tui_main
+if TYPE_CHECKING:
+    from .core.api import APIResponse, GitIgnoreAPI
+    from .core.cache import CacheManager, TemplateCache
+    from .core.config import config
+    from .core.search import SearchManager, SearchMode
+    from .main import cli_main, tui_main
+
+    run_tui: Any
+    TUI_AVAILABLE: bool
+
+# Public name -> module that defines it, imported on first access.
+_LAZY_EXPORTS = {
+    "GitIgnoreAPI": ".core.api",
+    "APIResponse": ".core.api",
+    "CacheManager": ".core.cache",
+    "TemplateCache": ".core.cache",
+    "config": ".core.config",
+    "SearchManager": ".core.search",
+    "SearchMode": ".core.search",
+    "cli_main": ".main",
+    "tui_main": ".main",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in ("run_tui", "TUI_AVAILABLE"):
+        # The curses stack is optional (windows-curses); None / False without it.
+        try:
+            from .app import run_tui
+        except ImportError:
+            run_tui = None
+        globals().update(run_tui=run_tui, TUI_AVAILABLE=run_tui is not None)
+        return globals()[name]
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
-# `run_tui` is annotated so the ImportError fallback is an explicit rebind of a
-# declared name rather than an implicit shadow of the imported function.
-run_tui: Callable[..., int] | None
-try:
-    from .app import run_tui as _run_tui
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-    run_tui = _run_tui
-    TUI_AVAILABLE = True
-except ImportError:
-    run_tui = None
-    TUI_AVAILABLE = False
 
 __all__ = [
     "__version__",
@@ -1,14 +1,10 @@
 #!/usr/bin/env python3
 
 
+import importlib
+from typing import Any
+
 from .base import BaseCLI, CLICommand, safe_exit
-from .commands import (
-    CacheCommand,
-    GenerateCommand,
-    ListCommand,
-    TestCommand,
-    TUICommand,
-)
 from .parser import create_base_parser, create_command_parser, get_command_instance
 from .setup import print_curses_error, setup_logging
 
@@ -27,3 +23,14 @@ __all__ = [
     "CacheCommand",
     "TestCommand",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The command classes load with their modules, on first access.
+    # `import_module`, not `from . import commands`: the latter looks
+    # `commands` up on this package first and would land back here.
+    commands = importlib.import_module(".commands", __name__)
+
+    if name in commands.COMMAND_MODULES:
+        return getattr(commands, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,29 +5,101 @@ import argparse
 import logging
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from ..core.api import GitIgnoreAPI
-from ..core.config import Config
-from ..core.repo_config import find_repo_config
+if TYPE_CHECKING:
+    from ..core.api import GitIgnoreAPI, TemplateSource
+    from ..core.config import Config
 
 logger = logging.getLogger(__name__)
 
+# Commands a running `igntui serve` daemon answers for. The rest either change
+# the cache (`cache`, `sync`) or need a live connection of their own (`test`,
+# `tui`), and always run in-process; `completion` never touches the API.
+DAEMON_COMMANDS = frozenset({"list", "generate", "check"})
+
 
 class BaseCLI:
+    """Session state shared by the commands.
+
+    Nothing here is built until a command asks for it: `completion` needs
+    neither an API nor a config, and the API is the most expensive import in
+    the package (the cache, urllib, http.client, ssl).
+    """
+
     def __init__(
         self,
         config_path: Path | None = None,
         no_cache: bool = False,
+        network: str | None = None,
+        command: str | None = None,
     ):
-        repo_path = find_repo_config()
-        self.config = Config(
-            config_path=config_path,
-            repo_config_path=repo_path,
-        )
-        self.repo_config_path = repo_path
+        from ..core.config import configure
+
+        self.config_path = config_path
+        # Everything reads the shared `config`, so `--config` is applied there
+        # rather than to a private copy the API would never see.
+        configure(config_path)
         self.no_cache = no_cache
-        self.api = GitIgnoreAPI()
-        self.api.force_refresh_default = no_cache
+        self.network = network
+        # A daemon answers from its own configuration, so an explicit
+        # `--config` keeps the command in-process.
+        self.use_daemon = command in DAEMON_COMMANDS and config_path is None
+        self._api: GitIgnoreAPI | None = None
+        self._remote_api: TemplateSource | None = None
+
+    @property
+    def repo_config_path(self) -> Path | None:
+        return self.config.repo_config_path
+
+    @property
+    def config(self) -> "Config":
+        from ..core.config import get_config
+
+        return get_config()
+
+    @property
+    def api(self) -> "GitIgnoreAPI":
+        """The in-process API, built on first use."""
+        if self._api is None:
+            self._api = self._local_api()
+        return self._api
+
+    @api.setter
+    def api(self, api: "GitIgnoreAPI") -> None:
+        self._api = api
+
+    @property
+    def remote_api(self) -> "TemplateSource":
+        """Where `DAEMON_COMMANDS` ask for templates.
+
+        This is a client for a running `igntui serve` when its socket exists,
+        falling back to `api` on its own if the daemon does not answer, and
+        `api` itself otherwise.
+        """
+        if self._remote_api is None:
+            # Nor does the daemon know about a repo config in this directory.
+            if self.use_daemon and self.repo_config_path is None:
+                from ..core.api.policy import configured_policy
+                from ..core.daemon import connect
+
+                self._remote_api = connect(
+                    lambda: self.api,
+                    network_policy=self.network or configured_policy(),
+                    force_refresh_default=self.no_cache,
+                )
+            if self._remote_api is None:
+                self._remote_api = self.api
+        return self._remote_api
+
+    def _local_api(self) -> "GitIgnoreAPI":
+        from ..core.api import GitIgnoreAPI
+
+        api = GitIgnoreAPI()
+        api.force_refresh_default = self.no_cache
+        if self.network:
+            api.network_policy = self.network
+        return api
 
     def check_terminal_requirements(self) -> bool:
         try:
@@ -1,16 +1,53 @@
 #!/usr/bin/env python3
+"""One module per subcommand, each loaded only when its command runs."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cache_cmd import CacheCommand
+    from .check_cmd import CheckCommand
+    from .completion_cmd import CompletionCommand
+    from .generate_cmd import GenerateCommand
+    from .list_cmd import ListCommand
+    from .mirror_cmd import MirrorCommand
+    from .serve_cmd import ServeCommand
+    from .sync_cmd import SyncCommand
+    from .test_cmd import TestCommand
+    from .tui_cmd import TUICommand
+
+# Command class -> the module defining it.
+COMMAND_MODULES = {
+    "ListCommand": ".list_cmd",
+    "GenerateCommand": ".generate_cmd",
+    "TUICommand": ".tui_cmd",
+    "CacheCommand": ".cache_cmd",
+    "SyncCommand": ".sync_cmd",
+    "CheckCommand": ".check_cmd",
+    "MirrorCommand": ".mirror_cmd",
+    "ServeCommand": ".serve_cmd",
+    "TestCommand": ".test_cmd",
+    "CompletionCommand": ".completion_cmd",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = COMMAND_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-from .cache_cmd import CacheCommand
-from .generate_cmd import GenerateCommand
-from .list_cmd import ListCommand
-from .test_cmd import TestCommand
-from .tui_cmd import TUICommand
 
 __all__ = [
     "ListCommand",
     "GenerateCommand",
     "TUICommand",
     "CacheCommand",
+    "SyncCommand",
+    "CheckCommand",
+    "MirrorCommand",
+    "ServeCommand",
     "TestCommand",
 ]
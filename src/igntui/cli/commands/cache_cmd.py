@@ -2,7 +2,9 @@
 
 
 import argparse
+import sys
 from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..base import CLICommand
@@ -25,6 +27,45 @@ class CacheCommand(CLICommand):
 
         subparsers.add_parser("stats", help="Show cache statistics")
         subparsers.add_parser("info", help="Show cache information")
+        export_parser = subparsers.add_parser(
+            "export", help="Pack the cache into a portable bundle"
+        )
+        export_parser.add_argument("file", type=Path, help="Bundle file to write (.tar.gz)")
+        import_parser = subparsers.add_parser(
+            "import", help="Load a bundle written by 'cache export'"
+        )
+        import_parser.add_argument("file", type=Path, help="Bundle file to read")
+        invalidate_parser = subparsers.add_parser(
+            "invalidate", help="Drop every cached combination that includes the given templates"
+        )
+        invalidate_parser.add_argument("templates", nargs="+", help="Template names")
+        warm_parser = subparsers.add_parser(
+            "warm", help="Prefetch the template list and a set of templates into the cache"
+        )
+        warm_parser.add_argument(
+            "templates", nargs="*", help="A selection to warm (each template and the combination)"
+        )
+        warm_parser.add_argument(
+            "--all", action="store_true", help="Warm every template in the catalogue"
+        )
+        warm_parser.add_argument(
+            "--from-usage", action="store_true", help="Warm your most-used templates"
+        )
+        warm_parser.add_argument(
+            "--from-repo", action="store_true", help="Warm the [selection] of the repo config"
+        )
+        warm_parser.add_argument(
+            "--from-file",
+            type=Path,
+            metavar="FILE",
+            help="Warm the selections listed in FILE, one per line ('-' for stdin)",
+        )
+        warm_parser.add_argument(
+            "--jobs", "-j", type=int, metavar="N", help="Concurrent fetches (default: 8)"
+        )
+        warm_parser.add_argument(
+            "--refresh", action="store_true", help="Re-fetch entries that are already cached"
+        )
 
     def execute(self, args: argparse.Namespace) -> int:
         try:
@@ -37,6 +78,14 @@ class CacheCommand(CLICommand):
                 return self._show_info(cache)
             elif args.cache_action == "stats":
                 return self._show_stats(cache)
+            elif args.cache_action == "warm":
+                return self._warm(args)
+            elif args.cache_action == "export":
+                return self._export(cache, args.file)
+            elif args.cache_action == "import":
+                return self._import(cache, args.file)
+            elif args.cache_action == "invalidate":
+                return self._invalidate(args.templates)
             elif args.cache_action == "clear":
                 if getattr(args, "expired", False):
                     return self._clear_expired(cache)
@@ -54,29 +103,26 @@ class CacheCommand(CLICommand):
             return 1
 
     def _show_info(self, cache: "CacheManager") -> int:
-        from datetime import datetime
-
         print("Cache Information:")
         print(f"  Location: {cache.cache_dir}")
         print(f"  TTL: {cache.default_ttl} seconds")
 
-        cache_files = sorted(cache.cache_dir.glob("*.cache"))
-        if not cache_files:
+        # From the cache's metadata index — globbing and stat-ing every entry
+        # file here cost seconds on a large cache.
+        summary = cache.get_disk_summary()
+        if not summary["entries"]:
             print("  Cached entries: 0")
             return 0
 
-        total_bytes = sum(f.stat().st_size for f in cache_files)
-        mtimes = [f.stat().st_mtime for f in cache_files]
-        oldest = datetime.fromtimestamp(min(mtimes)).strftime("%Y-%m-%d %H:%M:%S")
-        newest = datetime.fromtimestamp(max(mtimes)).strftime("%Y-%m-%d %H:%M:%S")
-
-        list_count = sum(1 for f in cache_files if f.stem == "gitignore_templates_list")
-        content_count = sum(1 for f in cache_files if f.stem.startswith("gitignore_content_"))
+        oldest = datetime.fromtimestamp(summary["oldest"]).strftime("%Y-%m-%d %H:%M:%S")
+        newest = datetime.fromtimestamp(summary["newest"]).strftime("%Y-%m-%d %H:%M:%S")
 
-        print(f"  Cached entries: {len(cache_files)}")
-        print(f"    template list: {list_count}")
-        print(f"    content blobs: {content_count}")
-        print(f"  Total size: {total_bytes:,} bytes")
+        print(f"  Cached entries: {summary['entries']}")
+        print(f"    template list: {summary['template_lists']}")
+        print(f"    content blobs: {summary['content_blobs']}")
+        if summary["unknown_names"]:
+            print(f"    unknown names: {summary['unknown_names']}")
+        print(f"  Total size: {summary['total_bytes']:,} bytes")
         print(f"  Oldest entry: {oldest}")
         print(f"  Newest entry: {newest}")
         return 0
@@ -92,6 +138,137 @@ class CacheCommand(CLICommand):
 
         return 0
 
+    def _warm(self, args: argparse.Namespace) -> int:
+        from ...core.warm import DEFAULT_JOBS, expand_selections, warm_cache
+
+        api = self.cli.api
+        refresh = args.refresh
+
+        catalogue = api.list_templates(force_refresh=refresh)
+        if not catalogue.success:
+            print(f"Error: could not fetch the template list: {catalogue.error_message}")
+            return 1
+        source = "already cached" if catalogue.from_cache else "fetched"
+        print(f"Template list: {source} ({len(catalogue.data)} templates)")
+
+        selections = self._warm_selections(args, catalogue.data)
+        if selections is None:
+            return 1
+        keys = expand_selections(selections)
+        if not keys:
+            print("No templates to warm (choose some with --all, --from-usage, --from-repo,")
+            print("--from-file or by name)")
+            return 0
+
+        jobs = args.jobs or DEFAULT_JOBS
+        show_progress = sys.stderr.isatty()
+
+        def progress(report) -> None:
+            if show_progress:
+                print(
+                    f"\r  warming {report.done}/{report.total}", end="", file=sys.stderr, flush=True
+                )
+
+        report = warm_cache(api, keys, refresh=refresh, jobs=jobs, progress=progress)
+        if show_progress:
+            print(file=sys.stderr)
+
+        noun = "entry" if report.total == 1 else "entries"
+        print(
+            f"Warmed {report.total} {noun}: {report.fetched} fetched, "
+            f"{report.cached} already cached, {len(report.failed)} failed"
+        )
+        for name in report.failed:
+            print(f"  failed: {name}")
+        return 1 if report.failed else 0
+
+    def _warm_selections(
+        self, args: argparse.Namespace, catalogue: list[str]
+    ) -> list[list[str]] | None:
+        from ...core.config import config
+        from ...core.repo_config import RepoConfig
+        from ...core.usage import UsageTracker
+        from ...core.warm import parse_selections, read_selection_file
+
+        selections: list[list[str]] = []
+        if args.templates:
+            selections.append(list(args.templates))
+        if args.all:
+            selections.extend([name] for name in catalogue)
+        if args.from_usage:
+            top = int(config.get("behavior", "max_recent_templates", default=10) or 10)
+            selections.extend([name] for name in UsageTracker().top(top))
+        if args.from_repo:
+            # The repo config the session resolved, so `--from-repo` warms the
+            # same selection the rest of the run is configured by.
+            path = self.cli.repo_config_path
+            repo = RepoConfig.load(path) if path else None
+            if repo is None or not repo.has_selection():
+                print("Warning: no repo config with a [selection] found")
+            else:
+                selections.append(repo.selection_templates)
+        if args.from_file:
+            try:
+                if str(args.from_file) == "-":
+                    selections.extend(parse_selections(sys.stdin.read()))
+                else:
+                    selections.extend(read_selection_file(args.from_file))
+            except OSError as e:
+                print(f"Error reading {args.from_file}: {e}")
+                return None
+        return selections
+
+    def _export(self, cache: "CacheManager", path: Path) -> int:
+        from ...core.cache_bundle import export_bundle
+
+        try:
+            count = export_bundle(cache, path)
+        except OSError as e:
+            print(f"Error writing {path}: {e}")
+            return 1
+        size = path.stat().st_size
+        print(f"Exported {count} {'entry' if count == 1 else 'entries'} to {path} ({size:,} bytes)")
+        return 0
+
+    def _import(self, cache: "CacheManager", path: Path) -> int:
+        from ...core.cache_bundle import BundleError, import_bundle
+
+        try:
+            report = import_bundle(cache, path)
+        except BundleError as e:
+            print(f"Error: {e}")
+            return 1
+
+        self._notify_daemon()
+        print(f"Bundle from igntui {report.igntui_version}, created {report.created_at}")
+        print(
+            f"Imported {report.imported} {'entry' if report.imported == 1 else 'entries'}"
+            f" ({report.skipped} kept because the cached copy is as new or newer)"
+        )
+        if report.corrupt:
+            print(f"Warning: {len(report.corrupt)} entries failed verification and were skipped:")
+            for key in report.corrupt:
+                print(f"  {key}")
+        if report.rejected:
+            print(
+                f"Warning: {len(report.rejected)} entries were malformed or could not be written:"
+            )
+            for key in report.rejected:
+                print(f"  {key}")
+        return 1 if report.corrupt or report.rejected else 0
+
+    def _invalidate(self, templates: list[str]) -> int:
+        template_cache = self.cli.api.template_cache
+        total = 0
+        for name in templates:
+            removed = template_cache.invalidate_template(name)
+            total += removed
+            print(f"{name}: removed {removed} {'entry' if removed == 1 else 'entries'}")
+        if len(templates) > 1:
+            print(f"Removed {total} {'entry' if total == 1 else 'entries'} in total")
+        self._notify_daemon()
+        return 0
+
     def _clear_expired(self, cache: "CacheManager") -> int:
         """Sweep only what is past its TTL.
 
@@ -115,5 +292,12 @@ class CacheCommand(CLICommand):
                 return 1
 
         cache.clear_all()
+        self._notify_daemon()
         print("Cache cleared successfully")
         return 0
+
+    def _notify_daemon(self) -> None:
+        """Have a running `igntui serve` drop its in-memory copies of what just changed."""
+        from ...core.daemon import notify_flush
+
+        notify_flush()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+
+import argparse
+from pathlib import Path
+
+from ..base import CLICommand
+
+
+class CheckCommand(CLICommand):
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            type=Path,
+            default=[Path(".")],
+            help="Directories to search, or sidecar / generated files to check (default: .)",
+        )
+
+    def execute(self, args: argparse.Namespace) -> int:
+        from ...core.check import CheckReport, check_targets
+        from ...core.sync import load_targets
+
+        api = self.cli.remote_api
+        # A drift check compares against what the cache holds, however old:
+        # an expired TTL should not turn a CI run into a network run. An
+        # explicit --network still wins.
+        if not getattr(args, "network", None) and api.network_policy == "online":
+            api.network_policy = "prefer-cache"
+
+        report = CheckReport()
+        sidecars = self._sidecars(args.paths, report.failed)
+        if not sidecars and not report.failed:
+            print("No .igntui.cfg.toml sidecars found")
+            return 0
+
+        try:
+            targets = load_targets(sidecars, report.failed)
+            check_targets(api, targets, report)
+        except Exception as e:
+            self.cli.handle_api_error(e)
+            return 1
+
+        for label, paths in (
+            ("drifted", report.drifted),
+            ("missing", report.missing),
+            ("unmanaged", report.unmanaged),
+        ):
+            for path in paths:
+                print(f"  {label}: {path}")
+        for path, reason in report.failed:
+            print(f"  failed: {path} ({reason})")
+
+        noun = "file" if report.total == 1 else "files"
+        print(
+            f"Checked {report.total} {noun}: {len(report.current)} current, "
+            f"{len(report.drifted)} drifted, {len(report.missing)} missing, "
+            f"{len(report.unmanaged)} unmanaged, {len(report.failed)} failed"
+        )
+        if report.drifted or report.missing:
+            print("Run 'igntui sync' to regenerate them.")
+        return 0 if report.ok else 1
+
+    def _sidecars(self, paths: list[Path], failed: list[tuple[Path, str]]) -> list[Path]:
+        from ...core.project_config import find_sidecar
+        from ...core.sync import find_sidecars
+
+        sidecars: set[Path] = set()
+        for path in paths:
+            if path.is_dir():
+                sidecars.update(find_sidecars(path))
+            elif path.is_file():
+                # A sidecar itself, or a generated file: use its directory's sidecar.
+                sidecar = path if path.name.endswith("cfg.toml") else find_sidecar(path.parent)
+                if sidecar is None:
+                    failed.append((path, "no .igntui.cfg.toml beside it"))
+                else:
+                    sidecars.add(sidecar)
+            else:
+                failed.append((path, "no such file or directory"))
+        return sorted(sidecars)
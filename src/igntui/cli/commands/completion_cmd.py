@@ -1,12 +1,32 @@
 #!/usr/bin/env python3
-"""`igntui completion <shell>` — emit a shell completion script."""
+"""`igntui completion <shell>` — emit a shell completion script.
+
+Template names for `generate` come from `catalogue.txt` in the cache directory,
+which the cache rewrites whenever it stores the template list. The scripts read
+that file themselves: a Tab press starts no Python, so it costs a file read
+rather than an interpreter start.
+"""
 
 import argparse
 
 from ..base import CLICommand
 
-_SUBCOMMANDS = ["tui", "list", "generate", "cache", "test", "completion"]
-_GLOBAL_FLAGS = "--version --verbose --log-level --config --no-cache --help"
+_SUBCOMMANDS = [
+    "tui",
+    "list",
+    "generate",
+    "cache",
+    "sync",
+    "check",
+    "mirror",
+    "serve",
+    "test",
+    "completion",
+]
+_GLOBAL_FLAGS = "--version --verbose --log-level --config --no-cache --network --offline --help"
+# `config.get_cache_dir() / CATALOGUE_FILENAME`, spelled for the shell so each
+# user's own cache is read.
+_CATALOGUE = "$HOME/.cache/igntui/catalogue.txt"
 
 
 _BASH = """\
@@ -32,9 +52,29 @@ _igntui_complete() {
 
     case "$cmd" in
         tui)       COMPREPLY=( $(compgen -W "--no-splash" -- "$cur") ); return ;;
-        list)      COMPREPLY=( $(compgen -W "--filter --count" -- "$cur") ); return ;;
-        generate)  COMPREPLY=( $(compgen -W "--output --append --force --dry-run --no-sidecar" -- "$cur") ); return ;;
-        cache)     COMPREPLY=( $(compgen -W "info stats clear --force --expired" -- "$cur") ); return ;;
+        list)
+            if [[ "$prev" == --format ]]; then
+                COMPREPLY=( $(compgen -W "plain json ndjson" -- "$cur") )
+            else
+                COMPREPLY=( $(compgen -W "--filter --count --format --null" -- "$cur") )
+            fi
+            return ;;
+        generate)
+            if [[ "$prev" == --format ]]; then
+                COMPREPLY=( $(compgen -W "plain json ndjson" -- "$cur") )
+            elif [[ "$cur" == -* ]]; then
+                COMPREPLY=( $(compgen -W "--output --append --force --dry-run --no-sidecar --format --null --manifest --jobs" -- "$cur") )
+            elif [[ "$prev" == --output || "$prev" == -o || "$prev" == --manifest || "$prev" == -m ]]; then
+                COMPREPLY=( $(compgen -f -- "$cur") )
+            elif [[ -r "%(catalogue)s" ]]; then
+                COMPREPLY=( $(compgen -W "$(< "%(catalogue)s")" -- "$cur") )
+            fi
+            return ;;
+        cache)     COMPREPLY=( $(compgen -W "info stats clear warm export import invalidate --force --expired --all --from-usage --from-repo --from-file --jobs --refresh" -- "$cur") ); return ;;
+        sync)      COMPREPLY=( $(compgen -d -W "--jobs --dry-run" -- "$cur") ); return ;;
+        check)     COMPREPLY=( $(compgen -f -- "$cur") ); return ;;
+        mirror)    COMPREPLY=( $(compgen -f -W "serve --host --port --bundle --cache-dir" -- "$cur") ); return ;;
+        serve)     COMPREPLY=( $(compgen -f -W "--socket" -- "$cur") ); return ;;
         test)      COMPREPLY=( $(compgen -W "--timeout" -- "$cur") ); return ;;
         completion) COMPREPLY=( $(compgen -W "bash zsh fish" -- "$cur") ); return ;;
         "")        COMPREPLY=( $(compgen -W "$subcommands $global_flags" -- "$cur") ); return ;;
@@ -51,10 +91,16 @@ _ZSH = """\
 #   eval "$(igntui completion zsh)"
 # or save to a directory on $fpath as _igntui
 
+_igntui_templates() {
+    local catalogue="%(catalogue)s"
+    [[ -r $catalogue ]] || return 1
+    compadd -- ${(f)"$(<$catalogue)"}
+}
+
 _igntui() {
     local -a subcommands global_flags
     subcommands=(%(subcommands_quoted)s)
-    global_flags=(--version --verbose --log-level --config --no-cache --help)
+    global_flags=(--version --verbose --log-level --config --no-cache --network --offline --help)
 
     local context state line
     _arguments -C \\
@@ -66,17 +112,45 @@ _igntui() {
         args)
             case $line[1] in
                 tui)       _arguments '--no-splash[skip splash screen]' ;;
-                list)      _arguments '--filter[pattern]:pattern:' '--count[show count only]' ;;
+                list)      _arguments \\
+                    '--filter[pattern]:pattern:' \\
+                    '--count[show count only]' \\
+                    '--format[output for scripts]:format:(plain json ndjson)' \\
+                    '--null[end each name with NUL]' ;;
                 generate)  _arguments \\
                     '--output[output file]:file:_files' \\
                     '--append[append to existing]' \\
                     '--force[overwrite without prompt]' \\
                     '--dry-run[print without writing]' \\
-                    '--no-sidecar[skip igntui.cfg.toml]' ;;
+                    '--no-sidecar[skip igntui.cfg.toml]' \\
+                    '--format[output for scripts]:format:(plain json ndjson)' \\
+                    '--null[end the output with NUL]' \\
+                    '--manifest[write every output in a TOML manifest]:file:_files' \\
+                    '--jobs[concurrent fetches and writes]:jobs:' \\
+                    '*:template:_igntui_templates' ;;
                 cache)     _arguments \\
-                    '1:action:(info stats clear)' \\
+                    '1:action:(info stats clear warm export import invalidate)' \\
                     '--force[skip confirmation]' \\
-                    '--expired[only entries past their TTL]' ;;
+                    '--expired[only entries past their TTL]' \\
+                    '--all[warm every template]' \\
+                    '--from-usage[warm your most-used templates]' \\
+                    '--from-repo[warm the repo config selection]' \\
+                    '--from-file[warm selections listed in a file]:file:_files' \\
+                    '--jobs[concurrent fetches]:jobs:' \\
+                    '--refresh[re-fetch cached entries]' \\
+                    '2:bundle:_files' ;;
+                sync)      _arguments \\
+                    '--jobs[concurrent fetches and writes]:jobs:' \\
+                    '--dry-run[report without writing]' \\
+                    '1:root:_directories' ;;
+                check)     _arguments '*:path:_files' ;;
+                mirror)    _arguments \\
+                    '1:action:(serve)' \\
+                    '--host[address to listen on]:host:' \\
+                    '--port[port to listen on]:port:' \\
+                    '--bundle[import a bundle first]:file:_files' \\
+                    '--cache-dir[cache directory to serve]:dir:_directories' ;;
+                serve)     _arguments '--socket[socket path]::socket:_files' ;;
                 test)      _arguments '--timeout[seconds]:seconds:' ;;
                 completion) _values 'shell' bash zsh fish ;;
             esac
@@ -102,19 +176,45 @@ complete -c igntui -n "not __fish_seen_subcommand_from $__igntui_subs" -a "$__ig
 complete -c igntui -l version -d "Show version"
 complete -c igntui -l verbose -d "Verbose output"
 complete -c igntui -l no-cache -d "Disable caching"
+complete -c igntui -l network -d "Network policy" -x -a "online prefer-cache offline"
+complete -c igntui -l offline -d "Never use the network"
 complete -c igntui -l config -d "Custom config file" -r
 complete -c igntui -l log-level -d "Set logging level" -x -a "DEBUG INFO WARNING ERROR CRITICAL"
 
 complete -c igntui -n "__fish_seen_subcommand_from tui" -l no-splash -d "Skip splash"
 complete -c igntui -n "__fish_seen_subcommand_from list" -l filter -d "Filter pattern" -r
 complete -c igntui -n "__fish_seen_subcommand_from list" -l count -d "Show count only"
+complete -c igntui -n "__fish_seen_subcommand_from list" -l format -d "Output for scripts" -xa "plain json ndjson"
+complete -c igntui -n "__fish_seen_subcommand_from list" -l null -d "End each name with NUL"
+complete -c igntui -n "__fish_seen_subcommand_from generate" -a "(cat %(catalogue)s 2>/dev/null)"
 complete -c igntui -n "__fish_seen_subcommand_from generate" -l output -d "Output file" -r
 complete -c igntui -n "__fish_seen_subcommand_from generate" -l dry-run -d "Print without writing"
 complete -c igntui -n "__fish_seen_subcommand_from generate" -l no-sidecar -d "Skip sidecar"
 complete -c igntui -n "__fish_seen_subcommand_from generate" -l force -d "Overwrite without prompt"
-complete -c igntui -n "__fish_seen_subcommand_from cache" -a "info stats clear"
+complete -c igntui -n "__fish_seen_subcommand_from generate" -l format -d "Output for scripts" -xa "plain json ndjson"
+complete -c igntui -n "__fish_seen_subcommand_from generate" -l null -d "End the output with NUL"
+complete -c igntui -n "__fish_seen_subcommand_from generate" -l manifest -d "TOML manifest of outputs" -r
+complete -c igntui -n "__fish_seen_subcommand_from generate" -l jobs -d "Concurrent fetches and writes" -x
+complete -c igntui -n "__fish_seen_subcommand_from cache" -a "info stats clear warm export import invalidate"
+complete -c igntui -n "__fish_seen_subcommand_from export import" -F
 complete -c igntui -n "__fish_seen_subcommand_from cache" -l force -d "Skip confirmation"
 complete -c igntui -n "__fish_seen_subcommand_from cache" -l expired -d "Only expired entries"
+complete -c igntui -n "__fish_seen_subcommand_from warm" -l all -d "Every template"
+complete -c igntui -n "__fish_seen_subcommand_from warm" -l from-usage -d "Most-used templates"
+complete -c igntui -n "__fish_seen_subcommand_from warm" -l from-repo -d "Repo config selection"
+complete -c igntui -n "__fish_seen_subcommand_from warm" -l from-file -d "Selections file" -r
+complete -c igntui -n "__fish_seen_subcommand_from warm" -l jobs -d "Concurrent fetches" -x
+complete -c igntui -n "__fish_seen_subcommand_from warm" -l refresh -d "Re-fetch cached entries"
+complete -c igntui -n "__fish_seen_subcommand_from sync" -a "(__fish_complete_directories)"
+complete -c igntui -n "__fish_seen_subcommand_from sync" -l jobs -d "Concurrent fetches and writes" -x
+complete -c igntui -n "__fish_seen_subcommand_from sync" -l dry-run -d "Report without writing"
+complete -c igntui -n "__fish_seen_subcommand_from check" -F
+complete -c igntui -n "__fish_seen_subcommand_from mirror" -a "serve"
+complete -c igntui -n "__fish_seen_subcommand_from mirror" -l host -d "Address to listen on" -x
+complete -c igntui -n "__fish_seen_subcommand_from mirror" -l port -d "Port to listen on" -x
+complete -c igntui -n "__fish_seen_subcommand_from mirror" -l bundle -d "Import a bundle first" -r
+complete -c igntui -n "__fish_seen_subcommand_from mirror" -l cache-dir -d "Cache directory to serve" -r
+complete -c igntui -n "__fish_seen_subcommand_from serve" -l socket -d "Socket path" -r
 complete -c igntui -n "__fish_seen_subcommand_from completion" -a "bash zsh fish"
 """
 
@@ -139,6 +239,7 @@ class CompletionCommand(CLICommand):
                 "subcommands_quoted": " ".join(f'"{s}"' for s in _SUBCOMMANDS),
                 "subcommands_space": " ".join(_SUBCOMMANDS),
                 "global_flags": _GLOBAL_FLAGS,
+                "catalogue": _CATALOGUE,
             }
         )
         return 0
@@ -2,7 +2,10 @@
 
 
 import argparse
+import contextlib
+import json
 import sys
+import time
 from pathlib import Path
 
 from ..base import CLICommand
@@ -11,7 +14,7 @@ from ..base import CLICommand
 class GenerateCommand(CLICommand):
     def add_arguments(self, parser: argparse.ArgumentParser) -> None:
         parser.add_argument(
-            "templates", nargs="+", help="Template names to generate (space-separated)"
+            "templates", nargs="*", help="Template names to generate (space-separated)"
         )
         parser.add_argument(
             "--output",
@@ -32,13 +35,63 @@ class GenerateCommand(CLICommand):
             action="store_true",
             help="Force overwrite without confirmation",
         )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Print resolved content to stdout without writing any file",
+        )
+        parser.add_argument(
+            "--no-sidecar",
+            action="store_true",
+            help="Do not write igntui.cfg.toml alongside the output file",
+        )
+        parser.add_argument(
+            "--format",
+            choices=("plain", "json", "ndjson"),
+            help="Print to stdout for scripts: raw content, or a JSON object",
+        )
+        parser.add_argument(
+            "--null", "-0", action="store_true", help="End the output with NUL (implies plain)"
+        )
+        parser.add_argument(
+            "--manifest",
+            "-m",
+            type=Path,
+            metavar="FILE",
+            help="Write every output listed in a TOML manifest, in one run",
+        )
+        parser.add_argument(
+            "--jobs",
+            "-j",
+            type=int,
+            metavar="N",
+            help="Concurrent fetches and writes with --manifest (default: 8)",
+        )
 
     def execute(self, args: argparse.Namespace) -> int:
+        from ..output import format_error, output_format
+
+        if error := format_error(args):
+            print(f"Error: {error}", file=sys.stderr)
+            return 1
+        if getattr(args, "manifest", None) is not None:
+            return self._generate_manifest(args)
+        if not args.templates:
+            print("Error: name at least one template, or pass --manifest FILE")
+            return 1
+        if output_format(args) is None:
+            return self._generate(args, sys.stdout)
+        # For scripts, stdout carries only the data; messages go to stderr.
+        stdout = sys.stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            return self._generate(args, stdout)
+
+    def _generate(self, args: argparse.Namespace, stdout) -> int:
         try:
             if args.verbose:
                 print(f"Generating .gitignore for: {', '.join(args.templates)}")
 
-            response = self.cli.api.get_templates(args.templates)
+            response = self.cli.remote_api.get_templates(args.templates)
 
             if not response.success:
                 print(f"Error: {response.error_message}")
@@ -59,11 +112,11 @@ class GenerateCommand(CLICommand):
                     )
                 else:
                     print("# (dry-run — no file written)", file=sys.stderr)
-                print(content)
+                self._print(args, response, stdout)
                 return 0
 
             if not args.output:
-                print(content)
+                self._print(args, response, stdout)
                 return 0
 
             output_file = args.output
@@ -103,6 +156,85 @@ class GenerateCommand(CLICommand):
             self.cli.handle_api_error(e)
             return 1
 
+    def _print(self, args: argparse.Namespace, response, stdout) -> None:
+        from ..output import output_format, write
+
+        fmt = output_format(args)
+        end = "\0" if getattr(args, "null", False) else "\n"
+        if fmt in (None, "plain"):
+            write([response.data, end], stdout)
+            return
+        document = {
+            "templates": list(args.templates),
+            "from_cache": response.from_cache,
+            "content": response.data,
+        }
+        indent = 2 if fmt == "json" else None
+        write([json.dumps(document, ensure_ascii=False, indent=indent), end], stdout)
+
+    def _generate_manifest(self, args: argparse.Namespace) -> int:
+        """`--manifest`: every entry in one process, each distinct selection fetched once."""
+        from ...core.manifest import ManifestError, load_manifest
+        from ...core.sync import DEFAULT_JOBS, sync_targets
+
+        conflicting = [
+            flag
+            for flag, given in (
+                ("template names", args.templates),
+                ("--output", args.output),
+                ("--append", args.append),
+                ("--force", args.force),
+                ("--no-sidecar", args.no_sidecar),
+                ("--format", getattr(args, "format", None)),
+                ("--null", getattr(args, "null", False)),
+            )
+            if given
+        ]
+        if conflicting:
+            print(f"Error: --manifest cannot be combined with {', '.join(conflicting)}")
+            return 1
+
+        try:
+            targets = load_manifest(args.manifest)
+        except ManifestError as e:
+            print(f"Error: {e}")
+            return 1
+
+        started = time.perf_counter()
+        try:
+            # In-process even with a daemon running: the client sends one
+            # request at a time, which would serialize the parallel fetches.
+            report = sync_targets(
+                self.cli.api,
+                targets,
+                jobs=getattr(args, "jobs", None) or DEFAULT_JOBS,
+                dry_run=args.dry_run,
+            )
+        except Exception as e:
+            self.cli.handle_api_error(e)
+            return 1
+        elapsed = time.perf_counter() - started
+
+        root = args.manifest.parent
+        changed = set(report.changed)
+        failed = dict(report.failed)
+        verb = "would change" if args.dry_run else "changed"
+        for target in targets:
+            name = _relative(target.output, root)
+            if target.output in failed:
+                print(f"  {'failed:':<14}{name} ({failed[target.output]})")
+                continue
+            fetch, write = report.timings[target.output]
+            status = verb if target.output in changed else "unchanged"
+            print(f"  {status + ':':<14}{name} (fetch {_ms(fetch)}, write {_ms(write)})")
+
+        print(
+            f"Generated {len(targets)} outputs from {report.selections} distinct selections "
+            f"in {_ms(elapsed)}: {len(report.changed)} {verb}, {len(report.unchanged)} "
+            f"unchanged, {len(report.failed)} failed"
+        )
+        return 1 if report.failed else 0
+
     def _write_sidecar(self, output_file: Path, templates: list[str]) -> None:
         from ...core.project_config import SIDECAR_FILENAME, ProjectConfig
 
@@ -115,3 +247,14 @@ class GenerateCommand(CLICommand):
             print(f"✓ Wrote {sidecar_path}")
         except Exception as e:
             print(f"Warning: could not write sidecar ({e})")
+
+
+def _relative(path: Path, root: Path) -> Path:
+    try:
+        return path.relative_to(root)
+    except ValueError:
+        return path
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f} ms"
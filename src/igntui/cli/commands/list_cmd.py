@@ -2,6 +2,8 @@
 
 
 import argparse
+import contextlib
+import sys
 
 from ..base import CLICommand
 
@@ -10,13 +12,30 @@ class ListCommand(CLICommand):
     def add_arguments(self, parser: argparse.ArgumentParser) -> None:
         parser.add_argument("--filter", "-f", metavar="PATTERN", help="Filter templates by pattern")
         parser.add_argument("--count", "-c", action="store_true", help="Show count only")
+        parser.add_argument(
+            "--format",
+            choices=("plain", "json", "ndjson"),
+            help="Print names for scripts: one per line, a JSON array, or JSON lines",
+        )
+        parser.add_argument(
+            "--null", "-0", action="store_true", help="End each name with NUL (implies plain)"
+        )
 
     def execute(self, args: argparse.Namespace) -> int:
+        from ..output import format_error, output_format
+
+        if error := format_error(args):
+            print(f"Error: {error}", file=sys.stderr)
+            return 1
+        fmt = output_format(args)
+        if fmt is not None:
+            return self._execute_machine(args, fmt)
+
         try:
             if args.verbose:
                 print("Fetching templates from gitignore.io...")
 
-            response = self.cli.api.list_templates()
+            response = self.cli.remote_api.list_templates()
 
             if not response.success:
                 print(f"Error: {response.error_message}")
@@ -59,3 +78,34 @@ class ListCommand(CLICommand):
         except Exception as e:
             self.cli.handle_api_error(e)
             return 1
+
+    def _execute_machine(self, args: argparse.Namespace, fmt: str) -> int:
+        """`--format`/`--null`: data on stdout in one write, messages on stderr."""
+        from ..output import records, write
+
+        try:
+            response = self.cli.remote_api.list_templates()
+        except Exception as e:
+            with contextlib.redirect_stdout(sys.stderr):
+                self.cli.handle_api_error(e)
+            return 1
+        if not response.success:
+            print(f"Error: {response.error_message}", file=sys.stderr)
+            return 1
+
+        templates = response.data
+        if args.filter:
+            pattern = args.filter.lower()
+            templates = [t for t in templates if pattern in t.lower()]
+
+        if args.count:
+            write([f"{len(templates)}\n"])
+            return 0
+
+        # An empty array is still valid JSON for whoever parses it.
+        write(["".join(records(templates, fmt, args.null))])
+        if not templates:
+            if args.filter:
+                print(f"No templates found matching '{args.filter}'", file=sys.stderr)
+            return 1
+        return 0
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+
+import argparse
+import signal
+from pathlib import Path
+
+from ..base import CLICommand
+
+
+class MirrorCommand(CLICommand):
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        subparsers = parser.add_subparsers(dest="mirror_action", help="Mirror action")
+        serve_parser = subparsers.add_parser(
+            "serve", help="Serve the cache over HTTP as a gitignore.io-compatible API"
+        )
+        serve_parser.add_argument(
+            "--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)"
+        )
+        serve_parser.add_argument(
+            "--port", "-p", type=int, default=8080, help="Port to listen on (default: 8080)"
+        )
+        serve_parser.add_argument(
+            "--bundle", type=Path, metavar="FILE", help="Import a cache bundle before serving"
+        )
+        serve_parser.add_argument(
+            "--cache-dir",
+            type=Path,
+            metavar="DIR",
+            help="Serve this cache directory instead of the configured one",
+        )
+
+    def execute(self, args: argparse.Namespace) -> int:
+        if getattr(args, "mirror_action", None) != "serve":
+            print("Usage: igntui mirror serve [--host HOST] [--port PORT] [--bundle FILE]")
+            return 1
+
+        from ...core.cache import CacheManager
+        from ...core.cache_bundle import BundleError, import_bundle
+        from ...core.mirror import MirrorServer
+
+        if args.cache_dir:
+            cache = CacheManager(args.cache_dir)
+        else:
+            cache = self.cli.api.cache_manager
+
+        if args.bundle:
+            try:
+                report = import_bundle(cache, args.bundle)
+            except BundleError as e:
+                print(f"Error: {e}")
+                return 1
+            print(f"Imported {report.imported} entries from {args.bundle}")
+
+        try:
+            server = MirrorServer((args.host, args.port), cache)
+        except OSError as e:
+            print(f"Error: cannot listen on {args.host}:{args.port}: {e}")
+            return 1
+
+        def stop(signum, frame):
+            raise KeyboardInterrupt
+
+        previous = signal.signal(signal.SIGTERM, stop)
+        try:
+            print(f"Serving {cache.cache_dir} at {server.url}")
+            print(f"Point clients at it with IGNTUI_API_URL={server.url}")
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+            server.server_close()
+
+        self._print_stats(server.stats.summary())
+        return 0
+
+    def _print_stats(self, summary: dict) -> None:
+        if not summary:
+            print("No requests served")
+            return
+        print(
+            f"{'endpoint':<10} {'requests':>8} {'errors':>6} {'mean ms':>8} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}"
+        )
+        for endpoint, stats in summary.items():
+            print(
+                f"{endpoint:<10} {stats['requests']:>8} {stats['errors']:>6} "
+                f"{stats['mean_ms']:>8.2f} {stats['p50_ms']:>8.2f} "
+                f"{stats['p95_ms']:>8.2f} {stats['max_ms']:>8.2f}"
+            )
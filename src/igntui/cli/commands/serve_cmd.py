@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+
+import argparse
+import signal
+from pathlib import Path
+
+from ..base import CLICommand
+
+
+class ServeCommand(CLICommand):
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "--socket",
+            nargs="?",
+            type=Path,
+            const=None,
+            metavar="PATH",
+            help="Listen on PATH (default: api.daemon_socket, else daemon.sock in the cache dir)",
+        )
+
+    def execute(self, args: argparse.Namespace) -> int:
+        from ...core import daemon
+
+        if not daemon.supported():
+            print("Error: igntui serve needs Unix domain sockets, which this platform lacks")
+            return 1
+
+        path = getattr(args, "socket", None) or daemon.socket_path()
+        if path.exists() or path.is_symlink():
+            if self._answers(path):
+                print(f"Error: a daemon is already listening on {path}")
+                return 1
+            # Left behind by a daemon that did not shut down cleanly.
+            path.unlink()
+
+        try:
+            server = daemon.DaemonServer(path, api=self.cli.api)
+        except OSError as e:
+            print(f"Error: cannot listen on {path}: {e}")
+            return 1
+
+        # SIGTERM (from `kill`, or a service manager) shuts down as cleanly as ^C.
+        def stop(signum, frame):
+            raise KeyboardInterrupt
+
+        previous = signal.signal(signal.SIGTERM, stop)
+        try:
+            server.warm()
+            print(f"Serving on {path}")
+            if path.resolve() != daemon.socket_path().resolve():
+                # Clients only look at socket_path(); say how to point them here.
+                print(
+                    f"Other invocations look at {daemon.socket_path()}; set IGNTUI_SOCKET={path} for them to use this daemon"
+                )
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+            server.server_close()
+        print("Daemon stopped")
+        return 0
+
+    def _answers(self, path: Path) -> bool:
+        from ...core.daemon import DaemonClient, DaemonError, DaemonUnavailable
+
+        client = DaemonClient(path, fallback=lambda: self.cli.api, timeout=2.0)
+        try:
+            client.ping()
+        except (DaemonUnavailable, DaemonError):
+            return False
+        finally:
+            client.close()
+        return True
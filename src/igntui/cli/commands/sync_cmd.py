@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+
+import argparse
+import sys
+from pathlib import Path
+
+from ..base import CLICommand
+
+
+class SyncCommand(CLICommand):
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument(
+            "root",
+            nargs="?",
+            type=Path,
+            default=Path("."),
+            help="Directory to search for .igntui.cfg.toml sidecars (default: .)",
+        )
+        parser.add_argument(
+            "--jobs", "-j", type=int, metavar="N", help="Concurrent fetches and writes (default: 8)"
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report which files would change without writing any",
+        )
+
+    def execute(self, args: argparse.Namespace) -> int:
+        from ...core.sync import DEFAULT_JOBS, SyncReport, find_sidecars, load_targets, sync_targets
+
+        root = args.root
+        if not root.is_dir():
+            print(f"Error: {root} is not a directory")
+            return 1
+
+        try:
+            sidecars = find_sidecars(root)
+            if not sidecars:
+                print(f"No .igntui.cfg.toml sidecars found under {root}")
+                return 0
+
+            report = SyncReport()
+            targets = load_targets(sidecars, report.failed)
+            show_progress = sys.stderr.isatty()
+
+            def progress(report: SyncReport) -> None:
+                if show_progress:
+                    done = len(report.changed) + len(report.unchanged)
+                    print(f"\r  syncing {done}/{len(targets)}", end="", file=sys.stderr, flush=True)
+
+            sync_targets(
+                self.cli.api,
+                targets,
+                report,
+                jobs=args.jobs or DEFAULT_JOBS,
+                dry_run=args.dry_run,
+                progress=progress,
+            )
+            if show_progress:
+                print(file=sys.stderr)
+
+        except Exception as e:
+            self.cli.handle_api_error(e)
+            return 1
+
+        verb = "would change" if args.dry_run else "changed"
+        for path in report.changed:
+            print(f"  {verb}: {_relative(path, root)}")
+        for path, reason in report.failed:
+            print(f"  failed: {_relative(path, root)} ({reason})")
+
+        total = len(report.changed) + len(report.unchanged) + len(report.failed)
+        noun = "file" if total == 1 else "files"
+        print(
+            f"Synced {total} {noun} from {report.selections} distinct selections: "
+            f"{len(report.changed)} {verb}, {len(report.unchanged)} unchanged, "
+            f"{len(report.failed)} failed"
+        )
+        return 1 if report.failed else 0
+
+
+def _relative(path: Path, root: Path) -> Path:
+    try:
+        return path.relative_to(root)
+    except ValueError:
+        return path
@@ -27,9 +27,12 @@ class TestCommand(CLICommand):
             print("Attempting to connect...", end="", flush=True)
             response = self.cli.api.test_connection()
 
+            details = response.data if isinstance(response.data, dict) else {}
+
             if not response.success:
                 print(" FAILED")
                 print(f"Error: {response.error_message}")
+                self._print_circuit(details)
                 return 1
 
             print(" SUCCESS")
@@ -39,7 +42,6 @@ class TestCommand(CLICommand):
             # the wrapper it returns — reading the wrapper printed 0.000s / N/A
             # every time, which made the one command whose job is diagnosing
             # latency useless.
-            details = response.data if isinstance(response.data, dict) else {}
             response_time = details.get("response_time") or 0.0
             cache_stats = details.get("cache_stats") or {}
 
@@ -48,6 +50,7 @@ class TestCommand(CLICommand):
             print(f"  Endpoint: {details.get('api_url', 'unknown')}")
             print(f"  From cache: {'Yes' if response.from_cache else 'No'}")
             print(f"  Cached entries: {cache_stats.get('disk_entries', 0)}")
+            self._print_circuit(details)
 
             print()
             print("✓ API is working correctly")
@@ -63,3 +66,16 @@ class TestCommand(CLICommand):
 
                 traceback.print_exc()
             return 1
+
+    def _print_circuit(self, details: dict) -> None:
+        circuit = details.get("circuit")
+        if not isinstance(circuit, dict):
+            return
+        line = f"  Circuit breaker: {circuit.get('state', 'unknown')}"
+        failures = circuit.get("consecutive_failures") or 0
+        if failures:
+            line += f" ({failures} consecutive failures"
+            if circuit.get("retry_in"):
+                line += f", next attempt in {circuit['retry_in']:.0f}s"
+            line += ")"
+        print(line)
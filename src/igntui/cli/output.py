@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Machine-readable output for `list` and `generate`.
+
+`--format plain|json|ndjson` and `--null` give scripts something stabler than
+the column layout to parse. Everything a command prints in one of those formats
+goes through `write()`, which joins it, encodes it to UTF-8 and hands it to
+`sys.stdout.buffer` in a single write, not a `print` per line through the text
+layer. The output is built in memory first; nothing here streams.
+"""
+
+import json
+import os
+import sys
+from collections.abc import Iterable
+from typing import TextIO
+
+
+def output_format(args) -> str | None:
+    """The format asked for: None for the human layout. `--null` implies plain."""
+    fmt = getattr(args, "format", None)
+    if fmt is None and getattr(args, "null", False):
+        return "plain"
+    return fmt
+
+
+def format_error(args) -> str | None:
+    """Why the output flags can't be used together, or None."""
+    if getattr(args, "null", False) and getattr(args, "format", None) == "json":
+        return "--null cannot be combined with --format json"
+    return None
+
+
+def records(items: Iterable, fmt: str, null: bool = False) -> Iterable[str]:
+    """`items` as `fmt`: a JSON array, or one record per line (or per NUL)."""
+    if fmt == "json":
+        yield json.dumps(list(items), ensure_ascii=False, indent=2) + "\n"
+        return
+    end = "\0" if null else "\n"
+    for item in items:
+        yield (item if fmt == "plain" else json.dumps(item, ensure_ascii=False)) + end
+
+
+def write(chunks: Iterable[str], stream: TextIO | None = None) -> None:
+    """Write `chunks` to `stream` (stdout) as UTF-8, in one write to its byte buffer.
+
+    A reader that exits early (`igntui list --format plain | head`) is not an
+    error: the rest of the output is dropped quietly.
+    """
+    stream = stream or sys.stdout
+    stream.flush()
+    out = getattr(stream, "buffer", None)
+    text = "".join(chunks)
+    try:
+        if out is None:
+            stream.write(text)
+            stream.flush()
+            return
+        out.write(text.encode("utf-8"))
+        out.flush()
+    except BrokenPipeError:
+        # Point stdout at /dev/null so the interpreter's flush at exit doesn't
+        # raise the same error again.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, stream.fileno())
+        os.close(devnull)
@@ -6,6 +6,20 @@ from pathlib import Path
 
 from .. import __description__, __version__, get_version_string
 
+# Subcommand -> its `CLICommand` class in `cli.commands`.
+COMMANDS = {
+    "list": "ListCommand",
+    "generate": "GenerateCommand",
+    "tui": "TUICommand",
+    "cache": "CacheCommand",
+    "sync": "SyncCommand",
+    "check": "CheckCommand",
+    "mirror": "MirrorCommand",
+    "serve": "ServeCommand",
+    "test": "TestCommand",
+    "completion": "CompletionCommand",
+}
+
 
 def create_base_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -40,6 +54,21 @@ For more information, visit: https://github.com/toptal/gitignore.io
 
     parser.add_argument("--no-cache", action="store_true", help="Disable caching for this session")
 
+    parser.add_argument(
+        "--network",
+        choices=["online", "prefer-cache", "offline"],
+        help="When to use the network: online (default), prefer-cache (any cached copy, "
+        "else one attempt), offline (cache only)",
+    )
+
+    parser.add_argument(
+        "--offline",
+        dest="network",
+        action="store_const",
+        const="offline",
+        help="Same as --network offline",
+    )
+
     return parser
 
 
@@ -69,6 +98,14 @@ def create_command_parser(
         "--filter", "-f", metavar="PATTERN", help="Filter templates by pattern"
     )
     list_parser.add_argument("--count", "-c", action="store_true", help="Show count only")
+    list_parser.add_argument(
+        "--format",
+        choices=("plain", "json", "ndjson"),
+        help="Print names for scripts: one per line, a JSON array, or JSON lines",
+    )
+    list_parser.add_argument(
+        "--null", "-0", action="store_true", help="End each name with NUL (implies plain)"
+    )
 
     generate_parser = subparsers.add_parser(
         "generate",
@@ -76,7 +113,7 @@ def create_command_parser(
         description="Generate .gitignore content for specified templates",
     )
     generate_parser.add_argument(
-        "templates", nargs="+", help="Template names to generate (space-separated)"
+        "templates", nargs="*", help="Template names to generate (space-separated)"
     )
     generate_parser.add_argument(
         "--output",
@@ -107,6 +144,28 @@ def create_command_parser(
         action="store_true",
         help="Do not write igntui.cfg.toml alongside the output file",
     )
+    generate_parser.add_argument(
+        "--format",
+        choices=("plain", "json", "ndjson"),
+        help="Print to stdout for scripts: raw content, or a JSON object",
+    )
+    generate_parser.add_argument(
+        "--null", "-0", action="store_true", help="End the output with NUL (implies plain)"
+    )
+    generate_parser.add_argument(
+        "--manifest",
+        "-m",
+        type=Path,
+        metavar="FILE",
+        help="Write every output listed in a TOML manifest, in one run",
+    )
+    generate_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        metavar="N",
+        help="Concurrent fetches and writes with --manifest (default: 8)",
+    )
 
     cache_parser = subparsers.add_parser(
         "cache", help="Manage cache", description="Manage template and API cache"
@@ -124,6 +183,125 @@ def create_command_parser(
     )
     cache_subparsers.add_parser("stats", help="Show cache statistics")
     cache_subparsers.add_parser("info", help="Show cache information")
+    cache_export_parser = cache_subparsers.add_parser(
+        "export", help="Pack the cache into a portable bundle"
+    )
+    cache_export_parser.add_argument("file", type=Path, help="Bundle file to write (.tar.gz)")
+    cache_import_parser = cache_subparsers.add_parser(
+        "import", help="Load a bundle written by 'cache export'"
+    )
+    cache_import_parser.add_argument("file", type=Path, help="Bundle file to read")
+    cache_invalidate_parser = cache_subparsers.add_parser(
+        "invalidate", help="Drop every cached combination that includes the given templates"
+    )
+    cache_invalidate_parser.add_argument("templates", nargs="+", help="Template names")
+    cache_warm_parser = cache_subparsers.add_parser(
+        "warm", help="Prefetch the template list and a set of templates into the cache"
+    )
+    cache_warm_parser.add_argument(
+        "templates", nargs="*", help="A selection to warm (each template and the combination)"
+    )
+    cache_warm_parser.add_argument(
+        "--all", action="store_true", help="Warm every template in the catalogue"
+    )
+    cache_warm_parser.add_argument(
+        "--from-usage", action="store_true", help="Warm your most-used templates"
+    )
+    cache_warm_parser.add_argument(
+        "--from-repo", action="store_true", help="Warm the [selection] of the repo config"
+    )
+    cache_warm_parser.add_argument(
+        "--from-file",
+        type=Path,
+        metavar="FILE",
+        help="Warm the selections listed in FILE, one per line ('-' for stdin)",
+    )
+    cache_warm_parser.add_argument(
+        "--jobs", "-j", type=int, metavar="N", help="Concurrent fetches (default: 8)"
+    )
+    cache_warm_parser.add_argument(
+        "--refresh", action="store_true", help="Re-fetch entries that are already cached"
+    )
+
+    sync_parser = subparsers.add_parser(
+        "sync",
+        help="Regenerate every sidecar-managed .gitignore under a directory",
+        description="Find every .igntui.cfg.toml under ROOT and regenerate the file each "
+        "one describes, fetching each distinct selection once",
+    )
+    sync_parser.add_argument(
+        "root",
+        nargs="?",
+        type=Path,
+        default=Path("."),
+        help="Directory to search for .igntui.cfg.toml sidecars (default: .)",
+    )
+    sync_parser.add_argument(
+        "--jobs", "-j", type=int, metavar="N", help="Concurrent fetches and writes (default: 8)"
+    )
+    sync_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report which files would change without writing any",
+    )
+
+    check_parser = subparsers.add_parser(
+        "check",
+        help="Report .gitignore files that no longer match their sidecar selection",
+        description="Compare each sidecar-managed file's managed block against what its "
+        "selection generates, without writing anything",
+    )
+    check_parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        default=[Path(".")],
+        help="Directories to search, or sidecar / generated files to check (default: .)",
+    )
+
+    mirror_parser = subparsers.add_parser(
+        "mirror",
+        help="Serve the local cache as a gitignore.io-compatible HTTP API",
+        description="Serve /list and /<templates> from the local cache, for other igntui "
+        "clients to use through IGNTUI_API_URL",
+    )
+    mirror_subparsers = mirror_parser.add_subparsers(
+        dest="mirror_action", title="mirror actions", help="Mirror action to perform"
+    )
+    mirror_serve_parser = mirror_subparsers.add_parser(
+        "serve", help="Serve the cache over HTTP until interrupted"
+    )
+    mirror_serve_parser.add_argument(
+        "--host", default="127.0.0.1", help="Address to listen on (default: 127.0.0.1)"
+    )
+    mirror_serve_parser.add_argument(
+        "--port", "-p", type=int, default=8080, help="Port to listen on (default: 8080)"
+    )
+    mirror_serve_parser.add_argument(
+        "--bundle", type=Path, metavar="FILE", help="Import a cache bundle before serving"
+    )
+    mirror_serve_parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        metavar="DIR",
+        help="Serve this cache directory instead of the configured one",
+    )
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run a daemon that answers list, generate and check from memory",
+        description="Keep the catalogue and recently used content in memory and answer "
+        "other igntui invocations over a local socket. Runs in the foreground until "
+        "interrupted.",
+    )
+    serve_parser.add_argument(
+        "--socket",
+        nargs="?",
+        type=Path,
+        const=None,
+        metavar="PATH",
+        help="Listen on PATH (default: api.daemon_socket, else daemon.sock in the cache dir)",
+    )
 
     test_parser = subparsers.add_parser(
         "test",
@@ -149,26 +327,11 @@ def create_command_parser(
 
 
 def get_command_instance(command_name: str, cli_instance):
-    from .commands import (
-        CacheCommand,
-        GenerateCommand,
-        ListCommand,
-        TestCommand,
-        TUICommand,
-    )
-    from .commands.completion_cmd import CompletionCommand
-
-    commands = {
-        "list": ListCommand,
-        "generate": GenerateCommand,
-        "tui": TUICommand,
-        "cache": CacheCommand,
-        "test": TestCommand,
-        "completion": CompletionCommand,
-    }
-
-    command_class = commands.get(command_name)
-    if command_class:
-        return command_class(cli_instance)
-
-    return None
+    import importlib
+
+    commands = importlib.import_module(".commands", __package__)
+    class_name = COMMANDS.get(command_name)
+    if class_name is None:
+        return None
+    # Only the module for this command is imported.
+    return getattr(commands, class_name)(cli_instance)
@@ -2,12 +2,13 @@
 
 
 import logging
-from logging.handlers import RotatingFileHandler
-
-from ..core.config import config
 
 
 def setup_logging(verbose: bool = False, log_level: str | None = None) -> None:
+    from logging.handlers import RotatingFileHandler
+
+    from ..core.config import config
+
     if log_level:
         level = getattr(logging, log_level.upper(), logging.INFO)
     elif verbose:
@@ -1,7 +1,28 @@
 #!/usr/bin/env python3
+"""Core services. Exports load on first access; see `igntui/__init__.py`."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import APIResponse, GitIgnoreAPI
+    from .config import Config, config
+
+_LAZY_EXPORTS = {
+    "config": ".config",
+    "Config": ".config",
+    "GitIgnoreAPI": ".api",
+    "APIResponse": ".api",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
-from .api import APIResponse, GitIgnoreAPI
-from .config import Config, config
 
 __all__ = ["config", "Config", "GitIgnoreAPI", "APIResponse"]
@@ -1,17 +1,55 @@
 #!/usr/bin/env python3
+"""The gitignore.io client.
 
+`GitIgnoreAPI` and `AsyncGitIgnoreAPI` pull in the cache and the HTTP stack
+(and asyncio), so they load on first access; the exceptions and `APIResponse`
+are light and load eagerly.
+"""
 
-from .client import GitIgnoreAPI
-from .errors import APIError, NetworkError, RateLimitError, ServiceUnavailableError
+from typing import TYPE_CHECKING, Any
+
+from .errors import (
+    APIError,
+    CircuitOpenError,
+    DeadlineExceededError,
+    NetworkError,
+    RateLimitError,
+    RequestCancelledError,
+    ServiceUnavailableError,
+)
 from .response import APIResponse
-from .types import TemplateName
+from .types import TemplateName, TemplateSource
+
+if TYPE_CHECKING:
+    from .async_client import AsyncGitIgnoreAPI
+    from .client import GitIgnoreAPI
+
+
+def __getattr__(name: str) -> Any:
+    if name == "GitIgnoreAPI":
+        from .client import GitIgnoreAPI
+
+        globals()[name] = GitIgnoreAPI
+        return GitIgnoreAPI
+    if name == "AsyncGitIgnoreAPI":
+        from .async_client import AsyncGitIgnoreAPI
+
+        globals()[name] = AsyncGitIgnoreAPI
+        return AsyncGitIgnoreAPI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "GitIgnoreAPI",
+    "AsyncGitIgnoreAPI",
     "APIResponse",
     "APIError",
     "NetworkError",
     "RateLimitError",
     "ServiceUnavailableError",
+    "CircuitOpenError",
+    "DeadlineExceededError",
+    "RequestCancelledError",
     "TemplateName",
+    "TemplateSource",
 ]
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""asyncio-native counterpart to `GitIgnoreAPI`.
+
+For services that embed igntui and generate many ignore files at once: each
+call is a coroutine, requests share a small pool of keep-alive connections,
+and `gather_templates` runs a batch concurrently without a thread per request.
+
+Everything but the transport is the threaded client's. The cache, network
+policy, circuit breaker, rate limiter (its shared bucket included), retry
+deadline and error responses all come from a wrapped `GitIgnoreAPI`, so the
+two clients answer identically and can share one cache directory. Those steps
+read and write files, some under an flock, so they run on worker threads with
+`asyncio.to_thread` rather than on the event loop.
+
+    async with AsyncGitIgnoreAPI() as api:
+        responses = await api.gather_templates([["python"], ["node", "macos"]])
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterable, Sequence
+
+from ..cache import CacheManager
+from .async_http import DEFAULT_MAX_CONNECTIONS, ConnectionPool
+from .client import GitIgnoreAPI
+from .errors import (
+    APIError,
+    DeadlineExceededError,
+    NetworkError,
+    RateLimitError,
+    ServiceUnavailableError,
+)
+from .response import APIResponse
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncGitIgnoreAPI:
+    def __init__(
+        self,
+        cache_manager: CacheManager | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        api: GitIgnoreAPI | None = None,
+    ):
+        # The synchronous client owns configuration and every non-network
+        # step; its methods (`get_stats`, `clear_cache`, ...) stay usable here.
+        self.api = api or GitIgnoreAPI(cache_manager=cache_manager)
+        self.pool = ConnectionPool(self.api.user_agent, max_connections=max_connections)
+
+    async def __aenter__(self) -> "AsyncGitIgnoreAPI":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.pool.close()
+
+    async def list_templates(self, force_refresh: bool = False) -> APIResponse:
+        answer = await asyncio.to_thread(self.api._template_list_from_cache, force_refresh)
+        if answer is not None:
+            return answer
+
+        try:
+            response = await self._fetch(f"{self.api.base_url}/list")
+            return await asyncio.to_thread(self.api._store_template_list, response)
+
+        except Exception as e:
+            logger.error("Failed to fetch template list: %s", e)
+            return await asyncio.to_thread(self.api._template_list_error, force_refresh, e)
+
+    async def get_templates(
+        self, technologies: list[str], force_refresh: bool = False
+    ) -> APIResponse:
+        clean_techs, answer = await asyncio.to_thread(
+            self.api._content_from_cache, technologies, force_refresh
+        )
+        if answer is not None:
+            return answer
+
+        try:
+            response = await self._fetch(self.api._content_url(clean_techs))
+            return await asyncio.to_thread(self.api._store_content, clean_techs, response)
+
+        except Exception as e:
+            logger.error("Failed to fetch template content: %s", e)
+            return await asyncio.to_thread(self.api._content_error, clean_techs, e, force_refresh)
+
+    async def gather_templates(
+        self, selections: Iterable[Sequence[str]], force_refresh: bool = False
+    ) -> list[APIResponse]:
+        """`get_templates` for every selection concurrently, results in order.
+
+        Concurrency is bounded by the connection pool, not by the batch size.
+        """
+        return await asyncio.gather(
+            *(self.get_templates(list(s), force_refresh=force_refresh) for s in selections)
+        )
+
+    async def _fetch(self, url: str) -> APIResponse:
+        handler = self.api.request_handler
+        if self.api.network_policy == "online":
+            return await self._request_with_retry(url)
+        return await self._request(url, min(handler.timeout, handler.deadline))
+
+    async def _request(
+        self, url: str, timeout: float, give_up_at: float | None = None
+    ) -> APIResponse:
+        handler = self.api.request_handler
+        # The breaker keeps its state in a file; so does a shared rate limit.
+        await asyncio.to_thread(handler.circuit_breaker.before_request)
+        await handler.rate_limiter.wait_async(give_up_at)
+        if give_up_at is not None:
+            timeout = min(timeout, give_up_at - time.monotonic())
+        try:
+            result = await self.pool.get(url, timeout)
+        except APIError as e:
+            handler.stats["errors"] += 1
+            await asyncio.to_thread(handler.record_outcome, e)
+            raise
+        await asyncio.to_thread(handler.record_outcome, None)
+        handler.stats["requests_made"] += 1
+        handler.stats["total_response_time"] += result.response_time
+        logger.debug("API request to %s took %.3fs", url, result.response_time)
+        return APIResponse(
+            success=True,
+            data=result.body,
+            status_code=result.status,
+            response_time=result.response_time,
+        )
+
+    async def _request_with_retry(self, url: str) -> APIResponse:
+        # The same budget and backoff as `make_request_with_retry`. There is
+        # no cancel event: cancelling the task interrupts any wait.
+        handler = self.api.request_handler
+        give_up_at = time.monotonic() + handler.deadline
+        last_exception: APIError | None = None
+
+        for attempt in range(handler.retry_attempts):
+            remaining = give_up_at - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                return await self._request(url, min(handler.timeout, remaining), give_up_at)
+
+            except DeadlineExceededError:
+                raise
+
+            except (NetworkError, ServiceUnavailableError, RateLimitError) as e:
+                last_exception = e
+                if attempt == handler.retry_attempts - 1:
+                    raise
+                wait_time = handler.retry_wait(e, attempt, give_up_at)
+                if wait_time is None:
+                    break
+                await asyncio.sleep(wait_time)
+
+        raise handler.deadline_exceeded(url, handler.deadline, last_exception) from last_exception
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""Minimal HTTP/1.1 GET client on asyncio streams, with a connection pool.
+
+`AsyncGitIgnoreAPI` needs exactly one kind of request — a GET returning a
+text body — and nothing outside the standard library. urllib blocks, so this
+speaks just enough HTTP/1.1 itself: keep-alive connections (reused from a
+per-host pool), `Content-Length`, chunked and read-to-close bodies, and
+redirects. Status codes become the same exceptions `RequestHandler` raises.
+
+Proxies come from the environment exactly as urllib reads them for the
+threaded client (`HTTP_PROXY`, `HTTPS_PROXY`, `NO_PROXY`). Plain HTTP goes to
+the proxy as an absolute-form request; HTTPS is tunnelled with `CONNECT` and
+TLS is started inside the tunnel. Only `http://` proxies are supported.
+"""
+
+import asyncio
+import base64
+import logging
+import ssl
+import time
+import urllib.parse
+import urllib.request
+from dataclasses import dataclass
+
+from .errors import APIError, NetworkError, RateLimitError, ServiceUnavailableError
+from .request_handler import retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 4
+_MAX_REDIRECTS = 5
+_MAX_HEADER_LINES = 100
+
+_Origin = tuple[str, str, int]
+
+
+@dataclass
+class HTTPResult:
+    status: int
+    body: str
+    response_time: float
+
+
+@dataclass
+class _Proxy:
+    host: str
+    port: int
+    authorization: str | None = None
+
+
+class _Connection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        # A connection straight from the pool may have been closed by the
+        # server while idle; the first request on it is allowed one replay.
+        self.reused = False
+        # Set for plain HTTP through a proxy, which wants absolute-form
+        # request targets (and may want credentials on every request).
+        self.proxy: _Proxy | None = None
+
+    def usable(self) -> bool:
+        return not self.writer.is_closing() and not self.reader.at_eof()
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class _StaleConnection(Exception):
+    """A pooled connection turned out to be closed before any response."""
+
+
+class ConnectionPool:
+    """Keep-alive connections per origin, at most `max_connections` in use.
+
+    `proxies` maps a scheme to a proxy URL, with `"no"` for the bypass list,
+    as `urllib.request.getproxies()` returns it; by default it is read from
+    the environment.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        proxies: dict[str, str] | None = None,
+    ):
+        self.user_agent = user_agent
+        self.max_connections = max(1, max_connections)
+        self.proxies = urllib.request.getproxies() if proxies is None else proxies
+        self._slots = asyncio.Semaphore(self.max_connections)
+        self._idle: dict[_Origin, list[_Connection]] = {}
+        self._ssl: ssl.SSLContext | None = None
+        self.stats = {"connections_opened": 0, "connections_reused": 0}
+
+    async def get(self, url: str, timeout: float) -> HTTPResult:
+        """GET `url`, following redirects, within `timeout` seconds overall."""
+        start_time = time.time()
+        try:
+            async with asyncio.timeout(timeout):
+                for _ in range(_MAX_REDIRECTS + 1):
+                    status, reason, headers, body = await self._exchange(url)
+                    location = headers.get("location")
+                    if status in (301, 302, 303, 307, 308) and location:
+                        url = urllib.parse.urljoin(url, location)
+                        logger.debug("Following HTTP %d redirect to %s", status, url)
+                        continue
+                    break
+                else:
+                    raise APIError(f"Too many redirects fetching {url}")
+        except TimeoutError as e:
+            raise NetworkError(f"Request timeout after {timeout}s") from e
+        except (OSError, asyncio.IncompleteReadError, _StaleConnection) as e:
+            raise NetworkError(f"Network error: {e}") from e
+        except ValueError as e:
+            raise APIError(f"Malformed response: {e}") from e
+
+        error_msg = f"HTTP {status}: {reason}"
+        if status == 429:
+            retry_after = retry_after_seconds(headers.get("retry-after"))
+            raise RateLimitError(error_msg, status, retry_after)
+        if status >= 500:
+            raise ServiceUnavailableError(error_msg, status)
+        if status >= 400:
+            raise APIError(error_msg, status, body=body.decode("utf-8", errors="replace"))
+        return HTTPResult(
+            status=status,
+            body=body.decode("utf-8", errors="replace"),
+            response_time=time.time() - start_time,
+        )
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+        for connections in idle.values():
+            for conn in connections:
+                try:
+                    await conn.writer.wait_closed()
+                except OSError:
+                    pass
+
+    async def _exchange(self, url: str) -> tuple[int, str, dict[str, str], bytes]:
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise APIError(f"Unsupported URL: {url}")
+        origin = (parts.scheme, parts.hostname, parts.port or _default_port(parts.scheme))
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        host = parts.netloc.rsplit("@", 1)[-1]
+
+        async with self._slots:
+            conn = await self._checkout(origin)
+            try:
+                try:
+                    result = await self._send(conn, host, target)
+                except _StaleConnection:
+                    conn.close()
+                    conn = await self._connect(origin)
+                    result = await self._send(conn, host, target)
+            except BaseException:
+                # Includes cancellation: a half-read response poisons the
+                # connection for the next user.
+                conn.close()
+                raise
+            status, reason, headers, body, keep_alive = result
+            if keep_alive:
+                self._idle.setdefault(origin, []).append(conn)
+            else:
+                conn.close()
+            return status, reason, headers, body
+
+    async def _checkout(self, origin: _Origin) -> _Connection:
+        idle = self._idle.get(origin, [])
+        while idle:
+            conn = idle.pop()
+            if conn.usable():
+                conn.reused = True
+                self.stats["connections_reused"] += 1
+                return conn
+            conn.close()
+        return await self._connect(origin)
+
+    async def _connect(self, origin: _Origin) -> _Connection:
+        scheme, hostname, port = origin
+        ssl_context = None
+        if scheme == "https":
+            if self._ssl is None:
+                self._ssl = ssl.create_default_context()
+            ssl_context = self._ssl
+        proxy = self._proxy_for(scheme, hostname)
+        if proxy is None:
+            reader, writer = await asyncio.open_connection(hostname, port, ssl=ssl_context)
+            conn = _Connection(reader, writer)
+        else:
+            conn = _Connection(*await asyncio.open_connection(proxy.host, proxy.port))
+            try:
+                if ssl_context is None:
+                    conn.proxy = proxy
+                else:
+                    await _tunnel(conn, hostname, port, proxy)
+                    await conn.writer.start_tls(ssl_context, server_hostname=hostname)
+            except BaseException:
+                conn.close()
+                raise
+        self.stats["connections_opened"] += 1
+        return conn
+
+    def _proxy_for(self, scheme: str, hostname: str) -> _Proxy | None:
+        url = self.proxies.get(scheme)
+        if not url or _bypassed(hostname, self.proxies.get("no", "")):
+            return None
+        parts = urllib.parse.urlsplit(url if "://" in url else f"http://{url}")
+        if parts.scheme != "http" or not parts.hostname:
+            raise APIError(f"Unsupported proxy {url!r}: only http:// proxies are supported")
+        authorization = None
+        if parts.username is not None:
+            credentials = urllib.parse.unquote(parts.username)
+            credentials += ":" + urllib.parse.unquote(parts.password or "")
+            authorization = "Basic " + base64.b64encode(credentials.encode()).decode("ascii")
+        return _Proxy(parts.hostname, parts.port or 80, authorization)
+
+    async def _send(
+        self, conn: _Connection, host: str, target: str
+    ) -> tuple[int, str, dict[str, str], bytes, bool]:
+        proxy_headers = ""
+        if conn.proxy is not None:
+            target = f"http://{host}{target}"
+            if conn.proxy.authorization:
+                proxy_headers = f"Proxy-Authorization: {conn.proxy.authorization}\r\n"
+        request = (
+            f"GET {target} HTTP/1.1\r\n"
+            f"Host: {host}\r\n"
+            f"User-Agent: {self.user_agent}\r\n"
+            "Accept: text/plain\r\n"
+            "Accept-Encoding: identity\r\n"
+            "Connection: keep-alive\r\n"
+            f"{proxy_headers}"
+            "\r\n"
+        )
+        reused, conn.reused = conn.reused, False
+        try:
+            conn.writer.write(request.encode("latin-1"))
+            await conn.writer.drain()
+            status_line = await conn.reader.readline()
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            if reused:
+                raise _StaleConnection(str(e)) from e
+            raise
+        if not status_line:
+            if reused:
+                raise _StaleConnection("connection closed by peer")
+            raise ConnectionError("connection closed before a response")
+
+        version, status, reason = _parse_status_line(status_line)
+        headers = await _read_headers(conn.reader)
+        body, to_close = await _read_body(conn.reader, headers, status)
+        connection = headers.get("connection", "").lower()
+        keep_alive = not to_close and (
+            connection == "keep-alive" or (version == "HTTP/1.1" and connection != "close")
+        )
+        return status, reason, headers, body, keep_alive
+
+
+def _bypassed(hostname: str, no_proxy: str) -> bool:
+    """Whether `no_proxy` (`*`, or comma-separated domain suffixes) covers `hostname`."""
+    if no_proxy.strip() == "*":
+        return True
+    hostname = hostname.lower()
+    for name in no_proxy.split(","):
+        name = name.strip().lstrip(".").lower()
+        if name and (hostname == name or hostname.endswith("." + name)):
+            return True
+    return False
+
+
+async def _tunnel(conn: _Connection, hostname: str, port: int, proxy: _Proxy) -> None:
+    """Ask the proxy behind `conn` for a raw tunnel to `hostname:port`."""
+    authority = f"[{hostname}]:{port}" if ":" in hostname else f"{hostname}:{port}"
+    request = f"CONNECT {authority} HTTP/1.1\r\nHost: {authority}\r\n"
+    if proxy.authorization:
+        request += f"Proxy-Authorization: {proxy.authorization}\r\n"
+    conn.writer.write((request + "\r\n").encode("latin-1"))
+    await conn.writer.drain()
+    status_line = await conn.reader.readline()
+    if not status_line:
+        raise ConnectionError("proxy closed the connection")
+    _, status, reason = _parse_status_line(status_line)
+    await _read_headers(conn.reader)
+    if not 200 <= status < 300:
+        raise ConnectionError(f"proxy refused a tunnel to {authority}: HTTP {status} {reason}")
+
+
+def _default_port(scheme: str) -> int:
+    return 443 if scheme == "https" else 80
+
+
+def _parse_status_line(line: bytes) -> tuple[str, int, str]:
+    parts = line.decode("latin-1").split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise ValueError(f"bad status line {line!r}")
+    reason = parts[2].strip() if len(parts) > 2 else ""
+    return parts[0], int(parts[1]), reason
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    for _ in range(_MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, sep, value = line.decode("latin-1").partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    raise ValueError("too many header lines")
+
+
+async def _read_body(
+    reader: asyncio.StreamReader, headers: dict[str, str], status: int
+) -> tuple[bytes, bool]:
+    """The body, and whether the connection must be closed after it."""
+    if status in (204, 304) or 100 <= status < 200:
+        return b"", False
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        return await _read_chunked(reader), False
+    if "content-length" in headers:
+        return await reader.readexactly(int(headers["content-length"])), False
+    # No framing: the body runs to the end of the connection.
+    return await reader.read(), True
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            # Skip any trailer fields up to the blank line.
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)
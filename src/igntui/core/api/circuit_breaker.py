@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Circuit breaker in front of the gitignore.io API.
+
+When the service is down every call used to run the full retry loop — three
+attempts and their backoff sleeps — and in the TUI every toggle started another
+one. The breaker counts consecutive failures; after `failure_threshold` of them
+it *opens* and requests fail at once with `CircuitOpenError` (callers fall back
+to a stale cache copy where they have one). Once `cooldown` seconds have passed
+it goes *half-open* and lets a single probe through: success closes it, failure
+opens it for another cooldown.
+
+State is kept in a small JSON file in the cache directory, so a second igntui
+process started while the service is down does not have to rediscover that
+the hard way. The file is short-lived by construction — an open state lapses
+to half-open after one cooldown, and a failure streak older than a cooldown is
+forgotten — so a stale file never blocks anyone for long.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .errors import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_FILENAME = "circuit-breaker.json"
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        state_file: Path | None = None,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+    ):
+        self.state_file = state_file
+        # 0 (or less) turns the breaker off: every request is allowed.
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._state: dict[str, Any] = _closed_state()
+        self._file_read = False
+
+    def before_request(self) -> None:
+        """Raise `CircuitOpenError` unless a request may go out now."""
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            state = self._load()
+            now = time.time()
+            if state["state"] == CLOSED:
+                return
+            if state["state"] == OPEN and now - state["opened_at"] >= self.cooldown:
+                state.update(state=HALF_OPEN, probe_at=now)
+                self._save(state)
+                logger.info("Circuit half-open; sending a probe request")
+                return
+            if state["state"] == HALF_OPEN and now - state["probe_at"] >= self.cooldown:
+                # The last probe never reported back (its process died); try again.
+                state["probe_at"] = now
+                self._save(state)
+                return
+            raise CircuitOpenError(
+                "gitignore.io is unavailable after repeated failures; "
+                f"retrying in {self._retry_in(state, now):.0f}s",
+                retry_after=int(self._retry_in(state, now)) or None,
+            )
+
+    def record_success(self) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            state = self._load()
+            if state["state"] != CLOSED:
+                logger.info("Circuit closed; gitignore.io is reachable again")
+            if state != _closed_state():
+                self._save(_closed_state())
+
+    def record_failure(self) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            state = self._load()
+            now = time.time()
+            state["failures"] += 1
+            state["last_failure"] = now
+            if state["state"] == HALF_OPEN or state["failures"] >= self.failure_threshold:
+                if state["state"] != OPEN:
+                    logger.warning(
+                        "Circuit open after %d consecutive failures; pausing requests for %.0fs",
+                        state["failures"],
+                        self.cooldown,
+                    )
+                state.update(state=OPEN, opened_at=now)
+            self._save(state)
+
+    def is_open(self) -> bool:
+        """True while requests would be refused — no side effects.
+
+        Asked before every cache read, so after the first call it answers from
+        memory: this process's own outcomes are there already, and another
+        process's open circuit is picked up by the next `before_request`.
+        """
+        if self.failure_threshold <= 0:
+            return False
+        with self._lock:
+            state = self._load(reread=not self._file_read)
+            now = time.time()
+            if state["state"] == OPEN:
+                return now - state["opened_at"] < self.cooldown
+            if state["state"] == HALF_OPEN:
+                return now - state["probe_at"] < self.cooldown
+            return False
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            state = self._load()
+            return {
+                "state": state["state"],
+                "consecutive_failures": state["failures"],
+                "retry_in": round(self._retry_in(state, time.time()), 1),
+            }
+
+    def _retry_in(self, state: dict[str, Any], now: float) -> float:
+        if state["state"] == OPEN:
+            return max(0.0, state["opened_at"] + self.cooldown - now)
+        if state["state"] == HALF_OPEN:
+            return max(0.0, state["probe_at"] + self.cooldown - now)
+        return 0.0
+
+    def _load(self, reread: bool = True) -> dict[str, Any]:
+        if self.state_file is not None and reread:
+            self._file_read = True
+            try:
+                with open(self.state_file, encoding="utf-8") as f:
+                    loaded = json.load(f)
+                state = {**_closed_state(), **loaded}
+            except FileNotFoundError:
+                state = _closed_state()
+            except (OSError, ValueError, TypeError) as e:
+                logger.debug("Ignoring unreadable circuit state %s: %s", self.state_file, e)
+                state = _closed_state()
+            self._state = state
+        state = self._state
+        # A streak whose last failure is a cooldown old is over.
+        if (
+            state["state"] == CLOSED
+            and state["failures"]
+            and time.time() - state["last_failure"] >= self.cooldown
+        ):
+            state = self._state = _closed_state()
+        return dict(state)
+
+    def _save(self, state: dict[str, Any]) -> None:
+        self._state = dict(state)
+        if self.state_file is None:
+            return
+        if state == _closed_state():
+            try:
+                self.state_file.unlink(missing_ok=True)
+            except OSError as e:
+                logger.debug("Could not remove circuit state %s: %s", self.state_file, e)
+            return
+        tmp_path: str | None = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.state_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_file)
+            tmp_path = None
+        except OSError as e:
+            logger.debug("Could not save circuit state %s: %s", self.state_file, e)
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+
+def _closed_state() -> dict[str, Any]:
+    return {"state": CLOSED, "failures": 0, "last_failure": 0.0, "opened_at": 0.0, "probe_at": 0.0}
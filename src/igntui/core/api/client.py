@@ -1,16 +1,26 @@
 #!/usr/bin/env python3
 
 
+import difflib
 import logging
+import re
+import threading
 from typing import Any
 
 from ..cache import CacheManager, TemplateCache
 from ..config import config
+from .circuit_breaker import CIRCUIT_FILENAME, CircuitBreaker
+from .errors import APIError
+from .policy import configured_policy
+from .rate_limiter import RATE_LIMIT_FILENAME, RateLimiter
 from .request_handler import RequestHandler
 from .response import APIResponse
 
 logger = logging.getLogger(__name__)
 
+# How gitignore.io names each template it does not know in a 404 body.
+_UNDEFINED_RE = re.compile(r"^#!! ERROR: (\S+) is undefined", re.MULTILINE)
+
 
 class GitIgnoreAPI:
     def __init__(self, cache_manager: CacheManager | None = None):
@@ -19,98 +29,238 @@ class GitIgnoreAPI:
         self.user_agent = config.get("api", "user_agent")
         self.retry_attempts = config.get("api", "retry_attempts")
         self.cache_ttl = config.get("api", "cache_ttl")
+        self.cache_manager = cache_manager or CacheManager(
+            cache_dir=config.get_cache_dir(),
+            default_ttl=self.cache_ttl,
+            persist_stats=bool(config.get("api", "shared_cache_stats", default=True)),
+        )
+        # Kept beside the cache so every igntui process sharing it shares the
+        # breaker too.
+        self.circuit_breaker = CircuitBreaker(
+            state_file=self.cache_manager.cache_dir / CIRCUIT_FILENAME,
+            failure_threshold=int(config.get("api", "circuit_failure_threshold", default=5)),
+            cooldown=float(config.get("api", "circuit_cooldown", default=30)),
+        )
+        # Shared the same way by default, so parallel CI jobs spend one request
+        # budget against the public API rather than one each.
+        shared_rate_limit = bool(config.get("api", "shared_rate_limit", default=True))
+        self.rate_limiter = RateLimiter(
+            rate=float(config.get("api", "rate_limit", default=10)),
+            burst=int(config.get("api", "rate_limit_burst", default=5)),
+            state_file=(
+                self.cache_manager.cache_dir / RATE_LIMIT_FILENAME if shared_rate_limit else None
+            ),
+        )
         self.request_handler = RequestHandler(
             user_agent=self.user_agent,
             timeout=self.timeout,
             retry_attempts=self.retry_attempts,
-        )
-        self.cache_manager = cache_manager or CacheManager(
-            cache_dir=config.get_cache_dir(), default_ttl=self.cache_ttl
+            circuit_breaker=self.circuit_breaker,
+            deadline=float(config.get("api", "request_deadline", default=30)),
+            backoff_max=float(config.get("api", "retry_backoff_max", default=8)),
+            retry_after_max=float(config.get("api", "retry_after_max", default=10)),
+            rate_limiter=self.rate_limiter,
         )
         self.template_cache = TemplateCache(self.cache_manager)
+        self.negative_cache_ttl = int(config.get("api", "negative_cache_ttl", default=600))
         self.stats = {"cache_hits": 0, "cache_misses": 0}
         # Session-wide override; set by `--no-cache`. Per-call force_refresh still wins.
         self.force_refresh_default = False
+        self.network_policy = configured_policy()
+
+    def list_templates(
+        self, force_refresh: bool = False, cancel: threading.Event | None = None
+    ) -> APIResponse:
+        answer = self._template_list_from_cache(force_refresh)
+        if answer is not None:
+            return answer
+
+        try:
+            response = self._fetch(f"{self.base_url}/list", cancel)
+            return self._store_template_list(response)
+
+        except Exception as e:
+            logger.error("Failed to fetch template list: %s", e)
+            return self._template_list_error(force_refresh, e)
+
+    def get_templates(
+        self,
+        technologies: list[str],
+        force_refresh: bool = False,
+        cancel: threading.Event | None = None,
+    ) -> APIResponse:
+        clean_techs, answer = self._content_from_cache(technologies, force_refresh)
+        if answer is not None:
+            return answer
+
+        try:
+            response = self._fetch(self._content_url(clean_techs), cancel)
+            return self._store_content(clean_techs, response)
+
+        except Exception as e:
+            logger.error("Failed to fetch template content: %s", e)
+            return self._content_error(clean_techs, e, force_refresh)
+
+    # The steps around the fetch are shared with AsyncGitIgnoreAPI, which only
+    # swaps the transport: a cached (or offline) answer, or None to fetch; and
+    # storing what a fetch returned.
 
-    def list_templates(self, force_refresh: bool = False) -> APIResponse:
-        force_refresh = force_refresh or self.force_refresh_default
+    def _template_list_from_cache(self, force_refresh: bool) -> APIResponse | None:
+        force_refresh = self._wants_refresh(force_refresh)
         if not force_refresh:
-            cached_templates = self.template_cache.get_template_list()
+            # An expired copy is not evicted here: it is the fallback if the
+            # fetch fails, and a successful fetch overwrites it anyway.
+            cached_templates = self.template_cache.get_template_list(
+                allow_stale=self._stale_is_acceptable(), evict=False
+            )
             if cached_templates is not None:
                 logger.debug("Using cached template list")
                 self.stats["cache_hits"] += 1
                 return APIResponse(success=True, data=cached_templates, from_cache=True)
 
         self.stats["cache_misses"] += 1
-        url = f"{self.base_url}/list"
-
-        try:
-            response = self.request_handler.make_request_with_retry(url)
-
-            if response.success:
-                templates = self._parse_template_list(response.data)
-                self.template_cache.set_template_list(templates)
-                logger.info("Fetched %d templates from API", len(templates))
-                return response.with_data(templates)
+        if self.network_policy == "offline":
+            return APIResponse(
+                success=False, data=[], error_message=_offline_miss("The template list")
+            )
+        return None
 
+    def _store_template_list(self, response: APIResponse) -> APIResponse:
+        if not response.success:
             return response
-
-        except Exception as e:
-            logger.error("Failed to fetch template list: %s", e)
-            return APIResponse(success=False, data=[], error_message=str(e))
-
-    def get_templates(self, technologies: list[str], force_refresh: bool = False) -> APIResponse:
-        force_refresh = force_refresh or self.force_refresh_default
+        templates = self._parse_template_list(response.data)
+        self.template_cache.set_template_list(templates)
+        logger.info("Fetched %d templates from API", len(templates))
+        return response.with_data(templates)
+
+    def _content_from_cache(
+        self, technologies: list[str], force_refresh: bool
+    ) -> tuple[list[str], APIResponse | None]:
         if not technologies:
-            return APIResponse(
+            return [], APIResponse(
                 success=True,
                 data="# No templates selected\n# Select templates from the Available Templates panel",
             )
 
         clean_techs = self._clean_technology_names(technologies)
         if not clean_techs:
-            return APIResponse(success=False, data="", error_message="No valid templates provided")
+            return [], APIResponse(
+                success=False, data="", error_message="No valid templates provided"
+            )
 
+        force_refresh = self._wants_refresh(force_refresh)
         if not force_refresh:
-            cached_content = self.template_cache.get_template_content(clean_techs)
+            cached_content = self.template_cache.get_template_content(
+                clean_techs, allow_stale=self._stale_is_acceptable(), evict=False
+            )
             if cached_content is not None:
                 logger.debug("Using cached content for %d templates", len(clean_techs))
                 self.stats["cache_hits"] += 1
-                return APIResponse(success=True, data=cached_content, from_cache=True)
-
-        self.stats["cache_misses"] += 1
-        tech_string = ",".join(clean_techs).lower()
-        url = f"{self.base_url}/{tech_string}"
-
-        try:
-            response = self.request_handler.make_request_with_retry(url)
+                return clean_techs, APIResponse(success=True, data=cached_content, from_cache=True)
 
-            if response.success:
-                self.template_cache.set_template_content(clean_techs, response.data)
-                logger.info("Fetched content for templates: %s", ", ".join(clean_techs))
-
-            return response
-
-        except Exception as e:
-            logger.error("Failed to fetch template content: %s", e)
+            # Only now, about to go to the network: a typo answered from the
+            # catalogue costs nothing, a 404 costs a request (and its retries).
+            # A forced refresh skips this, since the catalogue may be what is
+            # out of date.
+            rejection = self._reject_unknown(clean_techs)
+            if rejection is not None:
+                return clean_techs, rejection
 
-            fallback_content = f"""# Error generating content: {e}
-# Selected templates: {", ".join(clean_techs)}
-#
-# This error typically means:
-# - Network connectivity issues
-# - Invalid template names
-# - API service temporarily unavailable
-#
-# Try refreshing the template list or check your internet connection."""
-
-            return APIResponse(success=False, data=fallback_content, error_message=str(e))
+        self.stats["cache_misses"] += 1
+        if self.network_policy == "offline":
+            return clean_techs, APIResponse(
+                success=False,
+                data="",
+                error_message=_offline_miss(f"Content for {', '.join(clean_techs)}"),
+            )
+        return clean_techs, None
+
+    def _reject_unknown(self, clean_techs: list[str]) -> APIResponse | None:
+        """A failed response naming every template known not to exist, or None.
+
+        A name is unknown if a cached catalogue lacks it, or if gitignore.io
+        answered 404 for it within `negative_cache_ttl`. Without a catalogue
+        only the negative cache can say no.
+        """
+        # A read-only check: an expired catalogue stays on disk as the fallback
+        # for a fetch that fails later.
+        catalogue = self.template_cache.get_template_list(
+            allow_stale=self._stale_is_acceptable(), record_stats=False, evict=False
+        )
+        known = {name.lower() for name in catalogue} if catalogue else None
+        unknown = [
+            tech
+            for tech in clean_techs
+            if (known is not None and tech.lower() not in known)
+            or self.template_cache.get_unknown(tech) is not None
+        ]
+        if not unknown:
+            return None
+        logger.debug("Rejected unknown templates without a request: %s", ", ".join(unknown))
+        return _unknown_templates(unknown, catalogue or [])
+
+    def _template_list_error(self, force_refresh: bool, error: Exception) -> APIResponse:
+        if not self._wants_refresh(force_refresh):
+            stale = self.template_cache.get_template_list(allow_stale=True, record_stats=False)
+            if stale is not None:
+                logger.warning("Serving an expired template list: %s", error)
+                return APIResponse(success=True, data=stale, from_cache=True)
+        return APIResponse(success=False, data=[], error_message=str(error))
+
+    def _content_error(
+        self, clean_techs: list[str], error: Exception, force_refresh: bool = False
+    ) -> APIResponse:
+        if not (isinstance(error, APIError) and error.status_code == 404):
+            # A failed fetch under the `online` policy falls back to the
+            # expired copy the read left in place, unless the caller asked
+            # for fresh content.
+            if not self._wants_refresh(force_refresh):
+                stale = self.template_cache.get_template_content(
+                    clean_techs, allow_stale=True, record_stats=False
+                )
+                if stale is not None:
+                    logger.warning(
+                        "Serving expired content for %s: %s", ", ".join(clean_techs), error
+                    )
+                    return APIResponse(success=True, data=stale, from_cache=True)
+            return _content_failure(clean_techs, error)
+        # The body names the culprits; with a single template it can only be
+        # that one. Several and no usable body: no telling which, cache nothing.
+        unknown = _UNDEFINED_RE.findall(error.body or "")
+        if not unknown and len(clean_techs) == 1:
+            unknown = clean_techs
+        if not unknown:
+            return _content_failure(clean_techs, error)
+        if self.negative_cache_ttl > 0:
+            for name in unknown:
+                self.template_cache.set_unknown(name, str(error), ttl=self.negative_cache_ttl)
+        catalogue = self.template_cache.get_template_list(allow_stale=True, record_stats=False)
+        return _unknown_templates(unknown, catalogue or [])
+
+    def _content_url(self, clean_techs: list[str]) -> str:
+        return f"{self.base_url}/{','.join(clean_techs).lower()}"
+
+    def _store_content(self, clean_techs: list[str], response: APIResponse) -> APIResponse:
+        if response.success:
+            self.template_cache.set_template_content(clean_techs, response.data)
+            logger.info("Fetched content for templates: %s", ", ".join(clean_techs))
+        return response
 
     def test_connection(self) -> APIResponse:
+        if self.network_policy == "offline":
+            return APIResponse(
+                success=False,
+                data={"status": "offline"},
+                error_message="Network policy is offline; no connection attempted",
+            )
         try:
             logger.info("Testing API connectivity...")
 
-            response = self.request_handler.make_request(f"{self.base_url}/list?limit=1")
+            # A diagnostic goes out whatever the breaker says; its outcome is
+            # recorded, so a passing test closes an open circuit.
+            response = self.request_handler.make_request(
+                f"{self.base_url}/list?limit=1", probe=True
+            )
 
             if response.success:
                 test_results = {
@@ -118,19 +268,24 @@ class GitIgnoreAPI:
                     "response_time": response.response_time,
                     "api_url": self.base_url,
                     "cache_stats": self.cache_manager.get_stats(),
+                    "circuit": self.circuit_breaker.snapshot(),
                 }
 
                 return APIResponse(success=True, data=test_results)
             else:
                 return APIResponse(
                     success=False,
-                    data={"status": "failed"},
+                    data={"status": "failed", "circuit": self.circuit_breaker.snapshot()},
                     error_message="API test request failed",
                 )
 
         except Exception as e:
             logger.error("API connection test failed: %s", e)
-            return APIResponse(success=False, data={"status": "error"}, error_message=str(e))
+            return APIResponse(
+                success=False,
+                data={"status": "error", "circuit": self.circuit_breaker.snapshot()},
+                error_message=str(e),
+            )
 
     def get_stats(self) -> dict[str, Any]:
         request_stats = self.request_handler.get_stats()
@@ -149,6 +304,9 @@ class GitIgnoreAPI:
                 "base_url": self.base_url,
                 "timeout": self.timeout,
                 "retry_attempts": self.retry_attempts,
+                "request_deadline": self.request_handler.deadline,
+                "network_policy": self.network_policy,
+                "circuit": request_stats["circuit"],
             },
             "cache_stats": cache_stats,
             "performance_stats": {
@@ -160,6 +318,27 @@ class GitIgnoreAPI:
             },
         }
 
+    def _wants_refresh(self, force_refresh: bool) -> bool:
+        # Offline has nothing to refresh from, and neither does an open
+        # circuit; the cache is the only answer.
+        if self.network_policy == "offline" or self.circuit_breaker.is_open():
+            return False
+        return force_refresh or self.force_refresh_default
+
+    def _stale_is_acceptable(self) -> bool:
+        # While the circuit is open a fetch would be refused anyway, so an
+        # expired copy beats an error even under the `online` policy.
+        return self.network_policy != "online" or self.circuit_breaker.is_open()
+
+    def _fetch(self, url: str, cancel: threading.Event | None = None) -> APIResponse:
+        # Off the `online` policy the user has said a cached answer would have
+        # done; on a miss, one attempt and an immediate failure beats sitting
+        # through backoff sleeps on a network that is not there.
+        if self.network_policy == "online":
+            return self.request_handler.make_request_with_retry(url, cancel=cancel)
+        handler = self.request_handler
+        return handler.make_request(url, timeout=min(handler.timeout, handler.deadline))
+
     def clear_cache(self) -> None:
         self.cache_manager.clear()
         logger.info("Cleared all API cache data")
@@ -205,3 +384,43 @@ class GitIgnoreAPI:
             return False
 
         return True
+
+
+def _content_failure(clean_techs: list[str], error: Exception) -> APIResponse:
+    fallback_content = f"""# Error generating content: {error}
+# Selected templates: {", ".join(clean_techs)}
+#
+# This error typically means:
+# - Network connectivity issues
+# - Invalid template names
+# - API service temporarily unavailable
+#
+# Try refreshing the template list or check your internet connection."""
+
+    return APIResponse(success=False, data=fallback_content, error_message=str(error))
+
+
+def _unknown_templates(names: list[str], catalogue: list[str]) -> APIResponse:
+    by_lower = {name.lower(): name for name in catalogue}
+    described = []
+    for name in names:
+        matches = difflib.get_close_matches(name.lower(), list(by_lower), n=3, cutoff=0.6)
+        if matches:
+            suggestions = " or ".join(by_lower[m] for m in matches)
+            described.append(f"{name} (did you mean {suggestions}?)")
+        else:
+            described.append(name)
+    noun = "template" if len(names) == 1 else "templates"
+    return APIResponse(
+        success=False,
+        data="",
+        status_code=404,
+        error_message=f"Unknown {noun}: {', '.join(described)}",
+    )
+
+
+def _offline_miss(what: str) -> str:
+    return (
+        f"{what} is not in the cache and the network policy is offline. "
+        "Load a bundle with `igntui cache import`, or warm the cache while online."
+    )
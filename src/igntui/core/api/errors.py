@@ -7,10 +7,13 @@ class APIError(Exception):
         message: str,
         status_code: int | None = None,
         retry_after: int | None = None,
+        body: str | None = None,
     ):
         super().__init__(message)
         self.status_code = status_code
         self.retry_after = retry_after
+        # The response body of a 4xx, which names the templates a 404 is about.
+        self.body = body
 
 
 class NetworkError(APIError):
@@ -23,3 +26,15 @@ class RateLimitError(APIError):
 
 class ServiceUnavailableError(APIError):
     pass
+
+
+class CircuitOpenError(APIError):
+    """Refused without a request: the circuit breaker is open."""
+
+
+class DeadlineExceededError(NetworkError):
+    """The call's time budget ran out before a request succeeded."""
+
+
+class RequestCancelledError(APIError):
+    """The caller cancelled the call while it was waiting to retry."""
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Network policies.
+
+Kept apart from `client` so that reading the configured policy does not import
+the cache and the HTTP stack: the daemon client needs it before deciding
+whether to build a `GitIgnoreAPI` at all.
+"""
+
+import logging
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+# How willing the client is to use the network.
+#   online        cache within TTL, else fetch (with retries)
+#   prefer-cache  any cached copy regardless of TTL, else one fetch attempt
+#   offline       any cached copy regardless of TTL, else fail; never fetch
+NETWORK_POLICIES = ("online", "prefer-cache", "offline")
+
+
+def configured_policy() -> str:
+    policy = config.get("api", "network", default="online")
+    if policy not in NETWORK_POLICIES:
+        logger.warning(
+            "Unknown api.network %r; expected one of %s. Using 'online'.",
+            policy,
+            ", ".join(NETWORK_POLICIES),
+        )
+        return "online"
+    return policy
@@ -1,28 +1,126 @@
 #!/usr/bin/env python3
+"""Token-bucket rate limiter for requests to gitignore.io.
 
+The limiter used to be one last-request timestamp: no bursts, and the TUI's
+worker threads raced on it. It is now a token bucket. The bucket holds up to
+`burst` tokens and refills at `rate` tokens per second; each request takes one,
+and waits for the refill when the bucket is empty. A `cache warm` can start
+`burst` requests at once and then settles at `rate` per second.
 
+With a `state_file`, the bucket lives in that file instead of in memory, and
+every update happens under an flock on it. Parallel igntui processes on one CI
+host then draw from one budget against the public API instead of one each.
+"""
+
+import contextlib
+import json
 import logging
+import os
+import threading
 import time
+from pathlib import Path
+
+from ..file_lock import FileLock
+from .errors import DeadlineExceededError, RequestCancelledError
 
 logger = logging.getLogger(__name__)
 
+RATE_LIMIT_FILENAME = "rate-limit.json"
+
 
 class RateLimiter:
-    def __init__(self, min_interval: float = 0.1):
-        self.min_interval = min_interval
-        self._last_request_time = 0
+    def __init__(self, rate: float = 10.0, burst: int = 5, state_file: Path | None = None):
+        # 0 (or less) turns the limiter off.
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.state_file = state_file
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(state_file) if state_file is not None else None
+        self._tokens = float(self.burst)
+        self._updated = time.time()
+
+    def wait_if_needed(
+        self, give_up_at: float | None = None, cancel: threading.Event | None = None
+    ) -> None:
+        """Take a token, sleeping until one is available.
 
-    def wait_if_needed(self) -> None:
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
+        `give_up_at` is the request's deadline on the `time.monotonic()` clock:
+        if the next token comes later, `DeadlineExceededError` is raised at once
+        rather than sleeping for nothing. Setting `cancel` ends the wait with
+        `RequestCancelledError`.
+        """
+        if self.rate <= 0:
+            return
+        while True:
+            wait = self._take()
+            if wait <= 0:
+                return
+            self._check_deadline(wait, give_up_at)
+            logger.debug("Rate limiting: sleeping for %.3fs", wait)
+            if cancel is None:
+                time.sleep(wait)
+            elif cancel.wait(wait):
+                raise RequestCancelledError("Request cancelled")
 
-        if time_since_last < self.min_interval:
-            sleep_time = self.min_interval - time_since_last
-            logger.debug("Rate limiting: sleeping for %.3fs", sleep_time)
-            time.sleep(sleep_time)
+    async def wait_async(self, give_up_at: float | None = None) -> None:
+        """`wait_if_needed` for coroutines: the event loop keeps running."""
+        # Imported here so the synchronous CLI never pays for asyncio.
+        import asyncio
 
-    def mark_request(self) -> None:
-        self._last_request_time = time.time()
+        if self.rate <= 0:
+            return
+        # `_take` can block on the state file's flock while another process
+        # holds it, so it runs on a worker thread; the wait is an asyncio sleep.
+        while (wait := await asyncio.to_thread(self._take)) > 0:
+            self._check_deadline(wait, give_up_at)
+            await asyncio.sleep(wait)
+
+    @staticmethod
+    def _check_deadline(wait: float, give_up_at: float | None) -> None:
+        if give_up_at is not None and time.monotonic() + wait >= give_up_at:
+            raise DeadlineExceededError(f"Rate limited for {wait:.1f}s, past the request deadline")
 
     def reset(self) -> None:
-        self._last_request_time = 0
+        """Refill the bucket."""
+        with self._lock, self._file_lock or contextlib.nullcontext():
+            self._save(float(self.burst), time.time())
+
+    def _take(self) -> float:
+        """Take a token if there is one; otherwise return the wait for the next."""
+        with self._lock, self._file_lock or contextlib.nullcontext():
+            tokens, updated = self._load()
+            now = time.time()
+            # Wall-clock time, because another process wrote `updated`; a clock
+            # that stepped backwards just refills nothing.
+            tokens = min(float(self.burst), tokens + max(0.0, now - updated) * self.rate)
+            if tokens >= 1:
+                self._save(tokens - 1, now)
+                return 0.0
+            self._save(tokens, now)
+            return (1 - tokens) / self.rate
+
+    def _load(self) -> tuple[float, float]:
+        if self.state_file is None:
+            return self._tokens, self._updated
+        try:
+            with open(self.state_file, encoding="utf-8") as f:
+                state = json.load(f)
+            return float(state["tokens"]), float(state["updated"])
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            # Empty on first use: the lock just created the file.
+            logger.debug("Starting a full rate-limit bucket (%s): %s", self.state_file, e)
+            return float(self.burst), time.time()
+
+    def _save(self, tokens: float, updated: float) -> None:
+        self._tokens, self._updated = tokens, updated
+        if self.state_file is None:
+            return
+        # Rewritten in place, not renamed: the flock is held on this very file,
+        # and a rename would hand the next process a different, unlocked inode.
+        try:
+            fd = os.open(self.state_file, os.O_RDWR | os.O_CREAT, 0o644)
+            with open(fd, "r+", encoding="utf-8") as f:
+                f.write(json.dumps({"tokens": round(tokens, 4), "updated": updated}))
+                f.truncate()
+        except OSError as e:
+            logger.debug("Could not save rate-limit state %s: %s", self.state_file, e)
@@ -2,27 +2,105 @@
 
 
 import logging
+import random
+import threading
 import time
-import urllib.error
-import urllib.request
+from typing import TYPE_CHECKING
 
-from .errors import APIError, NetworkError, RateLimitError, ServiceUnavailableError
+from .circuit_breaker import CircuitBreaker
+from .errors import (
+    APIError,
+    DeadlineExceededError,
+    NetworkError,
+    RateLimitError,
+    RequestCancelledError,
+    ServiceUnavailableError,
+)
 from .rate_limiter import RateLimiter
 from .response import APIResponse
 
+if TYPE_CHECKING:
+    import urllib.error
+
 logger = logging.getLogger(__name__)
 
+# First retry waits up to this long; each further retry doubles the ceiling
+# until it reaches `backoff_max`.
+_BACKOFF_BASE = 1.0
+
+# A 4xx body is only read for the template names in it; cap what we keep.
+_MAX_ERROR_BODY = 64 * 1024
+
 
 class RequestHandler:
-    def __init__(self, user_agent: str, timeout: float = 30.0, retry_attempts: int = 3):
+    def __init__(
+        self,
+        user_agent: str,
+        timeout: float = 30.0,
+        retry_attempts: int = 3,
+        circuit_breaker: CircuitBreaker | None = None,
+        deadline: float = 30.0,
+        backoff_max: float = 8.0,
+        retry_after_max: float = 10.0,
+        rate_limiter: RateLimiter | None = None,
+    ):
         self.user_agent = user_agent
         self.timeout = timeout
         self.retry_attempts = retry_attempts
-        self.rate_limiter = RateLimiter(min_interval=0.1)
+        # Wall-clock budget for one `make_request_with_retry` call: attempts,
+        # their timeouts and the waits between them all come out of it.
+        self.deadline = deadline
+        self.backoff_max = backoff_max
+        # A server-sent Retry-After longer than this is not worth waiting out.
+        self.retry_after_max = retry_after_max
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
         self.stats = {"requests_made": 0, "errors": 0, "total_response_time": 0.0}
 
-    def make_request(self, url: str, timeout: float | None = None) -> APIResponse:
-        self.rate_limiter.wait_if_needed()
+    def make_request(
+        self,
+        url: str,
+        timeout: float | None = None,
+        probe: bool = False,
+        give_up_at: float | None = None,
+        cancel: threading.Event | None = None,
+    ) -> APIResponse:
+        """One request. `probe` sends it even while the circuit is open.
+
+        `give_up_at` (on the `time.monotonic()` clock) and `cancel` bound the
+        rate limiter's wait as well as the request itself.
+        """
+        if not probe:
+            self.circuit_breaker.before_request()
+        # Outside the try: waiting for a token says nothing about the service.
+        self.rate_limiter.wait_if_needed(give_up_at, cancel)
+        if give_up_at is not None:
+            timeout = min(timeout or self.timeout, give_up_at - time.monotonic())
+        try:
+            response = self._send(url, timeout)
+        except APIError as e:
+            self.record_outcome(e)
+            raise
+        self.record_outcome(None)
+        return response
+
+    def record_outcome(self, error: APIError | None) -> None:
+        """Report a finished request to the circuit breaker."""
+        if error is None:
+            self.circuit_breaker.record_success()
+        elif isinstance(error, (NetworkError, ServiceUnavailableError, RateLimitError)):
+            self.circuit_breaker.record_failure()
+        elif error.status_code is not None:
+            # A 4xx is an answer: the service is up, the request was wrong.
+            self.circuit_breaker.record_success()
+        else:
+            self.circuit_breaker.record_failure()
+
+    def _send(self, url: str, timeout: float | None = None) -> APIResponse:
+        # urllib brings in http.client, email and ssl; a command answered from
+        # the cache never gets this far and should not pay for them.
+        import urllib.error
+        import urllib.request
 
         start_time = time.time()
         timeout = timeout or self.timeout
@@ -41,7 +119,6 @@ class RequestHandler:
                 content = response.read().decode("utf-8")
                 response_time = time.time() - start_time
 
-                self.rate_limiter.mark_request()
                 self.stats["requests_made"] += 1
                 self.stats["total_response_time"] += response_time
 
@@ -60,12 +137,13 @@ class RequestHandler:
             error_msg = f"HTTP {e.code}: {e.reason}"
 
             if e.code == 429:
-                retry_after = int(e.headers.get("Retry-After", 60))
-                raise RateLimitError(error_msg, e.code, retry_after) from e
+                raise RateLimitError(
+                    error_msg, e.code, retry_after_seconds(e.headers.get("Retry-After"))
+                ) from e
             elif e.code >= 500:
                 raise ServiceUnavailableError(error_msg, e.code) from e
             else:
-                raise APIError(error_msg, e.code) from e
+                raise APIError(error_msg, e.code, body=_error_body(e)) from e
 
         except urllib.error.URLError as e:
             self.stats["errors"] += 1
@@ -79,41 +157,110 @@ class RequestHandler:
             self.stats["errors"] += 1
             raise APIError(f"Unexpected error: {e}") from e
 
-    def make_request_with_retry(self, url: str) -> APIResponse:
-        last_exception = None
+    def make_request_with_retry(
+        self,
+        url: str,
+        deadline: float | None = None,
+        cancel: threading.Event | None = None,
+    ) -> APIResponse:
+        """`make_request` with retries, all within `deadline` seconds.
+
+        Waits between attempts use full-jitter exponential backoff, so clients
+        that failed together do not retry together. A 429's Retry-After is
+        honoured up to `retry_after_max`; if the wait would outlast the
+        deadline the call gives up at once rather than sleep for nothing.
+        Setting `cancel` ends any wait, a rate-limit wait included, immediately
+        with `RequestCancelledError`.
+        """
+        budget = self.deadline if deadline is None else deadline
+        give_up_at = time.monotonic() + budget
+        last_exception: APIError | None = None
 
         for attempt in range(self.retry_attempts):
+            if cancel is not None and cancel.is_set():
+                raise RequestCancelledError("Request cancelled")
+            remaining = give_up_at - time.monotonic()
+            if remaining <= 0:
+                break
             try:
-                return self.make_request(url)
-
-            except RateLimitError as e:
-                if attempt < self.retry_attempts - 1:
-                    wait_time = e.retry_after or (2**attempt)
-                    logger.warning(
-                        "Rate limited, waiting %ds before retry %d", wait_time, attempt + 1
-                    )
-                    time.sleep(wait_time)
-                    last_exception = e
-                else:
-                    raise
+                return self.make_request(
+                    url,
+                    timeout=min(self.timeout, remaining),
+                    give_up_at=give_up_at,
+                    cancel=cancel,
+                )
 
-            except (NetworkError, ServiceUnavailableError) as e:
-                if attempt < self.retry_attempts - 1:
-                    wait_time = 2**attempt
-                    logger.warning(
-                        "Request failed, retrying in %ds (attempt %d)", wait_time, attempt + 1
-                    )
-                    time.sleep(wait_time)
-                    last_exception = e
-                else:
+            except DeadlineExceededError:
+                # The rate limiter had no token in time; a retry has even less.
+                raise
+
+            except (NetworkError, ServiceUnavailableError, RateLimitError) as e:
+                last_exception = e
+                if attempt == self.retry_attempts - 1:
                     raise
 
+                wait_time = self.retry_wait(e, attempt, give_up_at)
+                if wait_time is None:
+                    break
+                self._wait(wait_time, cancel)
+
             except APIError:
                 raise
 
-        if last_exception:
-            raise last_exception
-        raise APIError("All retry attempts failed")
+        raise self.deadline_exceeded(url, budget, last_exception) from last_exception
+
+    def retry_wait(self, error: APIError, attempt: int, give_up_at: float) -> float | None:
+        """Seconds to wait before retrying after `error`, or None to give up."""
+        wait_time = self._backoff(attempt)
+        if isinstance(error, RateLimitError) and error.retry_after:
+            wait_time = min(error.retry_after, self.retry_after_max)
+        if time.monotonic() + wait_time >= give_up_at:
+            return None
+        logger.warning(
+            "%s; retrying in %.1fs (attempt %d of %d)",
+            error,
+            wait_time,
+            attempt + 2,
+            self.retry_attempts,
+        )
+        return wait_time
+
+    @staticmethod
+    def deadline_exceeded(
+        url: str, budget: float, last_exception: APIError | None
+    ) -> DeadlineExceededError:
+        if last_exception is None:
+            return DeadlineExceededError(f"No time left to request {url} ({budget:g}s budget)")
+        return DeadlineExceededError(
+            f"{last_exception} (gave up within the {budget:g}s request deadline)",
+            last_exception.status_code,
+            last_exception.retry_after,
+        )
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, _BACKOFF_BASE * 2**attempt))
+
+    def _wait(self, seconds: float, cancel: threading.Event | None) -> None:
+        if cancel is None:
+            time.sleep(seconds)
+        elif cancel.wait(seconds):
+            raise RequestCancelledError("Request cancelled")
 
     def get_stats(self) -> dict:
-        return self.stats.copy()
+        return {**self.stats, "circuit": self.circuit_breaker.snapshot()}
+
+
+def retry_after_seconds(value: str | None) -> int | None:
+    # Retry-After may also be an HTTP date; treat that (or garbage) as absent
+    # and let the backoff decide.
+    try:
+        return max(0, int(value or ""))
+    except (TypeError, ValueError):
+        return None
+
+
+def _error_body(error: "urllib.error.HTTPError") -> str | None:
+    try:
+        return error.read(_MAX_ERROR_BODY).decode("utf-8", errors="replace")
+    except (OSError, AttributeError, TypeError):
+        return None
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 """Domain primitive types for the API layer."""
 
-from typing import NewType
+import threading
+from typing import NewType, Protocol
+
+from .response import APIResponse
 
 TemplateName = NewType("TemplateName", str)
 """A gitignore.io template identifier (e.g. ``"python"``, ``"node"``).
@@ -9,3 +12,25 @@ TemplateName = NewType("TemplateName", str)
 Use the `NewType` so the type checker treats these distinctly from arbitrary
 strings even though they have no runtime overhead.
 """
+
+
+class TemplateSource(Protocol):
+    """What answers for templates: a `GitIgnoreAPI`, or a `DaemonClient` in front of one.
+
+    `network_policy` and `force_refresh_default` are read and set by callers
+    the same way on both.
+    """
+
+    network_policy: str
+    force_refresh_default: bool
+
+    def list_templates(
+        self, force_refresh: bool = False, cancel: threading.Event | None = None
+    ) -> APIResponse: ...
+
+    def get_templates(
+        self,
+        technologies: list[str],
+        force_refresh: bool = False,
+        cancel: threading.Event | None = None,
+    ) -> APIResponse: ...
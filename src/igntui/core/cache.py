@@ -8,13 +8,115 @@ import os
 import re
 import tempfile
 import time
-from dataclasses import asdict, dataclass
+import urllib.parse
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from threading import RLock
 from typing import Any
 
+from .cache_index import CacheIndex, IndexEntry
+from .file_lock import FileLock
+
 logger = logging.getLogger(__name__)
 
+TEMPLATE_LIST_KEY = "gitignore_templates_list"
+CONTENT_KEY_PREFIX = "gitignore_content_"
+# Negative entries: template names gitignore.io answered 404 for.
+UNKNOWN_KEY_PREFIX = "gitignore_unknown_"
+
+# On-disk entry format, version 2: a one-line ASCII header, then the payload as
+# JSON. A content entry's header also carries its template names
+# (percent-encoded, comma-separated), so an index rebuilt from the files alone
+# still knows which entries `cache invalidate NAME` should drop.
+#
+#     igntui-cache/2 1714209487.123 3600 node,python
+#     "### Node ###\n...### Python ###\n__pycache__/\n..."
+#
+# Version 1 was a single JSON object holding payload and metadata together, so
+# learning whether an entry had expired meant parsing its whole body. Version 1
+# files are still read; each is rewritten as version 2 the first time it hits.
+ENTRY_MAGIC = b"igntui-cache/2"
+# Longer than any header written: names that would not fit are left out of it.
+# It also bounds the read on a version 1 file, whose first line is the whole
+# entry.
+_HEADER_LIMIT = 4096
+
+LOCK_FILENAME = "cache.lock"
+STATS_FILENAME = "cache-stats.json"
+# The template list again, one name per line, for shell completion to read
+# without starting Python. Rewritten whenever the list entry is.
+CATALOGUE_FILENAME = "catalogue.txt"
+
+# gitignore.io stamps each response with the selection it answered, which is
+# how names are recovered for entries stored without them:
+#     # Created by https://www.toptal.com/developers/gitignore/api/node,python
+_CREATED_BY_RE = re.compile(r"^# Created by \S*/api/(\S+)", re.MULTILINE)
+
+# Keys that arrive from outside (a bundle import) become file names.
+_SAFE_KEY_RE = re.compile(r"[A-Za-z0-9_][A-Za-z0-9_.-]{0,199}")
+
+
+def _flush_shared_stats(
+    stats: dict[str, int],
+    flushed: dict[str, int],
+    stats_file: Path,
+    file_lock: FileLock,
+    lock: AbstractContextManager,
+) -> None:
+    """Add `stats` minus `flushed` into `stats_file`, then mark them flushed.
+
+    Takes the counters rather than the manager so that a `weakref.finalize`
+    can run it after the manager is gone.
+    """
+    with lock:
+        delta = {k: v - flushed[k] for k, v in stats.items()}
+        if not any(delta.values()):
+            return
+        with file_lock:
+            shared = _read_shared_stats(stats_file)
+            for name, value in delta.items():
+                shared[name] = shared.get(name, 0) + value
+            shared.setdefault("since", time.time())
+            if _write_shared_stats(stats_file, shared):
+                flushed.update(stats)
+
+
+def _read_shared_stats(stats_file: Path) -> dict[str, Any]:
+    try:
+        with open(stats_file, encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable cache stats %s: %s", stats_file, e)
+        return {}
+
+
+def _write_shared_stats(stats_file: Path, shared: dict[str, Any]) -> bool:
+    tmp_path: str | None = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=stats_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(shared, f)
+        os.replace(tmp_path, stats_file)
+        tmp_path = None
+        return True
+    except OSError as e:
+        logger.warning("Failed to save cache stats %s: %s", stats_file, e)
+        return False
+    finally:
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
 
 @dataclass
 class CacheEntry:
@@ -33,10 +135,27 @@ class CacheEntry:
 
 
 class CacheManager:
-    def __init__(self, cache_dir: str | Path, default_ttl: int = 3600):
+    """Two-layer (memory + disk) cache, safe to share between processes.
+
+    `_lock` orders threads in this process. `_file_lock` orders processes: it
+    is held for every change to the directory (writes, deletes, clears, expiry
+    sweeps) so an entry file and its index line always change together. Reads
+    take no file lock — entries are replaced by atomic rename, so a reader
+    sees the old entry or the new one, never half of either.
+
+    With `persist_stats`, hit/miss counters are also added into a shared
+    `cache-stats.json` when the manager is collected or the process exits, and
+    `get_stats()` reports the lifetime totals next to this process's own.
+    """
+
+    def __init__(self, cache_dir: str | Path, default_ttl: int = 3600, persist_stats: bool = False):
         self.cache_dir = Path(cache_dir)
         self.default_ttl = default_ttl
-        self._memory_cache: dict[str, CacheEntry] = {}
+        self.persist_stats = persist_stats
+        # Least recently used first. None leaves the memory layer unbounded,
+        # which suits a CLI run; a long-lived process sets a limit.
+        self._memory_cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._memory_limit: int | None = None
         self._lock = RLock()
 
         self._stats = {
@@ -48,9 +167,31 @@ class CacheManager:
             "disk_reads": 0,
             "disk_writes": 0,
         }
+        # Counter values as of the last flush into the shared stats file.
+        self._flushed_stats = dict(self._stats)
 
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._purge_legacy_content_keys()
+        self._file_lock = FileLock(self.cache_dir / LOCK_FILENAME)
+        self._stats_file = self.cache_dir / STATS_FILENAME
+        self._index = CacheIndex(self.cache_dir, lock=self._file_lock)
+        if persist_stats:
+            # Flushes when the manager is collected, or at exit if it never is.
+            # The finalizer holds the counters, not the manager, so neither a
+            # CLI run whose manager is gone by then nor a `serve` that makes
+            # many loses its counts or keeps a manager alive.
+            self._stats_finalizer = weakref.finalize(
+                self,
+                _flush_shared_stats,
+                self._stats,
+                self._flushed_stats,
+                self._stats_file,
+                self._file_lock,
+                self._lock,
+            )
+        # Legacy keys can only exist in a cache no current igntui has indexed,
+        # so the directory glob runs on that migration path and nowhere else.
+        if not self._index.exists():
+            self._purge_legacy_content_keys()
 
         # Deliberately not reading the cache into memory here. `get()` already
         # falls back to disk and promotes what it finds, so an eager load bought
@@ -82,49 +223,90 @@ class CacheManager:
         if purged:
             logger.info("Purged %d legacy content cache entries", purged)
 
-    def get(self, key: str) -> Any | None:
+    def get(
+        self, key: str, allow_stale: bool = False, record_stats: bool = True, evict: bool = True
+    ) -> Any | None:
+        """The cached value for `key`, or None.
+
+        With `allow_stale`, an expired entry is returned rather than evicted —
+        offline mode would rather serve an old template than nothing. With
+        `evict=False` an expired entry is a miss but stays where it is, as the
+        fallback for a fetch that may fail. `record_stats=False` keeps
+        bookkeeping lookups (name validation) out of the hit/miss counters.
+        """
+        counted = 1 if record_stats else 0
         with self._lock:
             if key in self._memory_cache:
                 entry = self._memory_cache[key]
 
-                if entry.is_expired():
-                    del self._memory_cache[key]
-                    self._delete_disk_cache(key)
-                    self._stats["evictions"] += 1
-                    self._stats["misses"] += 1
+                if entry.is_expired() and not allow_stale:
+                    if evict:
+                        del self._memory_cache[key]
+                        self._evict_if_expired(key)
+                        self._stats["evictions"] += 1
+                    self._stats["misses"] += counted
                     return None
 
                 entry.touch()
-                self._stats["hits"] += 1
+                self._memory_cache.move_to_end(key)
+                self._stats["hits"] += counted
                 logger.debug("Cache hit for key: %s", key)
                 return entry.data
 
-            disk_entry = self._load_disk_cache(key)
+            disk_entry = self._load_disk_cache(key, allow_stale=allow_stale)
             if disk_entry and not disk_entry.is_expired():
-                self._memory_cache[key] = disk_entry
+                self._remember(key, disk_entry)
                 disk_entry.touch()
-                self._stats["hits"] += 1
+                self._stats["hits"] += counted
                 logger.debug("Disk cache hit for key: %s", key)
                 return disk_entry.data
-            elif disk_entry:
-                self._delete_disk_cache(key)
+            elif disk_entry and allow_stale:
+                self._stats["hits"] += counted
+                logger.debug("Stale disk cache hit for key: %s", key)
+                return disk_entry.data
+            elif disk_entry and evict:
+                self._evict_if_expired(key)
                 self._stats["evictions"] += 1
 
-            self._stats["misses"] += 1
+            self._stats["misses"] += counted
             return None
 
-    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+    def set(self, key: str, value: Any, ttl: int | None = None, names: Sequence[str] = ()) -> None:
+        """Store `value`; `names` are the template names recorded for it in the index."""
         ttl = ttl or self.default_ttl
 
         with self._lock:
             entry = CacheEntry(data=value, timestamp=time.time(), ttl=ttl)
 
-            self._memory_cache[key] = entry
-            self._save_disk_cache(key, entry)
+            self._remember(key, entry)
+            with self._file_lock:
+                self._write_through(key, entry, names)
             self._stats["sets"] += 1
 
             logger.debug("Cached value for key: %s (TTL: %ds)", key, ttl)
 
+    @property
+    def memory_limit(self) -> int | None:
+        """How many entries the memory layer holds; None for no limit."""
+        return self._memory_limit
+
+    @memory_limit.setter
+    def memory_limit(self, limit: int | None) -> None:
+        with self._lock:
+            self._memory_limit = limit
+            self._trim_memory()
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        """Keep `entry` in memory, dropping the least recently used past `memory_limit`."""
+        self._memory_cache[key] = entry
+        self._memory_cache.move_to_end(key)
+        self._trim_memory()
+
+    def _trim_memory(self) -> None:
+        if self._memory_limit is not None:
+            while len(self._memory_cache) > self._memory_limit:
+                self._memory_cache.popitem(last=False)
+
     def delete(self, key: str) -> bool:
         with self._lock:
             deleted = False
@@ -133,8 +315,9 @@ class CacheManager:
                 del self._memory_cache[key]
                 deleted = True
 
-            if self._delete_disk_cache(key):
-                deleted = True
+            with self._file_lock:
+                if self._delete_disk_cache(key):
+                    deleted = True
 
             if deleted:
                 self._stats["deletes"] += 1
@@ -142,8 +325,47 @@ class CacheManager:
 
             return deleted
 
-    def clear(self) -> int:
+    def keys_for_name(self, name: str) -> list[str]:
+        """Keys of the entries stored with template name `name`, from the index."""
+        with self._lock:
+            return self._ensure_index().keys_for_name(name)
+
+    def entry_names(self, key: str) -> tuple[str, ...]:
         with self._lock:
+            meta = self._ensure_index().get(key)
+        return meta.names if meta is not None else ()
+
+    def entry_timestamp(self, key: str) -> float | None:
+        """When the entry on disk for `key` was written, from the index; None if absent.
+
+        Cheap enough to ask on every request, and it sees writes by other
+        processes that this process's memory copy would not.
+        """
+        with self._lock:
+            meta = self._ensure_index().get(key)
+        return meta.timestamp if meta is not None else None
+
+    def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete `keys` under one lock, with one index append. Returns the count."""
+        with self._lock, self._file_lock:
+            removed = []
+            for key in keys:
+                in_memory = self._memory_cache.pop(key, None) is not None
+                try:
+                    self._cache_file(key).unlink()
+                except FileNotFoundError:
+                    if not in_memory:
+                        continue
+                except OSError as e:
+                    logger.warning("Failed to delete cache file for %s: %s", key, e)
+                    continue
+                removed.append(key)
+            self._index.record_deletes(removed)
+            self._stats["deletes"] += len(removed)
+            return len(removed)
+
+    def clear(self) -> int:
+        with self._lock, self._file_lock:
             memory_count = len(self._memory_cache)
             self._memory_cache.clear()
             disk_count = 0
@@ -153,37 +375,50 @@ class CacheManager:
                     disk_count += 1
                 except OSError:
                     pass
+            self._index.reset()
+            self._catalogue_file().unlink(missing_ok=True)
 
             total_cleared = memory_count + disk_count
             logger.info("Cleared %d cache entries", total_cleared)
             return total_cleared
 
+    def drop_memory(self) -> int:
+        """Forget the in-memory layer only; the next `get()` re-reads from disk.
+
+        For a long-lived process whose disk cache another process has changed.
+        """
+        with self._lock:
+            dropped = len(self._memory_cache)
+            self._memory_cache.clear()
+            return dropped
+
     # Backwards-compatible alias used by `igntui cache clear`.
     def clear_all(self) -> int:
         return self.clear()
 
     def cleanup_expired(self) -> int:
-        with self._lock:
-            expired_keys = []
-
-            for key, entry in self._memory_cache.items():
-                if entry.is_expired():
-                    expired_keys.append(key)
+        """Remove every expired entry, deciding expiry from the index alone.
 
+        No entry file is opened: the index already holds each entry's timestamp
+        and TTL, so the sweep costs one unlink per expired entry.
+        """
+        with self._lock, self._file_lock:
+            now = time.time()
+            expired_keys = {key for key, entry in self._memory_cache.items() if entry.is_expired()}
             for key in expired_keys:
                 del self._memory_cache[key]
-                self._delete_disk_cache(key)
 
-            disk_cleaned = 0
-            for cache_file in self.cache_dir.glob("*.cache"):
-                key = cache_file.stem
-                if key not in self._memory_cache:
-                    entry = self._load_disk_cache(key)
-                    if entry and entry.is_expired():
-                        cache_file.unlink()
-                        disk_cleaned += 1
-
-            total_cleaned = len(expired_keys) + disk_cleaned
+            expired_keys.update(
+                key for key, meta in self._ensure_index().items() if meta.expires_at() < now
+            )
+            for key in expired_keys:
+                try:
+                    self._cache_file(key).unlink()
+                except OSError:
+                    pass
+            self._index.record_deletes(expired_keys)
+
+            total_cleaned = len(expired_keys)
             self._stats["evictions"] += total_cleaned
 
             if total_cleaned > 0:
@@ -197,9 +432,9 @@ class CacheManager:
             hit_rate = self._stats["hits"] / max(1, total_requests)
 
             memory_entries = len(self._memory_cache)
-            disk_entries = len(list(self.cache_dir.glob("*.cache")))
+            disk_entries = len(self._ensure_index())
 
-            return {
+            stats = {
                 "hit_rate": hit_rate,
                 "total_requests": total_requests,
                 "memory_entries": memory_entries,
@@ -208,28 +443,240 @@ class CacheManager:
                 "default_ttl": self.default_ttl,
                 **self._stats,
             }
+            if self.persist_stats:
+                stats.update(self._lifetime_stats())
+            return stats
+
+    def flush_stats(self) -> None:
+        """Add this process's unflushed counters into the shared stats file."""
+        if not self.persist_stats:
+            return
+        _flush_shared_stats(
+            self._stats, self._flushed_stats, self._stats_file, self._file_lock, self._lock
+        )
+
+    def _lifetime_stats(self) -> dict[str, Any]:
+        shared = _read_shared_stats(self._stats_file)
+        hits = shared.get("hits", 0) + self._stats["hits"] - self._flushed_stats["hits"]
+        misses = shared.get("misses", 0) + self._stats["misses"] - self._flushed_stats["misses"]
+        since = shared.get("since")
+        return {
+            "lifetime_hit_rate": hits / max(1, hits + misses),
+            "lifetime_requests": hits + misses,
+            "lifetime_hits": hits,
+            "lifetime_misses": misses,
+            "lifetime_since": datetime.fromtimestamp(since) if since else None,
+        }
 
-    def _load_disk_cache(self, key: str) -> CacheEntry | None:
-        cache_file = self.cache_dir / f"{key}.cache"
+    def get_disk_summary(self) -> dict[str, Any]:
+        """What is on disk, from the index: counts, bytes, oldest/newest write."""
+        with self._lock:
+            entries = [meta for _, meta in self._ensure_index().items()]
+            timestamps = [meta.timestamp for meta in entries]
+            return {
+                "entries": len(entries),
+                "template_lists": sum(1 for m in entries if m.kind == "list"),
+                "content_blobs": sum(1 for m in entries if m.kind == "content"),
+                "unknown_names": sum(1 for m in entries if m.kind == "unknown"),
+                "total_bytes": sum(m.size for m in entries),
+                "oldest": min(timestamps) if timestamps else None,
+                "newest": max(timestamps) if timestamps else None,
+            }
+
+    def export_entries(self) -> Iterator[tuple[str, bytes]]:
+        """Every entry on disk as `(key, file contents)`, in the current format."""
+        with self._lock:
+            keys = self._ensure_index().keys()
+        for key in keys:
+            try:
+                raw = self._cache_file(key).read_bytes()
+                if parse_entry_header(raw.split(b"\n", 1)[0]) is None:
+                    raw = _encode_entry(CacheEntry(**json.loads(raw)))
+            except FileNotFoundError:
+                continue
+            except (ValueError, TypeError, KeyError, OSError) as e:
+                logger.warning("Not exporting unreadable cache entry %s: %s", key, e)
+                continue
+            yield key, raw
+
+    def import_entries(
+        self,
+        entries: Iterable[tuple[str, bytes]],
+        names: Mapping[str, Sequence[str]] | None = None,
+        rejected: list[str] | None = None,
+    ) -> int:
+        """Write entries produced by `export_entries`, in bulk.
+
+        The lock is taken once and the index gets one append for the whole
+        batch; a `set()` per entry would pay both thousands of times. An entry
+        older than the one already cached is skipped. `names` carries each
+        entry's template names (`entry_names`) across. Keys of entries that are
+        malformed, unsafe or fail to write go to `rejected`. Returns how many
+        were written.
+        """
+        names = names or {}
+        written: list[tuple[str, IndexEntry]] = []
+        with self._lock, self._file_lock:
+            index = self._ensure_index()
+            for key, raw in entries:
+                try:
+                    header = parse_entry_header(raw.split(b"\n", 1)[0])
+                except ValueError:
+                    header = None
+                if header is None or not _is_safe_key(key):
+                    logger.warning("Not importing malformed cache entry %r", key)
+                    if rejected is not None:
+                        rejected.append(key)
+                    continue
+                timestamp, ttl = header
+                current = index.get(key)
+                if current is not None and current.timestamp >= timestamp:
+                    continue
+                first, _, body = raw.partition(b"\n")
+                entry_names = tuple(names.get(key, ())) or _header_names(first)
+                if entry_names and not _header_names(first):
+                    # Keep the names in the file too, for a later index rebuild.
+                    raw = _encode_header(timestamp, ttl, entry_names) + body
+                size = self._write_raw(key, raw)
+                if size is None:
+                    if rejected is not None:
+                        rejected.append(key)
+                    continue
+                self._memory_cache.pop(key, None)
+                written.append(
+                    (
+                        key,
+                        IndexEntry(
+                            size=size,
+                            timestamp=timestamp,
+                            ttl=ttl,
+                            kind=entry_kind(key),
+                            names=entry_names,
+                        ),
+                    )
+                )
+            index.record_sets(written)
+            self._stats["sets"] += len(written)
+        if any(key == TEMPLATE_LIST_KEY for key, _ in written):
+            templates = self.get(TEMPLATE_LIST_KEY, allow_stale=True, record_stats=False)
+            if templates is not None:
+                self.write_catalogue(templates)
+        logger.info("Imported %d cache entries", len(written))
+        return len(written)
+
+    def _ensure_index(self) -> CacheIndex:
+        if not self._index.exists():
+            with self._file_lock:
+                if not self._index.exists():
+                    self._index.rebuild(self._scan_disk_entries)
+        return self._index
+
+    def _scan_disk_entries(self) -> Iterator[tuple[str, IndexEntry]]:
+        """Read every entry once to seed a missing index (the migration path)."""
+        for cache_file in self.cache_dir.glob("*.cache"):
+            key = cache_file.stem
+            try:
+                size = cache_file.stat().st_size
+                kind = entry_kind(key)
+                with open(cache_file, "rb") as f:
+                    first = f.readline(_HEADER_LIMIT)
+                    header = parse_entry_header(first)
+                    names = _header_names(first) if header is not None else ()
+                    if header is None:
+                        data = json.loads(first + f.read())
+                        header = (float(data["timestamp"]), int(data["ttl"]))
+                        names = _recover_names(key, data.get("data"))
+                    elif kind == "content" and not names:
+                        names = _recover_names(key, json.loads(f.read()))
+                timestamp, ttl = header
+                yield (
+                    key,
+                    IndexEntry(size=size, timestamp=timestamp, ttl=ttl, kind=kind, names=names),
+                )
+            except (ValueError, TypeError, KeyError, OSError) as e:
+                logger.warning("Skipping unreadable cache file %s: %s", cache_file, e)
+
+    def _cache_file(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.cache"
+
+    def _load_disk_cache(self, key: str, allow_stale: bool = False) -> CacheEntry | None:
+        """Read an entry's header, and its payload only if it has not expired.
+
+        An expired entry comes back with `data=None` (unless `allow_stale`); the
+        caller deletes it on the strength of the header alone.
+        """
+        cache_file = self._cache_file(key)
 
         try:
             if cache_file.exists():
-                with open(cache_file, encoding="utf-8") as f:
-                    data = json.load(f)
-
+                with open(cache_file, "rb") as f:
+                    first = f.readline(_HEADER_LIMIT)
+                    header = parse_entry_header(first)
+                    if header is None:
+                        entry = CacheEntry(**json.loads(first + f.read()))
+                        self._stats["disk_reads"] += 1
+                        if not entry.is_expired():
+                            with self._file_lock:
+                                self._write_through(key, entry, _recover_names(key, entry.data))
+                        return entry
+
+                    timestamp, ttl = header
+                    entry = CacheEntry(data=None, timestamp=timestamp, ttl=ttl)
+                    if allow_stale or not entry.is_expired():
+                        entry.data = json.loads(f.read())
                 self._stats["disk_reads"] += 1
-                return CacheEntry(**data)
+                return entry
 
-        except (json.JSONDecodeError, TypeError, KeyError, OSError) as e:
+        except (ValueError, TypeError, KeyError, OSError) as e:
             logger.warning("Failed to load cache file %s: %s", cache_file, e)
             try:
                 cache_file.unlink()
+                self._index.record_delete(key)
             except OSError:
                 pass
 
         return None
 
-    def _save_disk_cache(self, key: str, entry: CacheEntry) -> None:
+    def write_catalogue(self, templates: Iterable[str]) -> None:
+        """Write `catalogue.txt`, atomically, so a completing shell never reads half."""
+        catalogue = self._catalogue_file()
+        body = "".join(f"{name}\n" for name in templates)
+        tmp = catalogue.with_name(f"{CATALOGUE_FILENAME}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(body, encoding="utf-8")
+            os.replace(tmp, catalogue)
+        except OSError as e:
+            logger.warning("Failed to write %s: %s", catalogue, e)
+            tmp.unlink(missing_ok=True)
+
+    def has_catalogue(self) -> bool:
+        return self._catalogue_file().exists()
+
+    def _catalogue_file(self) -> Path:
+        return self.cache_dir / CATALOGUE_FILENAME
+
+    def _write_through(self, key: str, entry: CacheEntry, names: Sequence[str] = ()) -> None:
+        # Index what is already on disk before recording this entry: the
+        # record is appended to an existing journal, never starts one.
+        index = self._ensure_index()
+        size = self._save_disk_cache(key, entry, names)
+        if size is not None:
+            index.record_set(
+                key,
+                IndexEntry(
+                    size=size,
+                    timestamp=entry.timestamp,
+                    ttl=entry.ttl,
+                    kind=entry_kind(key),
+                    names=tuple(names),
+                ),
+            )
+            if key == TEMPLATE_LIST_KEY:
+                self.write_catalogue(entry.data)
+
+    def _save_disk_cache(
+        self, key: str, entry: CacheEntry, names: Sequence[str] = ()
+    ) -> int | None:
         """Write an entry to disk atomically.
 
         Writing in place meant a crash, a full disk, or two processes saving the
@@ -238,37 +685,68 @@ class CacheManager:
         and the failure was silent. Writing a temp file in the same directory and
         renaming makes the swap atomic on POSIX and Windows: a reader sees either
         the old entry or the new one, never half of either.
+
+        Returns the size written, or None when nothing was.
         """
-        cache_file = self.cache_dir / f"{key}.cache"
+        try:
+            payload = _encode_entry(entry, names)
+        except TypeError as e:
+            logger.warning("Failed to save cache file %s: %s", self._cache_file(key), e)
+            return None
+        return self._write_raw(key, payload)
+
+    def _write_raw(self, key: str, payload: bytes) -> int | None:
+        cache_file = self._cache_file(key)
         tmp_path: str | None = None
 
         try:
             # Same directory, so os.replace is a rename rather than a cross-device copy.
             fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(asdict(entry), f, separators=(",", ":"))
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
             os.replace(tmp_path, cache_file)
             tmp_path = None
 
             self._stats["disk_writes"] += 1
+            return len(payload)
 
-        except (OSError, TypeError) as e:
+        except OSError as e:
             logger.warning("Failed to save cache file %s: %s", cache_file, e)
         finally:
-            # A serialisation failure leaves the temp file behind; the previous
-            # good entry is still in place, which is the point.
+            # A failed write leaves the temp file behind; the previous good
+            # entry is still in place, which is the point.
             if tmp_path is not None:
                 try:
                     os.unlink(tmp_path)
                 except OSError:
                     pass
+        return None
+
+    def _evict_if_expired(self, key: str) -> None:
+        """Delete an expired entry file unless another process just replaced it.
+
+        The expiry was read without the file lock; between that read and this
+        delete another process may have written a fresh entry under the key.
+        """
+        with self._file_lock:
+            try:
+                with open(self._cache_file(key), "rb") as f:
+                    header = parse_entry_header(f.readline(_HEADER_LIMIT))
+            except OSError:
+                return
+            except ValueError:
+                header = None
+            if header is not None and time.time() <= header[0] + header[1]:
+                return
+            self._delete_disk_cache(key)
 
     def _delete_disk_cache(self, key: str) -> bool:
-        cache_file = self.cache_dir / f"{key}.cache"
+        cache_file = self._cache_file(key)
 
         try:
             if cache_file.exists():
                 cache_file.unlink()
+                self._index.record_delete(key)
                 return True
         except OSError:
             pass
@@ -276,35 +754,143 @@ class CacheManager:
         return False
 
 
+def _encode_entry(entry: CacheEntry, names: Sequence[str] = ()) -> bytes:
+    header = _encode_header(entry.timestamp, entry.ttl, names)
+    return header + json.dumps(entry.data, separators=(",", ":")).encode("utf-8")
+
+
+def _encode_header(timestamp: float, ttl: int, names: Sequence[str] = ()) -> bytes:
+    header = b"%s %s %d" % (ENTRY_MAGIC, repr(timestamp).encode("ascii"), ttl)
+    if names:
+        field = ",".join(urllib.parse.quote(name, safe="+") for name in names).encode("ascii")
+        if len(header) + len(field) + 2 <= _HEADER_LIMIT:
+            header += b" " + field
+    return header + b"\n"
+
+
+def parse_entry_header(line: bytes) -> tuple[float, int] | None:
+    """`(timestamp, ttl)` from a version 2 header line; None for a version 1 file.
+
+    Raises `ValueError` for a version 2 header that is malformed.
+    """
+    if not line.startswith(ENTRY_MAGIC + b" "):
+        return None
+    fields = line.split()
+    if len(fields) not in (3, 4):
+        raise ValueError(f"malformed cache entry header {line[:64]!r}")
+    return float(fields[1]), int(fields[2])
+
+
+def _header_names(line: bytes) -> tuple[str, ...]:
+    """The template names in a version 2 header line, if it has them."""
+    fields = line.split()
+    if len(fields) != 4 or fields[0] != ENTRY_MAGIC:
+        return ()
+    return tuple(urllib.parse.unquote(name) for name in fields[3].decode("ascii").split(","))
+
+
+def _recover_names(key: str, payload: Any) -> tuple[str, ...]:
+    """Names for a content entry stored without them, read back from its body.
+
+    Only trusted if they hash to `key`, so a body that was edited or merged
+    from elsewhere can never attach the wrong names.
+    """
+    if entry_kind(key) != "content" or not isinstance(payload, str):
+        return ()
+    match = _CREATED_BY_RE.search(payload)
+    if match is None:
+        return ()
+    names = _normalized_names(urllib.parse.unquote(match.group(1)).split(","))
+    return names if content_key(names) == key else ()
+
+
+def _is_safe_key(key: str) -> bool:
+    """Whether `key` names a file inside the cache directory and nowhere else."""
+    return bool(_SAFE_KEY_RE.fullmatch(key))
+
+
+def entry_kind(key: str) -> str:
+    """What a cache key holds: "list", "content", "unknown" or "other"."""
+    if key == TEMPLATE_LIST_KEY:
+        return "list"
+    if key.startswith(CONTENT_KEY_PREFIX):
+        return "content"
+    if key.startswith(UNKNOWN_KEY_PREFIX):
+        return "unknown"
+    return "other"
+
+
+def _normalized_names(technologies: Iterable[str]) -> tuple[str, ...]:
+    return tuple(sorted({tech.lower().strip() for tech in technologies if tech.strip()}))
+
+
+def content_key(technologies: Iterable[str]) -> str:
+    """The cache key for a selection's content: a hash of its normalized names."""
+    tech_string = ",".join(_normalized_names(technologies))
+    digest = hashlib.sha256(tech_string.encode("utf-8")).hexdigest()[:16]
+    return f"{CONTENT_KEY_PREFIX}{digest}"
+
+
 class TemplateCache:
     def __init__(self, cache_manager: CacheManager):
         self.cache_manager = cache_manager
-        self._template_list_key = "gitignore_templates_list"
-        self._template_content_prefix = "gitignore_content_"
-
-    def get_template_list(self) -> list[str] | None:
-        return self.cache_manager.get(self._template_list_key)
+        self._template_list_key = TEMPLATE_LIST_KEY
+        self._template_content_prefix = CONTENT_KEY_PREFIX
+
+    def get_template_list(
+        self, allow_stale: bool = False, record_stats: bool = True, evict: bool = True
+    ) -> list[str] | None:
+        templates = self.cache_manager.get(
+            self._template_list_key,
+            allow_stale=allow_stale,
+            record_stats=record_stats,
+            evict=evict,
+        )
+        # A list cached before `catalogue.txt` existed gets one on first read.
+        if templates is not None and not self.cache_manager.has_catalogue():
+            self.cache_manager.write_catalogue(templates)
+        return templates
 
     def set_template_list(self, templates: list[str]) -> None:
         self.cache_manager.set(self._template_list_key, templates)
 
-    def get_template_content(self, technologies: list[str]) -> str | None:
+    def get_template_content(
+        self,
+        technologies: list[str],
+        allow_stale: bool = False,
+        record_stats: bool = True,
+        evict: bool = True,
+    ) -> str | None:
         key = self._make_content_key(technologies)
-        return self.cache_manager.get(key)
+        return self.cache_manager.get(
+            key, allow_stale=allow_stale, record_stats=record_stats, evict=evict
+        )
 
     def set_template_content(self, technologies: list[str], content: str) -> None:
         key = self._make_content_key(technologies)
-        self.cache_manager.set(key, content)
+        self.cache_manager.set(key, content, names=_normalized_names(technologies))
 
-    # No per-template invalidation helper: content keys are sha256 prefixes, so a
-    # template name cannot be recovered from one. The version that tried matched
-    # `name in key`, which could only ever hit by accident — and would delete
-    # unrelated entries for a short hex-ish name like `ade` or `cafe`. Clearing
-    # the whole content cache (`igntui cache clear`) is the honest operation; a
-    # real implementation needs a stored name -> digest index.
+    def get_unknown(self, name: str) -> str | None:
+        """Why `name` was last rejected, while its negative entry lasts."""
+        return self.cache_manager.get(self._make_unknown_key(name), record_stats=False)
+
+    def set_unknown(self, name: str, reason: str, ttl: int) -> None:
+        self.cache_manager.set(self._make_unknown_key(name), reason, ttl=ttl)
+
+    def invalidate_template(self, name: str) -> int:
+        """Drop every cached combination that includes `name`, and any 404 for it.
+
+        Content keys are sha256 prefixes, so a name cannot be recovered from
+        one; the index records the names each content entry was stored under,
+        and each entry's header keeps a copy for when the index is rebuilt.
+        """
+        keys = self.cache_manager.keys_for_name(name.lower().strip())
+        keys.append(self._make_unknown_key(name))
+        return self.cache_manager.delete_many(keys)
 
     def _make_content_key(self, technologies: list[str]) -> str:
-        sorted_techs = sorted({tech.lower().strip() for tech in technologies if tech.strip()})
-        tech_string = ",".join(sorted_techs)
-        digest = hashlib.sha256(tech_string.encode("utf-8")).hexdigest()[:16]
-        return f"{self._template_content_prefix}{digest}"
+        return content_key(technologies)
+
+    def _make_unknown_key(self, name: str) -> str:
+        digest = hashlib.sha256(name.lower().strip().encode("utf-8")).hexdigest()[:16]
+        return f"{UNKNOWN_KEY_PREFIX}{digest}"
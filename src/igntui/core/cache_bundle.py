@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Portable cache bundles (`igntui cache export` / `igntui cache import`).
+
+A runner with no internet egress can only use what is already in its cache.
+A bundle carries a cache from a machine that has egress to one that does not:
+a gzip-compressed tar holding `manifest.json` followed by one member per entry.
+
+    manifest.json
+    entries/gitignore_templates_list.cache
+    entries/gitignore_content_ab23cd45ef678901.cache
+    ...
+
+Entries are copied byte for byte in the cache's own on-disk format, so their
+original write times and TTLs travel with them. The manifest records, per
+entry, the key, kind, write time, TTL, size and sha256; import verifies each
+entry against it before anything reaches the cache. A content entry's manifest
+item also lists its template names, so `cache invalidate` works on imported
+entries too.
+
+Import never extracts the archive. It reads the members named in the manifest
+and hands them to `CacheManager.import_entries`, which writes them under one
+lock with one index append.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import tarfile
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .. import __version__
+from .cache import ENTRY_MAGIC, CacheManager, entry_kind, parse_entry_header
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT = "igntui-cache-bundle"
+BUNDLE_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+
+class BundleError(Exception):
+    """The file is not a bundle this igntui can read."""
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    # Not written because the cached copy is as new or newer.
+    skipped: int = 0
+    corrupt: list[str] = field(default_factory=list)
+    # Passed verification but refused by the cache: unsafe key, malformed
+    # header, or a failed write.
+    rejected: list[str] = field(default_factory=list)
+    created_at: str | None = None
+    igntui_version: str | None = None
+
+
+def export_bundle(cache: CacheManager, path: Path) -> int:
+    """Write every cache entry to a bundle at `path`. Returns the entry count."""
+    manifest_entries = []
+    payloads = []
+    for key, raw in cache.export_entries():
+        try:
+            header = parse_entry_header(raw.split(b"\n", 1)[0])
+        except ValueError:
+            header = None
+        if header is None:
+            logger.warning("Not exporting cache entry %s: malformed header", key)
+            continue
+        timestamp, ttl = header
+        item = {
+            "key": key,
+            "kind": entry_kind(key),
+            "timestamp": timestamp,
+            "ttl": ttl,
+            "size": len(raw),
+            "sha256": hashlib.sha256(raw).hexdigest(),
+        }
+        names = cache.entry_names(key)
+        if names:
+            item["names"] = list(names)
+        manifest_entries.append(item)
+        payloads.append((key, raw))
+
+    manifest = {
+        "format": BUNDLE_FORMAT,
+        "version": BUNDLE_VERSION,
+        "entry_format": ENTRY_MAGIC.decode("ascii"),
+        "igntui_version": __version__,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "entries": manifest_entries,
+    }
+
+    # Written beside the target and renamed, so an interrupted export never
+    # leaves a truncated bundle under the requested name.
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with tarfile.open(tmp_path, "w:gz") as tar:
+            _add_member(tar, MANIFEST_NAME, json.dumps(manifest, indent=1).encode("utf-8"))
+            for key, raw in payloads:
+                _add_member(tar, f"entries/{key}.cache", raw)
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    logger.info("Exported %d cache entries to %s", len(payloads), path)
+    return len(payloads)
+
+
+def import_bundle(cache: CacheManager, path: Path) -> ImportReport:
+    """Load a bundle into `cache`, keeping any entry newer than the bundle's."""
+    try:
+        tar = tarfile.open(path, "r:gz")
+    except (tarfile.TarError, OSError) as e:
+        raise BundleError(f"cannot read {path}: {e}") from e
+
+    with tar:
+        manifest = _read_manifest(tar)
+        report = ImportReport(
+            created_at=manifest.get("created_at"),
+            igntui_version=manifest.get("igntui_version"),
+        )
+        members = {m.name: m for m in tar.getmembers() if m.isfile()}
+        entries = list(_verified_entries(tar, members, manifest["entries"], report))
+        report.imported = cache.import_entries(
+            entries, names=_manifest_names(manifest), rejected=report.rejected
+        )
+        report.skipped = len(entries) - report.imported - len(report.rejected)
+    return report
+
+
+def _read_manifest(tar: tarfile.TarFile) -> dict:
+    try:
+        member = tar.getmember(MANIFEST_NAME)
+        f = tar.extractfile(member)
+        if f is None:
+            raise KeyError(MANIFEST_NAME)
+        manifest = json.loads(f.read())
+    except KeyError as e:
+        raise BundleError("not an igntui cache bundle (no manifest)") from e
+    except (tarfile.TarError, OSError, ValueError) as e:
+        raise BundleError(f"unreadable manifest: {e}") from e
+
+    if not isinstance(manifest, dict) or manifest.get("format") != BUNDLE_FORMAT:
+        raise BundleError("not an igntui cache bundle")
+    version = manifest.get("version")
+    if not isinstance(version, int) or version > BUNDLE_VERSION:
+        raise BundleError(
+            f"bundle version {version!r} is newer than this igntui supports ({BUNDLE_VERSION})"
+        )
+    if not isinstance(manifest.get("entries"), list):
+        raise BundleError("manifest has no entry list")
+    return manifest
+
+
+def _manifest_names(manifest: dict) -> dict[str, list[str]]:
+    names = {}
+    for item in manifest["entries"]:
+        if not isinstance(item, dict) or not isinstance(item.get("names"), list):
+            continue
+        if all(isinstance(n, str) and n.isprintable() and "," not in n for n in item["names"]):
+            names[item.get("key")] = item["names"]
+    return names
+
+
+def _verified_entries(
+    tar: tarfile.TarFile,
+    members: dict[str, tarfile.TarInfo],
+    manifest_entries: list,
+    report: ImportReport,
+) -> Iterator[tuple[str, bytes]]:
+    for item in manifest_entries:
+        key = item.get("key") if isinstance(item, dict) else None
+        if not isinstance(key, str):
+            report.corrupt.append(repr(item))
+            continue
+        member = members.get(f"entries/{key}.cache")
+        f = tar.extractfile(member) if member is not None else None
+        raw = f.read() if f is not None else None
+        if raw is None or hashlib.sha256(raw).hexdigest() != item.get("sha256"):
+            logger.warning("Bundle entry %s is missing or fails its checksum", key)
+            report.corrupt.append(key)
+            continue
+        yield key, raw
+
+
+def _add_member(tar: tarfile.TarFile, name: str, data: bytes) -> None:
+    info = tarfile.TarInfo(name)
+    info.size = len(data)
+    info.mtime = int(time.time())
+    info.mode = 0o644
+    tar.addfile(info, io.BytesIO(data))
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""Metadata index for the disk cache.
+
+`cache info`, `cache stats` and `cache clear --expired` used to learn what was
+on disk by globbing the cache directory, stat-ing every file (twice, for `info`)
+and — for the expiry sweep — json-parsing every entry, multi-KB body included.
+Over tens of thousands of entries that is seconds of work for a summary line.
+
+The index records `(key, size, timestamp, ttl, kind)` per entry in an
+append-only journal next to the entries:
+
+    # igntui cache index v1
+    S	gitignore_templates_list	48213	1714209487.123	3600	list
+    S	gitignore_content_ab23cd45ef678901	5120	1714209490.001	3600	content
+    D	gitignore_content_ab23cd45ef678901
+
+A content entry's record ends with one more field: the template names its key
+was hashed from, comma-separated. Content keys are sha256 prefixes, so this is
+the only way back from a template name to the entries that contain it, which
+is what `cache invalidate <template>` needs:
+
+    S	gitignore_content_0f1e2d3c4b5a6978	9120	1714209491.5	3600	content	node,python
+
+`S` records a write and `D` a removal. A write appends one short line, so it
+stays O(1) however large the cache is; readers replay the journal once per
+process and afterwards only read what other processes have appended since.
+When dead lines outnumber live entries the journal is rewritten in compacted
+form.
+
+A missing journal — a cache written by an older igntui, or one whose index was
+deleted — is rebuilt from the entries on first use. That is the one time the
+directory is scanned.
+"""
+
+import contextlib
+import logging
+import os
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from .file_lock import FileLock
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "cache-index.tsv"
+INDEX_HEADER = "# igntui cache index v1\n"
+
+# Compaction threshold: rewrite once the journal carries this many lines more
+# than twice the live entry count. The constant keeps a tiny cache from being
+# compacted on every other write.
+_COMPACT_SLACK = 256
+
+
+@dataclass(slots=True)
+class IndexEntry:
+    size: int
+    timestamp: float
+    ttl: int
+    kind: str
+    # The (lowercased) template names a content key was derived from.
+    names: tuple[str, ...] = ()
+
+    def expires_at(self) -> float:
+        return self.timestamp + self.ttl
+
+    def to_record(self) -> str:
+        record = f"{self.size}\t{self.timestamp!r}\t{self.ttl}\t{self.kind}"
+        if self.names:
+            record += "\t" + ",".join(self.names)
+        return record
+
+    @classmethod
+    def from_record(cls, record: str) -> "IndexEntry":
+        size, timestamp, ttl, kind, *rest = record.split("\t")
+        if len(rest) > 1:
+            raise ValueError(f"too many fields in {record!r}")
+        return cls(int(size), float(timestamp), int(ttl), kind, _record_names(record))
+
+
+class CacheIndex:
+    def __init__(self, cache_dir: Path, lock: FileLock | None = None):
+        self.path = cache_dir / INDEX_FILENAME
+        # Writers already hold the cache's lock when they append. Compaction
+        # can start from a read, so it takes the lock itself: rewriting the
+        # journal while another process appends to it would lose that append.
+        self._lock = lock
+        # key -> the unparsed `size\ttimestamp\tttl\tkind[\tnames]` tail of its S line.
+        # Replaying the journal only splits off the key; the numbers are parsed
+        # when something asks for them, so counting 50k entries stays cheap.
+        self._records: dict[str, str] = {}
+        # template name -> content keys whose names include it. Built on the
+        # first lookup and kept current after that; most commands never ask.
+        self._by_name: dict[str, set[str]] | None = None
+        self._loaded = False
+        # Where our last read of the journal stopped, and which file it was —
+        # compaction by another process swaps the inode underneath us.
+        self._offset = 0
+        self._inode: int | None = None
+        self._lines = 0
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._records)
+
+    def keys(self) -> list[str]:
+        self.refresh()
+        return list(self._records)
+
+    def items(self) -> Iterator[tuple[str, IndexEntry]]:
+        """Every live entry, catching up with other processes first."""
+        self.refresh()
+        for key, record in list(self._records.items()):
+            try:
+                yield key, IndexEntry.from_record(record)
+            except ValueError:
+                logger.debug("Ignoring malformed cache index record for %r", key)
+
+    def get(self, key: str) -> IndexEntry | None:
+        self.refresh()
+        record = self._records.get(key)
+        if record is None:
+            return None
+        try:
+            return IndexEntry.from_record(record)
+        except ValueError:
+            return None
+
+    def keys_for_name(self, name: str) -> list[str]:
+        """Every live key whose template names include `name` (lowercase)."""
+        self.refresh()
+        if self._by_name is None:
+            self._by_name = {}
+            for key, record in self._records.items():
+                self._track(key, None, record)
+        return list(self._by_name.get(name, ()))
+
+    def record_set(self, key: str, entry: IndexEntry) -> None:
+        self.record_sets([(key, entry)])
+
+    def record_sets(self, items: Iterable[tuple[str, IndexEntry]]) -> None:
+        """One append for a batch of writes — what a bundle import produces."""
+        records = {}
+        for key, entry in items:
+            if _is_indexable(key):
+                records[key] = entry.to_record()
+            else:
+                logger.debug("Not indexing cache key with control characters: %r", key)
+        if not records:
+            return
+        self._append("".join(f"S\t{key}\t{record}\n" for key, record in records.items()))
+        if self._loaded:
+            for key, record in records.items():
+                self._track(key, self._records.get(key), record)
+            self._records.update(records)
+
+    def record_delete(self, key: str) -> None:
+        self.record_deletes([key])
+
+    def record_deletes(self, keys: Iterable[str]) -> None:
+        """One append for a batch of removals — what an expiry sweep produces."""
+        keys = [key for key in keys if _is_indexable(key)]
+        if self._loaded:
+            removed = []
+            for key in keys:
+                record = self._records.pop(key, None)
+                if record is not None:
+                    self._track(key, record, None)
+                    removed.append(key)
+            keys = removed
+        if keys:
+            self._append("".join(f"D\t{key}\n" for key in keys))
+
+    def reset(self) -> None:
+        """Drop every record, e.g. after `cache clear`."""
+        self._records = {}
+        self._by_name = None
+        self._loaded = True
+        self._write_compacted()
+
+    def rebuild(self, scan: Callable[[], Iterable[tuple[str, IndexEntry]]]) -> None:
+        """Replace the index with what `scan` finds on disk."""
+        self._records = {key: entry.to_record() for key, entry in scan() if _is_indexable(key)}
+        self._by_name = None
+        self._loaded = True
+        self._write_compacted()
+        logger.info("Rebuilt cache index with %d entries", len(self._records))
+
+    def refresh(self) -> None:
+        if not self._loaded:
+            self._load_all()
+            return
+
+        try:
+            st = self.path.stat()
+        except OSError:
+            return
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            self._load_all()
+        elif st.st_size > self._offset:
+            self._read_from(self._offset)
+
+    def _load_all(self) -> None:
+        self._records = {}
+        self._by_name = None
+        self._offset = 0
+        self._lines = 0
+        self._loaded = True
+        self._read_from(0)
+        if self._lines > 2 * len(self._records) + _COMPACT_SLACK:
+            with self._lock or contextlib.nullcontext():
+                self._read_from(self._offset)
+                self._write_compacted()
+
+    def _read_from(self, offset: int) -> None:
+        try:
+            with open(self.path, "rb") as f:
+                self._inode = os.fstat(f.fileno()).st_ino
+                f.seek(offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning("Failed to read cache index %s: %s", self.path, e)
+            return
+
+        # A writer in another process may be mid-append; leave any partial
+        # last line for the next refresh.
+        complete = chunk.rfind(b"\n") + 1
+        self._offset = offset + complete
+
+        records = self._records
+        for line in chunk[:complete].decode("utf-8", errors="replace").splitlines():
+            if not line or line[0] == "#":
+                continue
+            self._lines += 1
+            fields = line.split("\t", 2)
+            if fields[0] == "S" and len(fields) == 3:
+                if self._by_name is not None:
+                    self._track(fields[1], records.get(fields[1]), fields[2])
+                records[fields[1]] = fields[2]
+            elif fields[0] == "D" and len(fields) == 2:
+                record = records.pop(fields[1], None)
+                if self._by_name is not None and record is not None:
+                    self._track(fields[1], record, None)
+            else:
+                logger.debug("Ignoring malformed cache index line: %r", line)
+
+    def _track(self, key: str, old: str | None, new: str | None) -> None:
+        """Move `key` in the name map from `old`'s names to `new`'s."""
+        by_name = self._by_name
+        if by_name is None:
+            return
+        for name in _record_names(old) if old else ():
+            keys = by_name.get(name)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del by_name[name]
+        for name in _record_names(new) if new else ():
+            by_name.setdefault(name, set()).add(key)
+
+    def _append(self, text: str) -> None:
+        try:
+            # One write() per record batch in append mode: concurrent appenders
+            # on POSIX land whole lines rather than interleaving bytes. No
+            # O_CREAT: a journal started by an append would hold only that
+            # record, and its existence would stop the rebuild that indexes
+            # every entry already on disk.
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+        except FileNotFoundError:
+            logger.debug("No cache index at %s yet; it is rebuilt on next use", self.path)
+            return
+        except OSError as e:
+            logger.warning("Failed to update cache index %s: %s", self.path, e)
+            return
+        try:
+            try:
+                if os.fstat(fd).st_size == 0:
+                    text = INDEX_HEADER + text
+                os.write(fd, text.encode("utf-8"))
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.warning("Failed to update cache index %s: %s", self.path, e)
+
+    def _write_compacted(self) -> None:
+        data = (
+            INDEX_HEADER + "".join(f"S\t{key}\t{rec}\n" for key, rec in self._records.items())
+        ).encode("utf-8")
+        tmp_path: str | None = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+            tmp_path = None
+            st = self.path.stat()
+            self._inode = st.st_ino
+            self._offset = st.st_size
+            self._lines = len(self._records)
+        except OSError as e:
+            logger.warning("Failed to write cache index %s: %s", self.path, e)
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+
+def _record_names(record: str) -> tuple[str, ...]:
+    fields = record.split("\t")
+    if len(fields) < 5 or not fields[4]:
+        return ()
+    return tuple(fields[4].split(","))
+
+
+def _is_indexable(key: str) -> bool:
+    return "\t" not in key and "\n" not in key and "\r" not in key
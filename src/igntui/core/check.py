@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Drift detection for sidecar-managed files (`igntui check`).
+
+CI wants to fail when a committed `.gitignore` no longer matches the selection
+in its `.igntui.cfg.toml` — someone edited the managed block by hand, or the
+selection changed and nobody regenerated. Answering that must not rewrite
+anything, and must be cheap enough to run on every push over hundreds of
+files.
+
+Each distinct selection is resolved once (normally from the cache) and reduced
+to a sha256 of its content. Each file is then read once, its managed block cut
+out, and hashed the same way; equal digests mean the file is current. No diff
+is computed: the report says *which* files drifted, and `igntui sync` is how to
+fix them.
+"""
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .managed_block import content_digest, extract_managed
+from .sync import SyncTarget, group_by_selection
+
+if TYPE_CHECKING:
+    from .api.types import TemplateSource
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CheckReport:
+    current: list[Path] = field(default_factory=list)
+    # The managed block differs from what the selection generates.
+    drifted: list[Path] = field(default_factory=list)
+    # The output file does not exist.
+    missing: list[Path] = field(default_factory=list)
+    # The output file has no (well-formed) managed block.
+    unmanaged: list[Path] = field(default_factory=list)
+    failed: list[tuple[Path, str]] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return (
+            len(self.current)
+            + len(self.drifted)
+            + len(self.missing)
+            + len(self.unmanaged)
+            + len(self.failed)
+        )
+
+    @property
+    def ok(self) -> bool:
+        return self.total == len(self.current)
+
+
+def check_targets(
+    api: "TemplateSource", targets: Iterable[SyncTarget], report: CheckReport | None = None
+) -> CheckReport:
+    """Compare every target's managed block against its selection's content."""
+    report = report or CheckReport()
+    for selection, group in group_by_selection(targets).items():
+        try:
+            response = api.get_templates(list(group[0].templates))
+        except Exception as e:
+            response = None
+            reason = str(e)
+        else:
+            reason = response.error_message or "empty response"
+        if response is None or not response.success or not response.data.strip():
+            logger.warning("Resolving %s failed: %s", ",".join(selection), reason)
+            report.failed.extend((target.output, reason) for target in group)
+            continue
+
+        expected = content_digest(response.data)
+        for target in group:
+            _compare(target, expected, report)
+
+    for paths in (report.current, report.drifted, report.missing, report.unmanaged):
+        paths.sort()
+    report.failed.sort()
+    return report
+
+
+def _compare(target: SyncTarget, expected: str, report: CheckReport) -> None:
+    try:
+        text = target.output.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        report.missing.append(target.output)
+        return
+    except (OSError, UnicodeDecodeError) as e:
+        report.failed.append((target.output, str(e)))
+        return
+
+    block = extract_managed(text)
+    if block is None:
+        report.unmanaged.append(target.output)
+    elif content_digest(block) == expected:
+        report.current.append(target.output)
+    else:
+        report.drifted.append(target.output)
@@ -5,15 +5,24 @@ Loads `~/.igntui.cfg.toml` by default. Honors environment overrides and
 optional explicit `config_path`. For one release, also auto-migrates the
 v0.0.x JSON file `~/.igntui.json` by reading it and writing TOML in place;
 the legacy file is left on disk for the user to delete.
+
+`config` is the process-wide view every module reads (the API, logging, the
+TUI). It is a stand-in that resolves the cascade (user config, then the repo
+config found from CWD, then the environment) on first use, so importing this
+module reads no files. `configure()` points it at another cascade, which is
+how the CLI applies `--config`. `resolve_config()` builds each cascade at most
+once per process, and again only when one of its files or the environment
+changes.
 """
 
 import copy
 import json
 import logging
 import os
+import threading
 import tomllib
 from pathlib import Path
-from typing import Any, TypedDict
+from typing import Any, TypedDict, cast
 
 import tomli_w
 
@@ -24,6 +33,19 @@ logger = logging.getLogger(__name__)
 USER_CONFIG_FILENAME = ".igntui.cfg.toml"
 LEGACY_USER_CONFIG_FILENAME = ".igntui.json"
 
+# Environment variable -> the config key it overrides.
+ENV_OVERRIDES = {
+    "IGNTUI_API_URL": ("api", "base_url"),
+    "IGNTUI_API_TIMEOUT": ("api", "timeout"),
+    "IGNTUI_CACHE_TTL": ("api", "cache_ttl"),
+    "IGNTUI_NETWORK": ("api", "network"),
+    "IGNTUI_SOCKET": ("api", "daemon_socket"),
+    "IGNTUI_THEME": ("ui", "theme"),
+    "IGNTUI_MOUSE": ("ui", "mouse_support"),
+    "IGNTUI_LOG_LEVEL": ("logging", "level"),
+    "IGNTUI_MAX_RECENT": ("behavior", "max_recent_templates"),
+}
+
 
 class ApiConfig(TypedDict, total=False):
     base_url: str
@@ -31,6 +53,18 @@ class ApiConfig(TypedDict, total=False):
     user_agent: str
     cache_ttl: int
     retry_attempts: int
+    shared_cache_stats: bool
+    network: str
+    circuit_failure_threshold: int
+    circuit_cooldown: int
+    request_deadline: int
+    retry_backoff_max: int
+    retry_after_max: int
+    rate_limit: float
+    rate_limit_burst: int
+    shared_rate_limit: bool
+    negative_cache_ttl: int
+    daemon_socket: str
 
 
 class UiConfig(TypedDict, total=False):
@@ -45,6 +79,7 @@ class UiConfig(TypedDict, total=False):
 class BehaviorConfig(TypedDict, total=False):
     max_recent_templates: int
     auto_refresh_interval: int
+    prefetch: bool
     fuzzy_search_threshold: float
     save_usage_stats: bool
     auto_backup: bool
@@ -74,6 +109,18 @@ class Config:
             "user_agent": f"igntui/{__version__}",
             "cache_ttl": 3600,
             "retry_attempts": 3,
+            "shared_cache_stats": True,
+            "network": "online",
+            "circuit_failure_threshold": 5,
+            "circuit_cooldown": 30,
+            "request_deadline": 30,
+            "retry_backoff_max": 8,
+            "retry_after_max": 10,
+            "rate_limit": 10,
+            "rate_limit_burst": 5,
+            "shared_rate_limit": True,
+            "negative_cache_ttl": 600,
+            "daemon_socket": "",
         },
         "ui": {
             "theme": "default",
@@ -86,6 +133,7 @@ class Config:
         "behavior": {
             "max_recent_templates": 10,
             "auto_refresh_interval": 3600,
+            "prefetch": True,
             "fuzzy_search_threshold": 0.6,
             "save_usage_stats": True,
             "auto_backup": True,
@@ -187,17 +235,7 @@ class Config:
         self._config = merge_dict(self._config, new_config)
 
     def _load_env_overrides(self) -> None:
-        env_mappings = {
-            "IGNTUI_API_URL": ["api", "base_url"],
-            "IGNTUI_API_TIMEOUT": ["api", "timeout"],
-            "IGNTUI_CACHE_TTL": ["api", "cache_ttl"],
-            "IGNTUI_THEME": ["ui", "theme"],
-            "IGNTUI_MOUSE": ["ui", "mouse_support"],
-            "IGNTUI_LOG_LEVEL": ["logging", "level"],
-            "IGNTUI_MAX_RECENT": ["behavior", "max_recent_templates"],
-        }
-
-        for env_var, config_path in env_mappings.items():
+        for env_var, config_path in ENV_OVERRIDES.items():
             value = os.getenv(env_var)
             if value is not None:
                 try:
@@ -285,4 +323,83 @@ class Config:
         return self._config["logging"]
 
 
-config = Config()
+# --- the shared view ------------------------------------------------------------
+
+_lock = threading.Lock()
+# (user path, repo path) -> (file and environment stamp, the Config built from it)
+_resolved: dict[tuple[Path, Path | None], tuple[tuple, Config]] = {}
+# What `config` resolves: an explicit user config path, and whether to look for
+# a repo config from CWD.
+_cascade: tuple[Path | None, bool] = (None, True)
+_shared: Config | None = None
+
+
+def _file_stamp(path: Path | None) -> tuple[int, int] | None:
+    if path is None:
+        return None
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _stamp(user_path: Path, repo_config_path: Path | None) -> tuple:
+    return (
+        _file_stamp(user_path),
+        _file_stamp(repo_config_path),
+        tuple(os.environ.get(name) for name in ENV_OVERRIDES),
+    )
+
+
+def resolve_config(config_path: Path | None = None, repo_config_path: Path | None = None) -> Config:
+    """The `Config` for this cascade, shared with every other caller asking for it.
+
+    The files are parsed again only when one of them changes (by mtime and
+    size) or an `IGNTUI_*` override does; otherwise this is two `stat` calls.
+    """
+    user_path = config_path or Path.home() / USER_CONFIG_FILENAME
+    key = (user_path, repo_config_path)
+    with _lock:
+        entry = _resolved.get(key)
+        if entry is not None and entry[0] == _stamp(user_path, repo_config_path):
+            return entry[1]
+        resolved = Config(config_path=user_path, repo_config_path=repo_config_path)
+        # Stamped after loading: migrating the legacy JSON writes the user file.
+        _resolved[key] = (_stamp(user_path, repo_config_path), resolved)
+        return resolved
+
+
+def configure(config_path: Path | None = None, discover_repo_config: bool = True) -> None:
+    """Point `config` at a cascade; it is resolved on the next read, not here."""
+    global _cascade, _shared
+    with _lock:
+        _cascade = (config_path, discover_repo_config)
+        _shared = None
+
+
+def get_config() -> Config:
+    """The process-wide configuration, resolved on first use and kept after that."""
+    global _shared
+    if _shared is None:
+        config_path, discover = _cascade
+        repo_config_path = None
+        if discover:
+            from .repo_config import find_repo_config
+
+            repo_config_path = find_repo_config()
+        _shared = resolve_config(config_path, repo_config_path)
+    return _shared
+
+
+class _SharedConfig:
+    """Forwards to `get_config()`, so `from .config import config` reads nothing."""
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_config(), name)
+
+    def __repr__(self) -> str:
+        return f"<shared {get_config()!r}>"
+
+
+config = cast(Config, _SharedConfig())
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""Opt-in long-running igntui process behind a local socket (`igntui serve`).
+
+Every `igntui list` or `igntui generate` pays interpreter startup, config load
+and cache setup, then reads the catalogue or a content entry back off disk and
+decodes it — all to answer a question the previous invocation already answered.
+Scripts and editor integrations ask that question dozens of times a minute. A
+daemon started with `igntui serve --socket` keeps the catalogue and recently
+used content in memory, and the CLI hands `list`, `generate` and `check` to it
+whenever its socket exists. Shell completion never asks: it reads
+`catalogue.txt` straight from the shell.
+
+Clients find the daemon at `socket_path()` only. A daemon started on another
+path is reachable once `api.daemon_socket` (`IGNTUI_SOCKET`) names that path.
+
+The protocol is newline-delimited JSON over a Unix domain socket: one request
+object per line, one reply object per line, any number per connection. Every
+request carries `v` (the protocol version) and `op`:
+
+    ping                                 -> {"ok": true, "version", "pid"}
+    list    {network, force_refresh}     -> {"ok": true, "response": APIResponse}
+    get     {templates, network, force_refresh} -> same
+    flush                                -> {"ok": true, "dropped": N}
+
+A failure is `{"ok": false, "error": "..."}`. Requests name their own network
+policy, so a `--network offline` CLI is answered offline; the daemon keeps one
+`GitIgnoreAPI` per policy, all over the same cache.
+
+Falling back is the client's job: a missing socket, a refused connection, a
+daemon that dies mid-request or one speaking another protocol version all turn
+into the same in-process execution the CLI would have done without it.
+"""
+
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from collections.abc import Callable
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, cast
+
+from .. import __version__
+from .api.policy import NETWORK_POLICIES
+from .api.response import APIResponse
+from .config import config
+
+if TYPE_CHECKING:
+    from .api.client import GitIgnoreAPI
+
+logger = logging.getLogger(__name__)
+
+PROTOCOL_VERSION = 1
+SOCKET_FILENAME = "daemon.sock"
+DEFAULT_TIMEOUT = 60.0
+# Requests are a few names long; anything bigger is not a client of ours.
+_MAX_REQUEST = 64 * 1024
+# Entries the daemon keeps decoded in memory. Each distinct selection is its
+# own entry, so a daemon that runs for weeks would otherwise hold them all.
+MEMORY_ENTRIES = 256
+
+
+class DaemonError(Exception):
+    """The daemon answered, but refused or failed the request."""
+
+
+class DaemonUnavailable(Exception):
+    """No usable daemon behind the socket; the caller should work in-process."""
+
+
+def socket_path() -> Path:
+    """Where the daemon listens: `api.daemon_socket` (`IGNTUI_SOCKET`), else the cache dir."""
+    configured = config.get("api", "daemon_socket", default="")
+    if configured:
+        return Path(configured).expanduser()
+    return config.get_cache_dir() / SOCKET_FILENAME
+
+
+def supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+# --- server -------------------------------------------------------------------
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def setup(self) -> None:
+        super().setup()
+        cast(DaemonServer, self.server).track(self.connection, active=True)
+
+    def finish(self) -> None:
+        cast(DaemonServer, self.server).track(self.connection, active=False)
+        super().finish()
+
+    def handle(self) -> None:
+        while True:
+            line = self.rfile.readline(_MAX_REQUEST + 1)
+            if not line:
+                return
+            if len(line) > _MAX_REQUEST:
+                self._reply({"ok": False, "error": "request too large"})
+                return
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                self._reply({"ok": False, "error": f"malformed request: {e}"})
+                return
+            self._reply(cast(DaemonServer, self.server).dispatch(request))
+
+    def _reply(self, reply: dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(reply, separators=(",", ":")).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+if TYPE_CHECKING or supported():
+
+    class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+else:  # pragma: no cover - Windows without AF_UNIX
+    _UnixServer = object
+
+
+class DaemonServer(_UnixServer):
+    """Serve the protocol on `path` until `shutdown()`.
+
+    The socket is created owner-only (mode 0600): it answers with whatever the
+    owner's cache holds, and nobody else has any business asking.
+    """
+
+    def __init__(self, path: Path, api: "GitIgnoreAPI | None" = None):
+        if not supported():
+            raise DaemonError("Unix domain sockets are not available on this platform")
+        self.path = Path(path)
+        if api is None:
+            from .api.client import GitIgnoreAPI
+
+            api = GitIgnoreAPI()
+        api.cache_manager.memory_limit = MEMORY_ENTRIES
+        self._base = api
+        self._apis: dict[str, GitIgnoreAPI] = {self._base.network_policy: self._base}
+        self._apis_lock = threading.Lock()
+        self._connections: set[socket.socket] = set()
+        self._connections_lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.path), _Handler)
+        finally:
+            os.umask(old_umask)
+        self._inode = self.path.stat().st_ino
+
+    def warm(self) -> None:
+        """Load the catalogue into memory before the first client asks for it."""
+        response = self._base.list_templates()
+        if response.success:
+            logger.info("Catalogue loaded: %d templates", len(response.data))
+        else:
+            logger.warning("Could not load the catalogue: %s", response.error_message)
+
+    def track(self, connection: socket.socket, active: bool) -> None:
+        with self._connections_lock:
+            if active:
+                self._connections.add(connection)
+            else:
+                self._connections.discard(connection)
+
+    def server_close(self) -> None:
+        super().server_close()
+        # Clients keep connections open between requests; end them so each
+        # falls back at once instead of talking to a daemon that has stopped.
+        with self._connections_lock:
+            connections, self._connections = self._connections, set()
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        # Only remove the socket if it is still ours: a second daemon may have
+        # replaced a socket it judged stale.
+        try:
+            if self.path.stat().st_ino == self._inode:
+                self.path.unlink()
+        except OSError:
+            pass
+
+    def api_for(self, policy: str | None) -> "GitIgnoreAPI":
+        if policy is None:
+            return self._base
+        if policy not in NETWORK_POLICIES:
+            raise DaemonError(f"unknown network policy {policy!r}")
+        with self._apis_lock:
+            api = self._apis.get(policy)
+            if api is None:
+                from .api.client import GitIgnoreAPI
+
+                api = GitIgnoreAPI(cache_manager=self._base.cache_manager)
+                api.network_policy = policy
+                self._apis[policy] = api
+            return api
+
+    def dispatch(self, request: dict[str, Any]) -> dict[str, Any]:
+        if request.get("v") != PROTOCOL_VERSION:
+            return {"ok": False, "error": f"unsupported protocol version {request.get('v')!r}"}
+        op = request.get("op")
+        try:
+            if op == "ping":
+                return {"ok": True, "version": __version__, "pid": os.getpid()}
+            if op == "flush":
+                return {"ok": True, "dropped": self._base.cache_manager.drop_memory()}
+
+            api = self.api_for(request.get("network"))
+            force_refresh = bool(request.get("force_refresh", False))
+            if op == "list":
+                response = api.list_templates(force_refresh=force_refresh)
+                return {"ok": True, "response": asdict(response)}
+            if op == "get":
+                templates = request.get("templates")
+                if not isinstance(templates, list) or not all(
+                    isinstance(t, str) for t in templates
+                ):
+                    raise DaemonError("'templates' must be a list of names")
+                response = api.get_templates(templates, force_refresh=force_refresh)
+                return {"ok": True, "response": asdict(response)}
+        except DaemonError as e:
+            return {"ok": False, "error": str(e)}
+        except Exception as e:
+            logger.exception("Daemon request %r failed", op)
+            return {"ok": False, "error": str(e)}
+        return {"ok": False, "error": f"unknown op {op!r}"}
+
+
+# --- client -------------------------------------------------------------------
+
+
+class DaemonClient:
+    """The part of `GitIgnoreAPI` the CLI uses, answered by a running daemon.
+
+    Attributes the commands read or set (`network_policy`,
+    `force_refresh_default`) travel with each request. The first time the
+    daemon cannot be reached, the client builds an in-process API with
+    `fallback()` and sends everything there from then on. Safe to share
+    between threads, though requests over the one connection go one at a time.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fallback: Callable[[], "GitIgnoreAPI"],
+        network_policy: str = "online",
+        force_refresh_default: bool = False,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.path = Path(path)
+        self.network_policy = network_policy
+        self.force_refresh_default = force_refresh_default
+        self.timeout = timeout
+        self._fallback = fallback
+        self._local: GitIgnoreAPI | None = None
+        self._sock: socket.socket | None = None
+        self._file: BinaryIO | None = None
+        self._lock = threading.Lock()
+        self._fallback_lock = threading.Lock()
+
+    @property
+    def local(self) -> "GitIgnoreAPI | None":
+        """The in-process API, once the client has fallen back to it."""
+        return self._local
+
+    def list_templates(
+        self, force_refresh: bool = False, cancel: threading.Event | None = None
+    ) -> APIResponse:
+        if self._local is None:
+            try:
+                return self._response("list", force_refresh=force_refresh)
+            except DaemonUnavailable:
+                pass
+        return self._fall_back().list_templates(force_refresh=force_refresh, cancel=cancel)
+
+    def get_templates(
+        self,
+        technologies: list[str],
+        force_refresh: bool = False,
+        cancel: threading.Event | None = None,
+    ) -> APIResponse:
+        if self._local is None:
+            try:
+                return self._response(
+                    "get", templates=list(technologies), force_refresh=force_refresh
+                )
+            except DaemonUnavailable:
+                pass
+        return self._fall_back().get_templates(
+            technologies, force_refresh=force_refresh, cancel=cancel
+        )
+
+    def ping(self) -> dict[str, Any]:
+        return self.request({"op": "ping"})
+
+    def request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Send one request and return the reply; `DaemonUnavailable` if nothing answers."""
+        payload = json.dumps({"v": PROTOCOL_VERSION, **request}, separators=(",", ":"))
+        with self._lock:
+            # One retry covers a kept-open connection the daemon closed since.
+            for attempt in range(2):
+                reused = self._sock is not None
+                try:
+                    sock, file = self._sock, self._file
+                    if sock is None or file is None:
+                        sock, file = self._connect()
+                    sock.sendall(payload.encode("utf-8") + b"\n")
+                    line = file.readline()
+                    if not line:
+                        raise ConnectionError("daemon closed the connection")
+                except OSError as e:
+                    self._disconnect()
+                    if reused and attempt == 0:
+                        continue
+                    raise DaemonUnavailable(str(e)) from e
+                break
+        try:
+            reply = json.loads(line)
+        except ValueError as e:
+            raise DaemonUnavailable(f"malformed reply: {e}") from e
+        if not isinstance(reply, dict):
+            raise DaemonUnavailable("malformed reply")
+        if not reply.get("ok"):
+            error = str(reply.get("error", "request failed"))
+            if error.startswith("unsupported protocol version"):
+                raise DaemonUnavailable(error)
+            raise DaemonError(error)
+        return reply
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _response(self, op: str, **fields: Any) -> APIResponse:
+        fields["force_refresh"] = fields.get("force_refresh") or self.force_refresh_default
+        reply = self.request({"op": op, "network": self.network_policy, **fields})
+        try:
+            return APIResponse(**reply["response"])
+        except (KeyError, TypeError) as e:
+            raise DaemonUnavailable(f"malformed reply: {e}") from e
+
+    def _fall_back(self) -> "GitIgnoreAPI":
+        # Workers that lose the daemon together must still build one API, and
+        # none may use it before its policy is set.
+        with self._fallback_lock:
+            if self._local is None:
+                logger.debug("No daemon at %s; working in-process", self.path)
+                local = self._fallback()
+                local.network_policy = self.network_policy
+                local.force_refresh_default = self.force_refresh_default
+                self._local = local
+                self.close()
+            return self._local
+
+    def _connect(self) -> tuple[socket.socket, BinaryIO]:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.path))
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._file = sock.makefile("rb")
+        return self._sock, self._file
+
+    def _disconnect(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+
+def connect(
+    fallback: Callable[[], "GitIgnoreAPI"],
+    network_policy: str,
+    force_refresh_default: bool = False,
+) -> DaemonClient | None:
+    """A client for the daemon, or None when no socket exists to talk to.
+
+    Only the socket's existence is checked — one `stat`, no connection — so a
+    CLI with no daemon running pays nothing for the possibility of one.
+    """
+    if not supported():
+        return None
+    path = socket_path()
+    if not path.exists():
+        return None
+    return DaemonClient(
+        path,
+        fallback=fallback,
+        network_policy=network_policy,
+        force_refresh_default=force_refresh_default,
+    )
+
+
+def notify_flush() -> bool:
+    """Tell a running daemon to drop its in-memory cache; whether one listened.
+
+    Called after `igntui cache clear`, `import` and `invalidate`, which change
+    the disk cache underneath a daemon that would otherwise keep serving its
+    in-memory copies until they expire.
+    """
+    if not supported() or not socket_path().exists():
+        return False
+    from .api.client import GitIgnoreAPI
+
+    client = DaemonClient(socket_path(), fallback=GitIgnoreAPI, timeout=2.0)
+    try:
+        client.request({"op": "flush"})
+    except (DaemonUnavailable, DaemonError) as e:
+        logger.debug("Daemon flush failed: %s", e)
+        return False
+    finally:
+        client.close()
+    return True
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Advisory inter-process file lock.
+
+Several igntui processes share `~/.cache/igntui` — parallel CI jobs, a TUI in
+one terminal and `igntui generate` in another. A `threading.RLock` only orders
+threads inside one process, so anything that must not interleave across
+processes (a cache write and its index append, an expiry sweep) takes this lock
+as well.
+
+The lock is `fcntl.flock` on a dedicated lock file. It is advisory: it orders
+igntui processes among themselves and nothing else. Where `fcntl` does not
+exist (Windows) the lock degrades to in-process only; cache writes are still
+atomic renames there, so readers never see a partial entry, but two processes
+can race on the same key and the last rename wins.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+    logger.debug("fcntl not available - file locks are process-local only")
+
+
+class FileLock:
+    """Reentrant exclusive lock held on `path` across processes.
+
+    `flock` locks belong to an open file description, so a second `open()` of
+    the same file in the same process would block on the first. The lock is
+    therefore reentrant: nested acquisitions by the owning thread only bump a
+    counter, and the file is locked once.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: int | None = None
+
+    def acquire(self) -> None:
+        self._thread_lock.acquire()
+        self._depth += 1
+        if self._depth > 1 or not HAS_FCNTL:
+            return
+        try:
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        except OSError as e:
+            # An unlockable cache dir (read-only mount, exotic filesystem) must
+            # not take the command down; fall back to in-process ordering.
+            logger.warning("Could not lock %s: %s", self.path, e)
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def release(self) -> None:
+        self._depth -= 1
+        try:
+            if self._depth == 0 and self._fd is not None:
+                try:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+                finally:
+                    os.close(self._fd)
+                    self._fd = None
+        finally:
+            self._thread_lock.release()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
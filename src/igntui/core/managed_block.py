@@ -17,6 +17,7 @@ verbatim, so anything you add survives regeneration. Text outside both regions
 is preserved too.
 """
 
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
@@ -92,6 +93,28 @@ def extract_custom(existing: str | None) -> str:
     return ""
 
 
+def extract_managed(existing: str | None) -> str | None:
+    """The generated content between the managed markers, or None without them."""
+    if not existing:
+        return None
+    begin = existing.find(BEGIN_MARKER)
+    if begin == -1:
+        return None
+    body_start = begin + len(BEGIN_MARKER)
+    end = existing.find(END_MARKER, body_start)
+    if end == -1:
+        return None
+    return existing[body_start:end].strip("\n")
+
+
+def content_digest(content: str) -> str:
+    """sha256 of generated content as `wrap` writes it, for comparing blocks.
+
+    `extract_managed(merge(x, content))` digests the same as `content`.
+    """
+    return hashlib.sha256(content.strip("\n").encode("utf-8")).hexdigest()
+
+
 def _strip_block(text: str, begin_marker: str, end_marker: str) -> str:
     """Remove one marked region from `text`, leaving the surrounding lines."""
     begin = text.find(begin_marker)
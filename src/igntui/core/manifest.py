@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Batch generation from a manifest file (`igntui generate --manifest`).
+
+A manifest lists outputs and the templates for each, in TOML:
+
+    [[output]]
+    path = "services/api/.gitignore"
+    templates = ["python", "docker"]
+
+    [[output]]
+    path = "web/.gitignore"
+    templates = ["node", "macos"]
+
+Paths are relative to the manifest's directory and must stay inside it. The
+entries become `SyncTarget`s, so they are fetched, merged and written the way
+`igntui sync` does it: each distinct selection once, in one pool.
+"""
+
+import tomllib
+from pathlib import Path
+
+from .sync import SyncTarget
+
+
+class ManifestError(ValueError):
+    """The manifest can't be read, or one of its entries is malformed."""
+
+
+def load_manifest(path: Path) -> list[SyncTarget]:
+    """The manifest's entries, in file order. Raises `ManifestError`."""
+    try:
+        with open(path, "rb") as f:
+            data = tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        raise ManifestError(f"cannot read {path}: {e}") from e
+
+    entries = data.get("output")
+    if not isinstance(entries, list) or not entries:
+        raise ManifestError(f"{path} has no [[output]] entries")
+
+    directory = path.parent
+    targets: list[SyncTarget] = []
+    seen: dict[Path, int] = {}
+    for number, entry in enumerate(entries, 1):
+        where = f"{path}: [[output]] #{number}"
+        if not isinstance(entry, dict):
+            raise ManifestError(f"{where} is not a table")
+        output = entry.get("path")
+        templates = entry.get("templates")
+        if not isinstance(output, str) or not output.strip():
+            raise ManifestError(f"{where} needs a `path`")
+        if (
+            not isinstance(templates, list)
+            or not templates
+            or not all(isinstance(t, str) and t.strip() for t in templates)
+        ):
+            raise ManifestError(f"{where} needs a non-empty list of `templates`")
+
+        target = directory / output
+        resolved = target.resolve()
+        # As with sidecars, a manifest only writes below its own directory.
+        if not resolved.is_relative_to(directory.resolve()):
+            raise ManifestError(f"{where}: path {output!r} leaves the manifest's directory")
+        if resolved in seen:
+            raise ManifestError(f"{where}: {output!r} is already entry #{seen[resolved]}")
+        seen[resolved] = number
+        targets.append(SyncTarget(sidecar=path, output=target, templates=templates))
+    return targets
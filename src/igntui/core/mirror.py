@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""A gitignore.io-compatible HTTP server backed by the local cache (`igntui mirror serve`).
+
+An air-gapped network can carry a cache in with a bundle, but then every
+machine on it needs the bundle. A mirror lets one machine serve it instead:
+point `IGNTUI_API_URL` (or `api.base_url`) at `http://host:port` and any igntui
+talks to it exactly as it would to gitignore.io.
+
+    GET /list            the catalogue, comma-separated, as gitignore.io sends it
+    GET /a,b,c           the content for that selection
+    GET /_mirror/stats   per-endpoint request counts and latency, as JSON
+
+A selection that is cached as a whole is served as cached. Otherwise the body
+is composed from the cached single-template entries: each entry's own
+`# Created by` / `# End of` framing is stripped, and the fragments are joined
+under framing for the whole selection, the way gitignore.io builds it. Names
+missing from the catalogue get gitignore.io's own 404 body, so clients
+negative-cache them as usual. A catalogued name with no cached fragment is
+also a 404, with a reason phrase saying so.
+
+Bodies carry a strong ETag (`If-None-Match` answers 304) and are gzipped for
+clients that accept it. Nothing in a response depends on the clock, so a mirror
+over a fixed cache is also a deterministic stand-in for tests and benchmarks.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, cast
+
+from .cache import TEMPLATE_LIST_KEY, CacheManager, TemplateCache, content_key
+
+logger = logging.getLogger(__name__)
+
+STATS_PATH = "/_mirror/stats"
+# Composed bodies worth keeping; a mirror mostly serves the same few selections.
+_MEMO_SIZE = 256
+# Latency samples kept per endpoint for the percentiles.
+_SAMPLES = 1024
+# Smaller bodies are not worth a gzip header and a compression pass.
+_GZIP_MIN = 256
+
+_DEFAULT_ORIGIN = "https://www.toptal.com/developers/gitignore"
+_VALID_NAME_RE = re.compile(r"^[A-Za-z0-9_+.-]+$")
+_CREATED_RE = re.compile(r"^# Created by (\S+)/api/\S*$", re.MULTILINE)
+_FRAMING = ("# Created by ", "# Edit at ", "# End of ")
+
+# The index timestamps of the entries a composed body was built from.
+_Version = tuple[float | None, ...]
+
+
+@dataclass(frozen=True)
+class MirrorResponse:
+    status: int
+    body: bytes
+    reason: str | None = None
+    content_type: str = "text/plain; charset=utf-8"
+
+    @property
+    def etag(self) -> str:
+        return '"' + hashlib.sha256(self.body).hexdigest()[:32] + '"'
+
+
+class MirrorSource:
+    """Turn request paths into responses from a cache; safe to share between threads.
+
+    Composed bodies are memoized against the timestamps of the entries they
+    were built from, as the cache index records them, so an entry rewritten
+    by another process (`igntui cache warm`, an import) is served fresh on the
+    next request. For the same reason the cache's own memory layer is turned
+    off: it would keep answering with the copy it read first.
+    """
+
+    def __init__(self, cache_manager: CacheManager):
+        cache_manager.memory_limit = 0
+        self.cache_manager = cache_manager
+        self.template_cache = TemplateCache(cache_manager)
+        self._memo: OrderedDict[tuple[str, ...], tuple[_Version, MirrorResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def listing(self) -> MirrorResponse:
+        catalogue = self.template_cache.get_template_list(allow_stale=True)
+        if catalogue is None:
+            return MirrorResponse(404, b"", reason="No catalogue in this mirror's cache")
+        return MirrorResponse(200, (",".join(catalogue) + "\n").encode("utf-8"))
+
+    def content(self, selection: str) -> MirrorResponse:
+        names = list(dict.fromkeys(n.strip() for n in selection.split(",") if n.strip()))
+        key = tuple(n.lower() for n in names)
+        version = self._version(names)
+        with self._lock:
+            memoized = self._memo.get(key)
+            if memoized is not None and memoized[0] == version:
+                self._memo.move_to_end(key)
+                return memoized[1]
+
+        response = self._resolve(names)
+        with self._lock:
+            if response.status == 200:
+                self._memo[key] = (version, response)
+                self._memo.move_to_end(key)
+                while len(self._memo) > _MEMO_SIZE:
+                    self._memo.popitem(last=False)
+            else:
+                self._memo.pop(key, None)
+        return response
+
+    def _version(self, names: list[str]) -> _Version:
+        """When each entry a body for `names` can be built from was last written."""
+        keys = [TEMPLATE_LIST_KEY, content_key(names)]
+        if len(names) > 1:
+            keys.extend(content_key([name]) for name in names)
+        return tuple(self.cache_manager.entry_timestamp(key) for key in keys)
+
+    def _resolve(self, names: list[str]) -> MirrorResponse:
+        catalogue = self.template_cache.get_template_list(allow_stale=True, record_stats=False)
+        known = {name.lower() for name in catalogue} if catalogue is not None else None
+        undefined = [
+            name
+            for name in names
+            if not _VALID_NAME_RE.match(name) or (known is not None and name.lower() not in known)
+        ]
+        if not names or undefined:
+            return _undefined(undefined or ["(empty)"])
+
+        whole = self.template_cache.get_template_content(names, allow_stale=True)
+        if whole is not None:
+            return MirrorResponse(200, whole.encode("utf-8"))
+
+        fragments = []
+        origin = None
+        missing = []
+        for name in names:
+            body = self.template_cache.get_template_content([name], allow_stale=True)
+            if body is None:
+                missing.append(name)
+                continue
+            if origin is None:
+                match = _CREATED_RE.search(body)
+                origin = match.group(1) if match else None
+            fragments.append(_unframed(body))
+        if missing:
+            return MirrorResponse(
+                404, b"", reason=f"Not in this mirror's cache: {', '.join(missing)}"
+            )
+        return MirrorResponse(200, _framed(names, fragments, origin or _DEFAULT_ORIGIN))
+
+
+def _undefined(names: list[str]) -> MirrorResponse:
+    # gitignore.io's wording; clients parse the names out of it.
+    lines = [
+        f"#!! ERROR: {name} is undefined. Use list command to see defined gitignore types !!#"
+        for name in names
+    ]
+    return MirrorResponse(404, ("\n".join(lines) + "\n").encode("utf-8"))
+
+
+def _unframed(body: str) -> str:
+    lines = [line for line in body.splitlines() if not line.startswith(_FRAMING)]
+    return "\n".join(lines).strip("\n")
+
+
+def _framed(names: list[str], fragments: list[str], origin: str) -> bytes:
+    joined = ",".join(name.lower() for name in names)
+    text = (
+        f"# Created by {origin}/api/{joined}\n"
+        f"# Edit at {origin}?templates={joined}\n\n"
+        + "\n\n".join(fragments)
+        + f"\n\n# End of {origin}/api/{joined}\n"
+    )
+    return text.encode("utf-8")
+
+
+# --- latency ------------------------------------------------------------------
+
+
+@dataclass
+class EndpointStats:
+    count: int = 0
+    errors: int = 0
+    total: float = 0.0
+    slowest: float = 0.0
+    samples: deque[float] = field(default_factory=lambda: deque(maxlen=_SAMPLES))
+
+    def record(self, seconds: float, ok: bool) -> None:
+        self.count += 1
+        self.errors += 0 if ok else 1
+        self.total += seconds
+        self.slowest = max(self.slowest, seconds)
+        self.samples.append(seconds)
+
+    def summary(self) -> dict[str, Any]:
+        ordered = sorted(self.samples)
+
+        def percentile(p: float) -> float:
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))] if ordered else 0.0
+
+        return {
+            "requests": self.count,
+            "errors": self.errors,
+            "mean_ms": round(1000 * self.total / max(1, self.count), 3),
+            "p50_ms": round(1000 * percentile(0.50), 3),
+            "p95_ms": round(1000 * percentile(0.95), 3),
+            "max_ms": round(1000 * self.slowest, 3),
+        }
+
+
+class LatencyStats:
+    def __init__(self):
+        self._endpoints: dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float, ok: bool) -> None:
+        with self._lock:
+            self._endpoints.setdefault(endpoint, EndpointStats()).record(seconds, ok)
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            return {name: stats.summary() for name, stats in sorted(self._endpoints.items())}
+
+
+# --- server -------------------------------------------------------------------
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive, which igntui's async client pools connections for.
+    protocol_version = "HTTP/1.1"
+    server_version = "igntui-mirror"
+
+    def do_GET(self) -> None:
+        self._serve(head=False)
+
+    def do_HEAD(self) -> None:
+        self._serve(head=True)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _serve(self, head: bool) -> None:
+        start = time.perf_counter()
+        server = cast(MirrorServer, self.server)
+        path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        if path == "/list":
+            endpoint, response = "list", server.source.listing()
+        elif path == STATS_PATH:
+            body = json.dumps(server.stats.summary(), indent=2, sort_keys=True)
+            endpoint = "stats"
+            response = MirrorResponse(
+                200, body.encode("utf-8") + b"\n", content_type="application/json"
+            )
+        elif path.count("/") == 1 and len(path) > 1:
+            endpoint, response = "templates", server.source.content(path[1:])
+        else:
+            endpoint, response = "other", MirrorResponse(404, b"", reason="Not Found")
+
+        self._send(response, head)
+        server.stats.record(endpoint, time.perf_counter() - start, response.status < 400)
+
+    def _send(self, response: MirrorResponse, head: bool) -> None:
+        etag = response.etag
+        if response.status == 200 and etag in _etags(self.headers.get("If-None-Match", "")):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = response.body
+        gzipped = len(body) >= _GZIP_MIN and _accepts_gzip(self.headers.get("Accept-Encoding", ""))
+        if gzipped:
+            body = gzip.compress(body, mtime=0)
+        self.send_response(response.status, response.reason)
+        self.send_header("Content-Type", response.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Vary", "Accept-Encoding")
+        if response.status == 200:
+            self.send_header("ETag", etag)
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+
+
+def _etags(header: str) -> set[str]:
+    return {tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()}
+
+
+def _accepts_gzip(header: str) -> bool:
+    for coding in header.split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
+
+
+class MirrorServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], cache_manager: CacheManager):
+        self.source = MirrorSource(cache_manager)
+        self.stats = LatencyStats()
+        super().__init__(address, _Handler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Regenerate every sidecar-managed `.gitignore` under a tree (`igntui sync`).
+
+A monorepo with a `.igntui.cfg.toml` in each of a few hundred directories used
+to be kept current by running `igntui generate` once per directory, paying
+interpreter startup, config load and cache setup every time. `sync` does it in
+one process:
+
+1. Discover the sidecars with an `os.scandir` walk that never descends into
+   VCS metadata, dependency trees or virtualenvs, and never follows symlinks.
+2. Group the targets by selection (compared the way the content cache key
+   does), so a selection shared by forty directories is fetched once.
+3. Fetch the unique selections, then merge each result into its file with
+   `managed_block.merge` and write it, `jobs` at a time. Files are replaced
+   through a temporary file and a rename, so a reader never sees half of one.
+   A file whose merged text is already on disk is left alone, mtime included.
+
+`generate --manifest` hands the same machinery targets read from a manifest
+file instead of from sidecars (see `manifest.py`).
+
+Sidecars are read, never rewritten: their `generated_at` would otherwise churn
+on every run.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .managed_block import merge
+from .project_config import LEGACY_SIDECAR_FILENAME, SIDECAR_FILENAME, ProjectConfig
+
+if TYPE_CHECKING:
+    from .api.client import GitIgnoreAPI
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOBS = 8
+
+# Directories that never hold a project's own sidecar, and can hold a great
+# many files. Other dot-directories are walked: `.github/` is a project too.
+PRUNED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".tox",
+        ".nox",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+    }
+)
+
+
+@dataclass
+class SyncTarget:
+    sidecar: Path
+    output: Path
+    templates: list[str]
+
+    @property
+    def selection(self) -> tuple[str, ...]:
+        return tuple(sorted({t.strip().lower() for t in self.templates if t.strip()}))
+
+
+@dataclass
+class SyncReport:
+    changed: list[Path] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+    # (sidecar or output path, reason)
+    failed: list[tuple[Path, str]] = field(default_factory=list)
+    selections: int = 0
+    # output path -> (seconds fetching its selection, seconds merging and writing)
+    timings: dict[Path, tuple[float, float]] = field(default_factory=dict)
+
+
+def find_sidecars(root: Path) -> list[Path]:
+    """Every sidecar under `root`, sorted; one per directory.
+
+    Where a directory has both the current and the legacy file name, the
+    current one wins, as it does for `find_sidecar`.
+    """
+    found: list[Path] = []
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as e:
+            logger.warning("Skipping unreadable directory %s: %s", directory, e)
+            continue
+        names = set()
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in PRUNED_DIRS:
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    names.add(entry.name)
+            except OSError:
+                continue
+        for name in (SIDECAR_FILENAME, LEGACY_SIDECAR_FILENAME):
+            if name in names:
+                found.append(Path(directory, name))
+                break
+    return sorted(found)
+
+
+def load_targets(sidecars: Iterable[Path], failed: list[tuple[Path, str]]) -> list[SyncTarget]:
+    """The target each sidecar describes; unusable sidecars go to `failed`."""
+    targets = []
+    for sidecar in sidecars:
+        config = ProjectConfig.load(sidecar)
+        if config is None:
+            failed.append((sidecar, "unreadable sidecar"))
+            continue
+        if not config.templates:
+            failed.append((sidecar, "no templates selected"))
+            continue
+        directory = sidecar.parent
+        output = directory / config.output_path
+        # A sidecar describes its own directory; one naming a file elsewhere
+        # (absolute, or climbing out with `..`) is not followed.
+        if not output.resolve().is_relative_to(directory.resolve()):
+            failed.append((sidecar, f"output path {config.output_path!r} leaves its directory"))
+            continue
+        targets.append(SyncTarget(sidecar=sidecar, output=output, templates=config.templates))
+    return targets
+
+
+def group_by_selection(targets: Iterable[SyncTarget]) -> dict[tuple[str, ...], list[SyncTarget]]:
+    by_selection: dict[tuple[str, ...], list[SyncTarget]] = {}
+    for target in targets:
+        by_selection.setdefault(target.selection, []).append(target)
+    return by_selection
+
+
+def sync_targets(
+    api: "GitIgnoreAPI",
+    targets: list[SyncTarget],
+    report: SyncReport | None = None,
+    jobs: int = DEFAULT_JOBS,
+    dry_run: bool = False,
+    progress: Callable[[SyncReport], None] | None = None,
+) -> SyncReport:
+    """Fetch each distinct selection once, then merge and write every target.
+
+    With `dry_run`, files are compared but not written; `changed` then lists
+    what would change. `progress` is called from the calling thread as each
+    file is done.
+    """
+    report = report or SyncReport()
+    by_selection = group_by_selection(targets)
+    report.selections = len(by_selection)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="igntui-sync") as pool:
+        fetches = {
+            pool.submit(_timed, api.get_templates, list(group[0].templates)): selection
+            for selection, group in by_selection.items()
+        }
+        writes = []
+        fetch_seconds: dict[tuple[str, ...], float] = {}
+        for future in as_completed(fetches):
+            selection = fetches[future]
+            group = by_selection[selection]
+            try:
+                response, fetch_seconds[selection] = future.result()
+            except Exception as e:
+                response = None
+                reason = str(e)
+            else:
+                reason = response.error_message or "empty response"
+            if response is None or not response.success or not response.data.strip():
+                logger.warning("Fetching %s failed: %s", ",".join(selection), reason)
+                report.failed.extend((target.output, reason) for target in group)
+                continue
+            writes.extend(
+                (target, pool.submit(_timed, _write_target, target, response.data, dry_run))
+                for target in group
+            )
+
+        for target, future in writes:
+            try:
+                changed, write_seconds = future.result()
+            except (OSError, UnicodeDecodeError) as e:
+                # One unreadable file fails its own target, not the run.
+                report.failed.append((target.output, str(e)))
+            else:
+                (report.changed if changed else report.unchanged).append(target.output)
+                report.timings[target.output] = (fetch_seconds[target.selection], write_seconds)
+            if progress:
+                progress(report)
+
+    report.changed.sort()
+    report.unchanged.sort()
+    report.failed.sort()
+    return report
+
+
+def _write_target(target: SyncTarget, content: str, dry_run: bool) -> bool:
+    """Merge `content` into the target's file; whether the file changed."""
+    try:
+        existing = target.output.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        existing = None
+    merged = merge(existing, content)
+    if merged == existing:
+        return False
+    if not dry_run:
+        _replace_file(target.output, merged)
+    return True
+
+
+def _replace_file(path: Path, text: str) -> None:
+    """Write `text` to `path` through a temporary file in the same directory."""
+    # One name per process and thread: two targets never share an output, but
+    # two igntui processes may.
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    # O_EXCL with 0o666 leaves the umask to decide the mode of a new file, as
+    # write_text would; an existing file keeps its own.
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        try:
+            os.chmod(tmp, path.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _timed(fn, *args):
+    """`fn(*args)` and the seconds it took."""
+    started = time.perf_counter()
+    return fn(*args), time.perf_counter() - started
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Fill the cache ahead of time (`igntui cache warm`).
+
+A fresh CI image starts with an empty `~/.cache/igntui`, so the first
+`generate` in a pipeline pays the network. Warming fetches the template list
+and a chosen set of template selections up front, concurrently, so every later
+command is a cache hit.
+
+A *selection* is the list of templates one `generate` call asks for. The
+gitignore.io response for `python,node` is not the two single-template
+responses glued together, so a selection is cached under its own key: warming
+a selection warms each member on its own *and* the combination.
+"""
+
+import logging
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .api.client import GitIgnoreAPI
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOBS = 8
+
+
+@dataclass
+class WarmReport:
+    total: int = 0
+    fetched: int = 0
+    cached: int = 0
+    failed: list[str] = field(default_factory=list)
+
+    @property
+    def done(self) -> int:
+        return self.fetched + self.cached + len(self.failed)
+
+
+def expand_selections(selections: Iterable[Sequence[str]]) -> list[tuple[str, ...]]:
+    """Every cache key a set of selections will hit, deduplicated, in order.
+
+    Names are compared the way the content key does — case-insensitively and
+    ignoring order — so `Python,node` and `node,python` warm once.
+    """
+    seen: set[tuple[str, ...]] = set()
+    keys: list[tuple[str, ...]] = []
+
+    def add(names: Iterable[str]) -> None:
+        key = tuple(sorted({n.strip().lower() for n in names if n.strip()}))
+        if key and key not in seen:
+            seen.add(key)
+            keys.append(key)
+
+    for selection in selections:
+        for name in selection:
+            add([name])
+        if len(selection) > 1:
+            add(selection)
+    return keys
+
+
+def read_selection_file(path: Path) -> list[list[str]]:
+    return parse_selections(path.read_text(encoding="utf-8"))
+
+
+def parse_selections(text: str) -> list[list[str]]:
+    """One selection per line, names separated by commas or whitespace.
+
+    Blank lines and `#` comments are skipped.
+    """
+    selections = []
+    for line in text.splitlines():
+        line = line.split("#", 1)[0]
+        names = line.replace(",", " ").split()
+        if names:
+            selections.append(names)
+    return selections
+
+
+def warm_cache(
+    api: "GitIgnoreAPI",
+    keys: Sequence[tuple[str, ...]],
+    refresh: bool = False,
+    jobs: int = DEFAULT_JOBS,
+    progress: Callable[[WarmReport], None] | None = None,
+) -> WarmReport:
+    """Fetch every key not already cached, `jobs` at a time.
+
+    `progress` is called from the calling thread after each key completes.
+    """
+    report = WarmReport(total=len(keys))
+
+    def fetch(key: tuple[str, ...]):
+        return api.get_templates(list(key), force_refresh=refresh)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="igntui-warm") as pool:
+        futures = {pool.submit(fetch, key): key for key in keys}
+        for future in as_completed(futures):
+            name = ",".join(futures[future])
+            try:
+                response = future.result()
+            except Exception as e:
+                logger.warning("Warming %s failed: %s", name, e)
+                report.failed.append(name)
+            else:
+                if not response.success:
+                    logger.warning("Warming %s failed: %s", name, response.error_message)
+                    report.failed.append(name)
+                elif response.from_cache:
+                    report.cached += 1
+                else:
+                    report.fetched += 1
+            if progress:
+                progress(report)
+
+    report.failed.sort()
+    return report
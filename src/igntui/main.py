@@ -21,6 +21,8 @@ def main() -> int:
     cli = BaseCLI(
         config_path=args.config,
         no_cache=args.no_cache,
+        network=args.network,
+        command=args.command,
     )
 
     # `--log-level` used to be parsed and then ignored, and the `[logging]`
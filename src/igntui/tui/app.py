@@ -7,8 +7,9 @@ import queue
 import time
 
 from ..core.api import GitIgnoreAPI
+from ..core.config import config
 from ..core.project_config import ProjectConfig, find_sidecar
-from ..core.repo_config import RepoConfig, find_repo_config
+from ..core.repo_config import RepoConfig
 from ..core.search import SearchManager
 from ..ui import (
     ContentPanel,
@@ -22,6 +23,8 @@ from .actions import TUIActions
 from .curses_setup import CursesSetup
 from .event_handler import EventHandler
 from .lifecycle import TemplateLifecycle
+from .prefetch import TemplatePrefetcher
+from .preview import PreviewCache
 from .renderer import TUIRenderer
 from .state import TUIState
 from .updates import (
@@ -29,13 +32,21 @@ from .updates import (
     ContentGenerationFailed,
     GenerationCompleted,
     LoadCompleted,
+    PreviewFailed,
+    PreviewLoaded,
     StateUpdate,
+    TemplatesChanged,
     TemplatesLoaded,
     TemplatesLoadFailed,
 )
 
 logger = logging.getLogger(__name__)
 
+# How many of the most-used templates the idle prefetcher warms besides the
+# highlighted one. Each is a request per selection change, so keep it small.
+_PREFETCH_RECENT = 3
+_SPLASH_MESSAGE = "Loading templates..."
+
 
 class GitIgnoreTUI:
     def __init__(self, stdscr, show_splash: bool = True):
@@ -48,16 +59,11 @@ class GitIgnoreTUI:
 
         CursesSetup.setup_curses(stdscr)
 
-        if self.show_splash:
-            try:
-                splash = SplashScreen(self.stdscr)
-                success = splash.show(load_callback=self._load_templates_sync)
-                self.state.loading = False
-                if success and self.state.templates:
-                    logger.info(f"Splash loaded {len(self.state.templates)} templates successfully")
-            except Exception as e:
-                logger.warning(f"Could not show splash screen: {e}")
-                self.state.loading = False
+        # Drawn by `run()` in place of the panels until the catalogue has
+        # loaded or a key is pressed; the first frame goes up right away.
+        self.splash = SplashScreen(stdscr) if show_splash else None
+        if self.splash is not None:
+            self.splash.draw(_SPLASH_MESSAGE)
 
         self._init_ui_components()
         self.lifecycle = TemplateLifecycle(self.api, self.search_manager)
@@ -76,10 +82,19 @@ class GitIgnoreTUI:
             },
         )
 
-        if not self.state.templates:
-            self._load_templates_async()
+        self._load_templates_async()
 
         self._maybe_load_sidecar()
+        self.lifecycle.start_auto_refresh(
+            self.updates,
+            float(config.get("behavior", "auto_refresh_interval", default=3600)),
+        )
+        self.preview_cache = PreviewCache()
+        self.prefetcher = (
+            TemplatePrefetcher(self.api, recent=lambda: self.lifecycle.usage.top(_PREFETCH_RECENT))
+            if config.get("behavior", "prefetch", default=True)
+            else None
+        )
 
         logger.info("GitIgnoreTUI initialized successfully")
 
@@ -106,7 +121,7 @@ class GitIgnoreTUI:
                 return
 
         # No sidecar — fall back to the repo config's [selection] if present.
-        repo_path = find_repo_config()
+        repo_path = config.repo_config_path
         if repo_path is None:
             return
         repo = RepoConfig.load(repo_path)
@@ -183,25 +198,9 @@ class GitIgnoreTUI:
 
     def _handle_quit(self) -> None:
         self.state.running = False
+        self._cancel_background_work()
         logger.info("Quit requested")
 
-    def _load_templates_sync(self) -> tuple:
-        try:
-            response = self.api.list_templates()
-            if response.success and response.data:
-                templates = response.data
-                self.state.templates = templates
-                self.state.filtered_templates = templates[:]
-                logger.info(f"Loaded {len(templates)} templates during splash")
-                return (True, len(templates), "")
-            else:
-                error_msg = response.error_message or "No templates returned from API"
-                return (False, 0, error_msg)
-        except Exception as e:
-            error_msg = f"Failed to load templates: {e}"
-            logger.error(error_msg, exc_info=True)
-            return (False, 0, error_msg)
-
     def _load_templates_async(self) -> None:
         self.state.loading = True
         self.state.set_status_message("Loading templates...")
@@ -237,6 +236,8 @@ class GitIgnoreTUI:
                     self.state.templates = templates
                     self.state.filtered_templates = templates[:]
                     self.state.set_status_message(f"✓ Loaded {len(templates)} templates")
+                case TemplatesChanged(added=added, removed=removed):
+                    self._apply_template_changes(added, removed)
                 case TemplatesLoadFailed(message=msg):
                     self.state.set_status_message(msg, is_error=True)
                 case ContentGenerated(content=content, from_cache=from_cache, selected_count=n):
@@ -250,29 +251,97 @@ class GitIgnoreTUI:
                         f"# Error generating content: {msg}\n# Selected templates: {selected}"
                     )
                     self.state.set_status_message(msg, is_error=True)
+                case PreviewLoaded(template=template, lines=lines):
+                    self.preview_cache.put(template, lines)
+                    if self.state.preview_template == template:
+                        self.state.preview_lines = lines
+                case PreviewFailed(template=template, message=msg):
+                    if self.state.preview_template == template:
+                        self.state.preview_lines = []
+                        self.state.preview_error = msg
                 case LoadCompleted():
                     self.state.loading = False
                 case GenerationCompleted():
                     self.state.generation_in_progress = False
 
+    def _apply_template_changes(self, added: list[str], removed: list[str]) -> None:
+        highlighted = self.state.get_highlighted_template()
+
+        gone = set(removed)
+        self.state.templates = sorted(
+            [t for t in self.state.templates if t not in gone] + added, key=str.lower
+        )
+        self.state.filtered_templates = self.lifecycle.filter_templates(
+            self.state.templates, self.state.filter_text, self.state.current_search_mode
+        )
+
+        # Keep the cursor on the same template when rows appear above it.
+        display = self.state.get_display_templates()
+        if highlighted in display:
+            self.state.template_selected = display.index(highlighted)
+        self.state.adjust_template_selection_bounds()
+        self.state.set_status_message(
+            f"✓ Template list updated: {len(added)} added, {len(removed)} removed"
+        )
+
+    def _update_prefetch(self) -> None:
+        if self.prefetcher is None:
+            return
+        highlighted = None
+        if self.state.current_panel == 1:
+            highlighted = self.state.get_highlighted_template()
+        self.prefetcher.update(highlighted, self.state.selected_templates)
+
+    def _update_preview(self) -> None:
+        """Point the preview at the highlighted template; never waits on a fetch."""
+        if not self.state.preview_mode:
+            self.state.preview_template = None
+            return
+        highlighted = self.state.get_highlighted_template()
+        if highlighted == self.state.preview_template:
+            return
+        self.state.preview_template = highlighted
+        self.state.preview_error = ""
+        self.state.reset_content_scroll()
+        if highlighted is None:
+            self.state.preview_lines = []
+            return
+        self.state.preview_lines = self.preview_cache.get(highlighted)
+        if self.state.preview_lines is None:
+            self.lifecycle.preview_async(highlighted, self.updates)
+
+    def _cancel_background_work(self) -> None:
+        self.lifecycle.cancel_pending()
+        if self.prefetcher is not None:
+            self.prefetcher.cancel()
+
     def run(self) -> int:
         logger.info("Starting TUI main loop")
 
         try:
             while self.state.running:
                 self._drain_updates()
-                self.state.clear_status_message()
-                self.renderer.render()
+                if self.splash is not None and not self.state.loading:
+                    self.splash = None
+                if self.splash is not None:
+                    self.splash.draw(_SPLASH_MESSAGE)
+                else:
+                    self._update_preview()
+                    self.state.clear_status_message()
+                    self.renderer.render()
 
                 try:
                     key = self.stdscr.getch()
                     if key != -1:
+                        # A key press ends the splash and is handled as usual.
+                        self.splash = None
                         should_continue = self.event_handler.handle_input(key)
                         if not should_continue:
                             break
                 except curses.error:
                     pass
 
+                self._update_prefetch()
                 time.sleep(0.01)
 
             logger.info("TUI main loop ended normally")
@@ -285,6 +354,7 @@ class GitIgnoreTUI:
             logger.error(f"Error in TUI main loop: {e}", exc_info=True)
             return 1
         finally:
+            self._cancel_background_work()
             CursesSetup.cleanup(self.stdscr)
 
 
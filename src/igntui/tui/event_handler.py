@@ -111,6 +111,17 @@ class EventHandler:
                 self.on_refresh()
             return True
 
+        elif key == ord("p"):
+            self.state.preview_mode = not self.state.preview_mode
+            # The panel's scroll offset now applies to other content.
+            self.state.reset_content_scroll()
+            self.state.set_status_message(
+                "Preview on - the highlighted template is shown in the content panel"
+                if self.state.preview_mode
+                else "Preview off"
+            )
+            return True
+
         elif key == ord("c"):
             self.state.clear_all_selections()
             self.state.generated_content = ""
@@ -279,7 +290,7 @@ class EventHandler:
             if selected_count > 0:
                 self.state.selected_index = min(selected_count - 1, self.state.selected_index + 1)
         elif self.state.current_panel == 3:
-            content_lines = len(self.state.generated_content.split("\n"))
+            content_lines = self.state.content_line_count()
             self.state.content_scroll = min(
                 max(0, content_lines - 10), self.state.content_scroll + 1
             )
@@ -324,7 +335,7 @@ class EventHandler:
             if selected_count > 0:
                 self.state.selected_index = selected_count - 1
         elif self.state.current_panel == 3:
-            content_lines = len(self.state.generated_content.split("\n"))
+            content_lines = self.state.content_line_count()
             self.state.content_scroll = max(0, content_lines - 10)
 
     def _handle_mouse(self) -> bool:
@@ -422,7 +433,7 @@ class EventHandler:
             elif idx >= new_scroll + visible:
                 self.state.selected_index = max(0, new_scroll + visible - 1)
         elif panel == 3:
-            content_lines = len(self.state.generated_content.split("\n"))
+            content_lines = self.state.content_line_count()
             self.state.content_scroll = max(
                 0, min(max(0, content_lines - 1), self.state.content_scroll + direction)
             )
@@ -9,32 +9,123 @@ from ..core.api import GitIgnoreAPI
 from ..core.config import config
 from ..core.search import SearchManager, SearchMode
 from ..core.usage import UsageTracker
+from .preview import render_preview
 from .updates import (
     ContentGenerated,
     ContentGenerationFailed,
     GenerationCompleted,
     LoadCompleted,
+    PreviewFailed,
+    PreviewLoaded,
     StateUpdate,
+    TemplatesChanged,
     TemplatesLoaded,
     TemplatesLoadFailed,
 )
 
 logger = logging.getLogger(__name__)
 
+# Pause between the background refresh's content requests, so a refresh of
+# many recent templates trickles out behind anything the user asks for.
+_REFRESH_PAUSE = 1.0
+
 
 class TemplateLifecycle:
     def __init__(self, api: GitIgnoreAPI, search_manager: SearchManager):
         self.api = api
         self.search_manager = search_manager
         self.usage = UsageTracker()
+        # One event per in-flight fetch. Setting it makes the worker's retry
+        # wait return at once, so quitting or starting a newer request does
+        # not leave a thread sleeping out a backoff for an answer nobody wants.
+        self._load_cancel: threading.Event | None = None
+        self._generate_cancel: threading.Event | None = None
+        self._preview_cancel: threading.Event | None = None
+        self._refresh_stop: threading.Event | None = None
+        # The catalogue as last shown, so a background refresh can post just
+        # what changed. Written only by worker threads and `remember_templates`.
+        self._known_templates: list[str] | None = None
+
+    def cancel_pending(self) -> None:
+        """Abandon every in-flight fetch; their results are discarded."""
+        for event in (
+            self._load_cancel,
+            self._generate_cancel,
+            self._preview_cancel,
+            self._refresh_stop,
+        ):
+            if event is not None:
+                event.set()
+
+    def remember_templates(self, templates: list[str]) -> None:
+        """Record a catalogue loaded outside the lifecycle."""
+        self._known_templates = list(templates)
+
+    def start_auto_refresh(self, updates: "queue.Queue[StateUpdate]", interval: float) -> None:
+        """Refresh the catalogue and recent templates every `interval` seconds.
+
+        The refresh runs on one daemon thread, one request at a time, and never
+        reports anything but a changed catalogue — an unchanged one, a failed
+        fetch or refreshed content stay silent. `interval <= 0` disables it.
+        """
+        if interval <= 0 or self._refresh_stop is not None:
+            return
+        stop = self._refresh_stop = threading.Event()
+
+        def refresh_loop():
+            while not stop.wait(interval):
+                try:
+                    self.refresh_once(updates, stop)
+                except Exception as e:
+                    logger.warning("Background refresh failed: %s", e)
+
+        threading.Thread(target=refresh_loop, name="igntui-refresh", daemon=True).start()
+        logger.info("Background refresh every %ds", interval)
+
+    def refresh_once(
+        self, updates: "queue.Queue[StateUpdate]", stop: threading.Event | None = None
+    ) -> None:
+        stop = stop or threading.Event()
+        # Offline there is nothing to refresh from, and an open circuit will
+        # refuse the requests anyway; both leave the cache as it is.
+        if self.api.network_policy == "offline" or self.api.circuit_breaker.is_open():
+            logger.debug("Skipping background refresh")
+            return
+
+        response = self.api.list_templates(force_refresh=True, cancel=stop)
+        if stop.is_set() or not response.success or response.from_cache:
+            return
+        templates = sorted(response.data, key=str.lower)
+        known = self._known_templates
+        self._known_templates = templates
+        if known is None:
+            updates.put(TemplatesLoaded(templates))
+        else:
+            new, old = set(templates), set(known)
+            added = sorted(new - old, key=str.lower)
+            removed = sorted(old - new, key=str.lower)
+            if added or removed:
+                logger.info("Catalogue changed: %d added, %d removed", len(added), len(removed))
+                updates.put(TemplatesChanged(added, removed))
+
+        max_recent = int(config.get("behavior", "max_recent_templates", default=10))
+        for template in self.usage.top(max_recent):
+            if stop.wait(_REFRESH_PAUSE):
+                return
+            self.api.get_templates([template], force_refresh=True, cancel=stop)
 
     def load_templates_async(self, updates: "queue.Queue[StateUpdate]") -> None:
+        cancel = self._load_cancel = _superseding(self._load_cancel)
+
         def load_templates():
             try:
                 logger.info("Loading templates from API")
-                response = self.api.list_templates()
-                if response.success:
+                response = self.api.list_templates(cancel=cancel)
+                if cancel.is_set():
+                    logger.info("Template load cancelled")
+                elif response.success:
                     templates = sorted(response.data, key=str.lower)
+                    self._known_templates = templates
                     logger.info("Loaded %d templates", len(templates))
                     updates.put(TemplatesLoaded(templates))
                 else:
@@ -59,11 +150,15 @@ class TemplateLifecycle:
             updates.put(GenerationCompleted())
             return
 
+        cancel = self._generate_cancel = _superseding(self._generate_cancel)
+
         def generate_content():
             try:
                 logger.info("Generating content for %d templates", len(templates))
-                response = self.api.get_templates(templates)
-                if response.success:
+                response = self.api.get_templates(templates, cancel=cancel)
+                if cancel.is_set():
+                    logger.info("Content generation superseded or cancelled")
+                elif response.success:
                     logger.info("Generated %d chars", len(response.data))
                     updates.put(
                         ContentGenerated(response.data, response.from_cache, len(templates))
@@ -82,6 +177,26 @@ class TemplateLifecycle:
 
         threading.Thread(target=generate_content, daemon=True).start()
 
+    def preview_async(self, template: str, updates: "queue.Queue[StateUpdate]") -> None:
+        """Fetch and render one template's body; a newer preview supersedes it."""
+        cancel = self._preview_cancel = _superseding(self._preview_cancel)
+
+        def load_preview():
+            try:
+                response = self.api.get_templates([template], cancel=cancel)
+                if cancel.is_set():
+                    return
+                if response.success:
+                    updates.put(PreviewLoaded(template, render_preview(response.data)))
+                else:
+                    msg = response.error_message or "Unknown error"
+                    updates.put(PreviewFailed(template, msg))
+            except Exception as e:
+                logger.error("Exception loading preview for %s: %s", template, e)
+                updates.put(PreviewFailed(template, str(e)))
+
+        threading.Thread(target=load_preview, daemon=True).start()
+
     def filter_templates(
         self, templates: list[str], filter_text: str, search_mode: str = "fuzzy"
     ) -> list[str]:
@@ -117,3 +232,10 @@ class TemplateLifecycle:
 
     def record_usage(self, template: str) -> None:
         self.usage.record(template)
+
+
+def _superseding(previous: threading.Event | None) -> threading.Event:
+    """Cancel the fetch a new one replaces and hand out the new one's event."""
+    if previous is not None:
+        previous.set()
+    return threading.Event()
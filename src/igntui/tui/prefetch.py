@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Idle-time prefetch of what the user is likely to select next.
+
+Toggling a template regenerates content for the whole selection, and that
+combination is cached under its own key — so what makes a toggle instant is
+having *the selection it would produce* in the cache. When the cursor rests on
+a template for `delay` seconds, the prefetcher warms that selection for the
+highlighted template and for each of the user's most-used templates.
+
+Prefetches are silent: they only fill the cache and never post updates. At
+most `max_workers` run at once, and moving the cursor (or changing the
+selection) cancels the batch — queued fetches are dropped and running ones
+stop at their next retry wait.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+from ..core.api import GitIgnoreAPI
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DELAY = 0.4
+DEFAULT_WORKERS = 2
+
+
+class TemplatePrefetcher:
+    def __init__(
+        self,
+        api: GitIgnoreAPI,
+        recent: Callable[[], list[str]],
+        delay: float = DEFAULT_DELAY,
+        max_workers: int = DEFAULT_WORKERS,
+    ):
+        self.api = api
+        # Called once per batch: the most-used templates worth warming.
+        self.recent = recent
+        self.delay = delay
+        self.max_workers = max(1, max_workers)
+        self._pool: ThreadPoolExecutor | None = None
+        self._cancel = threading.Event()
+        self._target: tuple[str | None, frozenset[str]] | None = None
+        self._target_since = 0.0
+        self._submitted = False
+        # Selections already warmed this session; the cache answers them now.
+        self._warmed: set[tuple[str, ...]] = set()
+
+    def update(self, highlighted: str | None, selected: Iterable[str]) -> None:
+        """Report where the cursor is; call on every main-loop iteration."""
+        target = (highlighted, frozenset(selected))
+        now = time.monotonic()
+        if target != self._target:
+            self._cancel.set()
+            self._target = target
+            self._target_since = now
+            self._submitted = False
+            return
+        if self._submitted or now - self._target_since < self.delay:
+            return
+        self._submitted = True
+        self._start(*target)
+
+    def cancel(self) -> None:
+        self._cancel.set()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _start(self, highlighted: str | None, selected: frozenset[str]) -> None:
+        # Nothing to warm from offline, and an open circuit refuses requests.
+        if self.api.network_policy == "offline" or self.api.circuit_breaker.is_open():
+            return
+        candidates = [highlighted] if highlighted else []
+        candidates += self.recent()
+
+        selections = []
+        for template in dict.fromkeys(candidates):
+            selection = tuple(sorted(selected ^ {template}, key=str.lower))
+            if selection and selection not in self._warmed:
+                selections.append(selection)
+        if not selections:
+            return
+
+        cancel = self._cancel = threading.Event()
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="igntui-prefetch"
+            )
+        for selection in selections:
+            self._pool.submit(self._prefetch, selection, cancel)
+
+    def _prefetch(self, selection: tuple[str, ...], cancel: threading.Event) -> None:
+        if cancel.is_set():
+            return
+        try:
+            response = self.api.get_templates(list(selection), cancel=cancel)
+        except Exception as e:
+            logger.debug("Prefetch of %s failed: %s", ",".join(selection), e)
+            return
+        if response.success:
+            self._warmed.add(selection)
+            if not response.from_cache:
+                logger.debug("Prefetched %s", ",".join(selection))
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Rendered previews of single templates for the content panel.
+
+Preview mode shows the highlighted template's body before it is selected. The
+body comes from the per-template content cache (fetched by a lifecycle worker
+on a miss); what the renderer needs is a list of display lines, so the split
+and tab expansion happen once, on the worker, and the result is kept here in a
+small LRU keyed by template name. Moving back over a template redraws it from
+memory without touching the disk cache.
+"""
+
+from collections import OrderedDict
+
+DEFAULT_CAPACITY = 32
+
+
+class PreviewCache:
+    """LRU of template name -> rendered preview lines. Main-thread only."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = max(1, capacity)
+        self._entries: OrderedDict[str, list[str]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, template: str) -> list[str] | None:
+        lines = self._entries.get(template)
+        if lines is not None:
+            self._entries.move_to_end(template)
+        return lines
+
+    def put(self, template: str, lines: list[str]) -> None:
+        self._entries[template] = lines
+        self._entries.move_to_end(template)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+
+def render_preview(content: str) -> list[str]:
+    """Split a template body into display lines: tabs expanded, no trailing blanks."""
+    lines = [line.expandtabs(4).rstrip() for line in content.splitlines()]
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
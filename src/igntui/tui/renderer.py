@@ -86,6 +86,10 @@ class TUIRenderer:
                 self.content_panel.content_scroll = self.state.content_scroll
                 self.content_panel.is_active = self.state.current_panel == 3
                 self.content_panel.generation_in_progress = self.state.generation_in_progress
+                self.content_panel.preview_mode = self.state.preview_mode
+                self.content_panel.preview_template = self.state.preview_template
+                self.content_panel.preview_lines = self.state.preview_lines
+                self.content_panel.preview_error = self.state.preview_error
                 self.content_panel.draw()
             except Exception as e:
                 logger.error(f"Error rendering content panel: {e}")
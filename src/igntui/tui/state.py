@@ -24,6 +24,12 @@ class TUIState:
     selected_index: int = 0
     content_scroll: int = 0
     search_active: bool = False
+    # Preview mode: the content panel shows the highlighted template's body.
+    # `preview_lines` is None while it loads.
+    preview_mode: bool = False
+    preview_template: str | None = None
+    preview_lines: list[str] | None = None
+    preview_error: str = ""
     status_message: str = ""
     error_message: str = ""
     message_timestamp: float = field(default_factory=time.time)
@@ -51,6 +57,12 @@ class TUIState:
     def reset_content_scroll(self) -> None:
         self.content_scroll = 0
 
+    def content_line_count(self) -> int:
+        """Lines in what the content panel shows: the preview, or the output."""
+        if self.preview_mode:
+            return len(self.preview_lines or [])
+        return len(self.generated_content.split("\n"))
+
     def set_status_message(self, message: str, is_error: bool = False) -> None:
         if is_error:
             self.error_message = message
@@ -68,6 +80,12 @@ class TUIState:
     def get_display_templates(self) -> list[str]:
         return self.filtered_templates if self.filter_text else self.templates
 
+    def get_highlighted_template(self) -> str | None:
+        display = self.get_display_templates()
+        if 0 <= self.template_selected < len(display):
+            return display[self.template_selected]
+        return None
+
     def get_selected_templates_list(self) -> list[str]:
         return sorted(self.selected_templates)
 
@@ -1,6 +1,7 @@
 """State updates posted from background threads.
 
-Background workers (lifecycle template-load / content-generate) post one of
+Background workers (lifecycle template-load / content-generate / refresh /
+preview) post one of
 these to a `queue.Queue` instead of mutating `TUIState` directly. The main
 loop drains the queue between renders and applies each update.
 """
@@ -13,6 +14,14 @@ class TemplatesLoaded:
     templates: list[str]
 
 
+@dataclass(frozen=True)
+class TemplatesChanged:
+    """A background refresh found the catalogue changed; only the difference."""
+
+    added: list[str]
+    removed: list[str]
+
+
 @dataclass(frozen=True)
 class TemplatesLoadFailed:
     message: str
@@ -31,6 +40,18 @@ class ContentGenerationFailed:
     selected_templates: list[str]
 
 
+@dataclass(frozen=True)
+class PreviewLoaded:
+    template: str
+    lines: list[str]
+
+
+@dataclass(frozen=True)
+class PreviewFailed:
+    template: str
+    message: str
+
+
 @dataclass(frozen=True)
 class LoadCompleted:
     """Workers post this in their `finally` block to clear the loading flag."""
@@ -43,9 +64,12 @@ class GenerationCompleted:
 
 StateUpdate = (
     TemplatesLoaded
+    | TemplatesChanged
     | TemplatesLoadFailed
     | ContentGenerated
     | ContentGenerationFailed
+    | PreviewLoaded
+    | PreviewFailed
     | LoadCompleted
     | GenerationCompleted
 )
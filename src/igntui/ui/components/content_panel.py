@@ -12,8 +12,16 @@ class ContentPanel(BasePanel):
         self.generated_content = ""
         self.content_scroll = 0
         self.generation_in_progress = False
+        self.preview_mode = False
+        self.preview_template: str | None = None
+        self.preview_lines: list[str] | None = None
+        self.preview_error = ""
 
     def draw(self):
+        if self.preview_mode:
+            self._draw_preview()
+            return
+
         title = "Generated .gitignore"
         if self.generation_in_progress:
             title += " (Generating...)"
@@ -72,3 +80,58 @@ class ContentPanel(BasePanel):
                     self.stdscr.addstr(self.y, info_x, scroll_info, curses.color_pair(1))
             except curses.error:
                 pass
+
+    def _draw_preview(self):
+        # The lines arrive pre-rendered; this only clips and scrolls them.
+        title = f"Preview: {self.preview_template}" if self.preview_template else "Preview"
+        if self.preview_template and self.preview_lines is None:
+            title += " (Loading...)"
+        self.draw_border(title, self.is_active)
+
+        inner_y, inner_x = self.y + 1, self.x + 1
+        inner_height, inner_width = self.height - 2, self.width - 2
+
+        lines = self.preview_lines
+        if self.preview_error:
+            message, attr = f"Could not load preview: {self.preview_error}", curses.color_pair(7)
+        elif self.preview_template is None:
+            message, attr = "Highlight a template to preview it", curses.color_pair(8)
+        elif lines is None:
+            message, attr = "Loading...", curses.color_pair(8)
+        else:
+            self._draw_preview_lines(lines, inner_y, inner_x, inner_height, inner_width)
+            return
+        try:
+            self.stdscr.addstr(
+                inner_y + inner_height // 2, inner_x + 2, message[: inner_width - 3], attr
+            )
+        except curses.error:
+            pass
+
+    def _draw_preview_lines(
+        self, lines: list[str], inner_y: int, inner_x: int, inner_height: int, inner_width: int
+    ) -> None:
+        # The same offset as the generated content, which the same keys move.
+        scroll = max(0, min(self.content_scroll, len(lines) - inner_height))
+        content_width = inner_width - 2
+        show_scrollbar = len(lines) > inner_height
+        if show_scrollbar:
+            content_width -= 2
+
+        for i, line in enumerate(lines[scroll : scroll + inner_height]):
+            try:
+                self.stdscr.addstr(
+                    inner_y + i, inner_x + 1, line[:content_width], curses.color_pair(8)
+                )
+            except curses.error:
+                pass
+
+        if show_scrollbar:
+            self.draw_scrollbar(
+                inner_y,
+                inner_x + inner_width - 1,
+                inner_height,
+                len(lines),
+                inner_height,
+                scroll,
+            )
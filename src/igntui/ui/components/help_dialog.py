@@ -29,6 +29,7 @@ class HelpDialog(BaseDialog):
             "  a                  - Select all filtered templates",
             "  x                  - Clear all selections",
             "  F5                 - Refresh templates list",
+            "  p                  - Preview highlighted template",
             "",
             "SELECTED PANEL:",
             "  Space              - Remove selected template",
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""The splash-screen logo, pre-rendered. Generated; do not edit.
+
+Regenerate with `python scripts/render_splash_logo.py`.
+"""
+
+# One tuple of lines per font, widest first.
+LOGOS: tuple[tuple[str, ...], ...] = (
+    # slant, 30 columns
+    (
+        "    _             __        _",
+        "   (_)___ _____  / /___  __(_)",
+        "  / / __ `/ __ \\/ __/ / / / /",
+        " / / /_/ / / / / /_/ /_/ / /",
+        "/_/\\__, /_/ /_/\\__/\\__,_/_/",
+        "  /____/",
+    ),
+    # small, 23 columns
+    (
+        " _          _        _",
+        "(_)__ _ _ _| |_ _  _(_)",
+        "| / _` | ' \\  _| || | |",
+        "|_\\__, |_||_\\__|\\_,_|_|",
+        "  |___/",
+    ),
+    # plain, 6 columns
+    ("igntui",),
+)
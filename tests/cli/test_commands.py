@@ -6,13 +6,16 @@ documented in `docs/concepts/return-codes.md` and scripts depend on them.
 """
 
 import argparse
+import io
+import json
 
 import pytest
 
-from igntui.cli.commands import CacheCommand, ListCommand
+from igntui.cli.commands import CacheCommand, CheckCommand, ListCommand, SyncCommand
 from igntui.cli.commands import (
     TestCommand as ConnectionCommand,  # aliased: pytest collects Test* classes
 )
+from igntui.cli.output import records, write
 from igntui.core.api.response import APIResponse
 
 
@@ -21,6 +24,11 @@ class FakeAPI:
         self._list = list_response
         self._test = test_response
         self.cache_manager = cache_manager
+        self.network_policy = "online"
+        if cache_manager is not None:
+            from igntui.core.cache import TemplateCache
+
+            self.template_cache = TemplateCache(cache_manager)
 
     def list_templates(self, force_refresh: bool = False):
         if isinstance(self._list, Exception):
@@ -32,12 +40,20 @@ class FakeAPI:
             raise self._test
         return self._test
 
+    def get_templates(self, technologies, force_refresh=False):
+        return APIResponse(success=True, data=f"### {','.join(technologies)} ###\n")
+
 
 class FakeCLI:
     def __init__(self, api):
         self.api = api
+        self.repo_config_path = None
         self.errors: list[Exception] = []
 
+    @property
+    def remote_api(self):
+        return self.api
+
     def handle_api_error(self, error: Exception) -> None:
         self.errors.append(error)
         print(f"Error: {error}")
@@ -98,6 +114,60 @@ def test_list_routes_exceptions_through_the_error_handler(capsys):
     assert command.cli.errors
 
 
+def test_list_json_is_an_array_of_names(capsys):
+    assert list_command().execute(args(filter=None, count=False, format="json", null=False)) == 0
+    assert json.loads(capsys.readouterr().out) == ["python", "node", "macos"]
+
+
+def test_list_ndjson_is_one_string_per_line(capsys):
+    assert list_command().execute(args(filter="o", count=False, format="ndjson", null=False)) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == ["python", "node", "macos"]
+
+
+def test_list_null_implies_plain_and_terminates_with_nul(capsys):
+    assert list_command().execute(args(filter="n", count=False, format=None, null=True)) == 0
+    assert capsys.readouterr().out == "python\0node\0"
+
+
+def test_list_machine_count_is_the_bare_number(capsys):
+    assert list_command().execute(args(filter=None, count=True, format="plain", null=False)) == 0
+    assert capsys.readouterr().out == "3\n"
+
+
+def test_list_machine_formats_keep_messages_off_stdout(capsys):
+    assert list_command().execute(args(filter="zzz", count=False, format="json", null=False)) == 1
+    out, err = capsys.readouterr()
+    assert json.loads(out) == []
+    assert "zzz" in err
+
+    command = list_command(templates=[], error="upstream is down")
+    assert command.execute(args(filter=None, count=False, format="plain", null=False)) == 1
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert "upstream is down" in err
+
+
+def test_list_rejects_null_with_json(capsys):
+    assert list_command().execute(args(filter=None, count=False, format="json", null=True)) == 1
+    assert "--null" in capsys.readouterr().err
+
+
+def test_machine_output_is_one_write_to_the_byte_buffer():
+    class Buffer(io.BytesIO):
+        writes = 0
+
+        def write(self, data):
+            self.writes += 1
+            return super().write(data)
+
+    stream = io.TextIOWrapper(Buffer(), encoding="utf-8")
+    write(records(["go", "python", "café"], "ndjson"), stream)
+
+    assert stream.buffer.writes == 1
+    assert stream.buffer.getvalue() == '"go"\n"python"\n"café"\n'.encode()
+
+
 # --- test ------------------------------------------------------------------
 
 
@@ -146,6 +216,21 @@ def test_connection_command_survives_a_missing_payload(capsys):
     assert "0.000s" in capsys.readouterr().out
 
 
+def test_connection_command_reports_an_open_circuit(capsys):
+    payload = {
+        "status": "error",
+        "circuit": {"state": "open", "consecutive_failures": 5, "retry_in": 21.4},
+    }
+    command = ConnectionCommand(
+        FakeCLI(FakeAPI(test_response=APIResponse(False, payload, error_message="refused")))
+    )
+
+    assert command.execute(args(timeout=1)) == 1
+    assert "Circuit breaker: open (5 consecutive failures, next attempt in 21s)" in (
+        capsys.readouterr().out
+    )
+
+
 # --- cache -----------------------------------------------------------------
 
 
@@ -236,3 +321,206 @@ def test_cache_clear_expired_does_not_prompt(cache_cli, capsys, monkeypatch):
     assert (
         CacheCommand(cache_cli).execute(args(cache_action="clear", force=False, expired=True)) == 0
     )
+
+
+# --- cache warm ------------------------------------------------------------
+
+
+@pytest.fixture
+def warm_cli(tmp_path, monkeypatch):
+    """A real GitIgnoreAPI over a tmp cache, with the network replaced."""
+    from igntui.core.api.client import GitIgnoreAPI
+    from igntui.core.cache import CacheManager
+
+    api = GitIgnoreAPI(cache_manager=CacheManager(str(tmp_path / "cache")))
+    api.requested = []
+
+    def fake_request(url, **kwargs):
+        tail = url.rsplit("/", 1)[1]
+        api.requested.append(tail)
+        if tail == "list":
+            return APIResponse(success=True, data="python,node\nmacos,rust")
+        if "broken" in tail:
+            return APIResponse(success=False, data="", error_message="HTTP 404: Not Found")
+        return APIResponse(success=True, data=f"### {tail} ###\n")
+
+    monkeypatch.setattr(api.request_handler, "make_request_with_retry", fake_request)
+    return FakeCLI(api)
+
+
+def warm_args(**kwargs):
+    defaults = dict(
+        cache_action="warm",
+        templates=[],
+        all=False,
+        from_usage=False,
+        from_repo=False,
+        from_file=None,
+        jobs=None,
+        refresh=False,
+    )
+    return args(**{**defaults, **kwargs})
+
+
+def test_cache_warm_makes_the_selection_a_pure_cache_hit(warm_cli, capsys):
+    assert CacheCommand(warm_cli).execute(warm_args(templates=["python", "node"])) == 0
+    assert sorted(warm_cli.api.requested) == ["list", "node", "node,python", "python"]
+    assert "3 fetched" in capsys.readouterr().out
+
+    warm_cli.api.requested.clear()
+    assert warm_cli.api.get_templates(["node", "python"]).from_cache
+    assert warm_cli.api.list_templates().from_cache
+    assert warm_cli.api.requested == []
+
+
+def test_cache_warm_all_fetches_each_template_once(warm_cli, capsys):
+    assert CacheCommand(warm_cli).execute(warm_args(all=True, jobs=2)) == 0
+    assert sorted(warm_cli.api.requested) == ["list", "macos", "node", "python", "rust"]
+
+    warm_cli.api.requested.clear()
+    assert CacheCommand(warm_cli).execute(warm_args(all=True)) == 0
+    assert warm_cli.api.requested == []
+    assert "4 already cached" in capsys.readouterr().out
+
+
+def test_cache_warm_reads_selections_from_a_file(warm_cli, capsys, tmp_path):
+    selections = tmp_path / "selections.txt"
+    selections.write_text("# pipeline targets\npython, node\n\nrust\n", encoding="utf-8")
+
+    assert CacheCommand(warm_cli).execute(warm_args(from_file=selections)) == 0
+    assert sorted(warm_cli.api.requested) == ["list", "node", "node,python", "python", "rust"]
+
+
+def test_cache_warm_reads_the_repo_selection(warm_cli, capsys, tmp_path, monkeypatch):
+    repo_config = tmp_path / ".igntui.repo.cfg.toml"
+    repo_config.write_text('[selection]\ntemplates = ["python", "macos"]\n', encoding="utf-8")
+    # The session's resolved repo config wins; the directory is not walked again.
+    other = tmp_path / "other"
+    (other / ".git").mkdir(parents=True)
+    (other / ".igntui.repo.cfg.toml").write_text(
+        '[selection]\ntemplates = ["rust"]\n', encoding="utf-8"
+    )
+    monkeypatch.chdir(other)
+    warm_cli.repo_config_path = repo_config
+
+    assert CacheCommand(warm_cli).execute(warm_args(from_repo=True)) == 0
+    assert "macos,python" in warm_cli.api.requested
+    assert "rust" not in warm_cli.api.requested
+
+
+def test_cache_warm_reports_failures_and_exits_nonzero(warm_cli, capsys):
+    assert CacheCommand(warm_cli).execute(warm_args(templates=["broken", "python"])) == 1
+    out = capsys.readouterr().out
+    assert "2 failed" in out
+    assert "failed: broken" in out
+    assert warm_cli.api.get_templates(["python"]).from_cache
+
+
+def test_cache_warm_without_a_set_warms_only_the_list(warm_cli, capsys):
+    assert CacheCommand(warm_cli).execute(warm_args()) == 0
+    assert warm_cli.api.requested == ["list"]
+    assert "No templates to warm" in capsys.readouterr().out
+
+
+# --- cache export / import ---------------------------------------------------
+
+
+def test_cache_export_then_import_into_another_cache(cache_cli, capsys, tmp_path):
+    from igntui.core.cache import CacheManager
+
+    cache_cli.api.cache_manager.set("gitignore_templates_list", ["python"])
+    bundle = tmp_path / "bundle.tar.gz"
+
+    assert CacheCommand(cache_cli).execute(args(cache_action="export", file=bundle)) == 0
+    assert "Exported 1 entry" in capsys.readouterr().out
+
+    other = FakeCLI(FakeAPI(cache_manager=CacheManager(str(tmp_path / "other"))))
+    assert CacheCommand(other).execute(args(cache_action="import", file=bundle)) == 0
+    assert "Imported 1 entry" in capsys.readouterr().out
+    assert other.api.cache_manager.get("gitignore_templates_list") == ["python"]
+
+
+def test_cache_import_of_a_non_bundle_is_a_failure(cache_cli, capsys, tmp_path):
+    junk = tmp_path / "junk.tar.gz"
+    junk.write_text("nope", encoding="utf-8")
+
+    assert CacheCommand(cache_cli).execute(args(cache_action="import", file=junk)) == 1
+    assert "Error" in capsys.readouterr().out
+
+
+def test_cache_invalidate_reports_what_each_name_removed(cache_cli, capsys):
+    templates = cache_cli.api.template_cache
+    templates.set_template_content(["python"], "PY")
+    templates.set_template_content(["go", "python"], "GO+PY")
+
+    assert (
+        CacheCommand(cache_cli).execute(
+            args(cache_action="invalidate", templates=["python", "rust"])
+        )
+        == 0
+    )
+
+    out = capsys.readouterr().out
+    assert "python: removed 2 entries" in out
+    assert "rust: removed 0 entries" in out
+
+
+# --- sync ------------------------------------------------------------------
+
+
+def test_sync_summarises_changed_and_unchanged_files(tmp_path, capsys):
+    from igntui.core.project_config import SIDECAR_FILENAME, ProjectConfig
+
+    for name in ("a", "b"):
+        ProjectConfig(templates=["python"]).dump(tmp_path / name / SIDECAR_FILENAME)
+    command = SyncCommand(FakeCLI(FakeAPI()))
+    command.execute(args(root=tmp_path, jobs=2, dry_run=False))
+    (tmp_path / "b" / ".gitignore").write_text("stale")
+    capsys.readouterr()
+
+    assert command.execute(args(root=tmp_path, jobs=2, dry_run=False)) == 0
+
+    out = capsys.readouterr().out
+    assert "changed: b/.gitignore" in out
+    assert "Synced 2 files from 1 distinct selections: 1 changed, 1 unchanged, 0 failed" in out
+
+
+def test_sync_with_no_sidecars_is_not_an_error(tmp_path, capsys):
+    assert (
+        SyncCommand(FakeCLI(FakeAPI())).execute(args(root=tmp_path, jobs=None, dry_run=False)) == 0
+    )
+    assert "No .igntui.cfg.toml sidecars found" in capsys.readouterr().out
+
+
+# --- check -----------------------------------------------------------------
+
+
+def test_check_fails_on_drift_and_names_the_file(tmp_path, capsys):
+    from igntui.core.project_config import SIDECAR_FILENAME, ProjectConfig
+
+    for name in ("a", "b"):
+        ProjectConfig(templates=["python"]).dump(tmp_path / name / SIDECAR_FILENAME)
+    cli = FakeCLI(FakeAPI())
+    SyncCommand(cli).execute(args(root=tmp_path, jobs=1, dry_run=False))
+    target = tmp_path / "b" / ".gitignore"
+    target.write_text(target.read_text().replace("### python ###", "### edited ###"))
+    capsys.readouterr()
+
+    assert CheckCommand(cli).execute(args(paths=[tmp_path], network=None)) == 1
+
+    out = capsys.readouterr().out
+    assert f"drifted: {target}" in out
+    assert "Checked 2 files: 1 current, 1 drifted" in out
+    # Any cached copy will do for a drift check.
+    assert cli.api.network_policy == "prefer-cache"
+
+
+def test_check_accepts_a_generated_file_and_finds_its_sidecar(tmp_path, capsys):
+    from igntui.core.project_config import SIDECAR_FILENAME, ProjectConfig
+
+    ProjectConfig(templates=["python"]).dump(tmp_path / SIDECAR_FILENAME)
+    cli = FakeCLI(FakeAPI())
+    SyncCommand(cli).execute(args(root=tmp_path, jobs=1, dry_run=False))
+
+    assert CheckCommand(cli).execute(args(paths=[tmp_path / ".gitignore"], network=None)) == 0
+    assert "1 current" in capsys.readouterr().out
@@ -7,6 +7,8 @@ scripts against what argparse actually knows.
 """
 
 import argparse
+import shutil
+import subprocess
 
 import pytest
 
@@ -53,7 +55,15 @@ def test_script_has_no_unsubstituted_placeholders(shell, capsys):
 @pytest.mark.parametrize("shell", SHELLS)
 def test_global_flags_are_offered(shell, capsys):
     out = emit(shell, capsys)
-    for flag in ("--version", "--verbose", "--log-level", "--config", "--no-cache"):
+    for flag in (
+        "--version",
+        "--verbose",
+        "--log-level",
+        "--config",
+        "--no-cache",
+        "--network",
+        "--offline",
+    ):
         # fish spells them `-l no-cache`, so match on the flag name, not the dashes.
         assert flag.lstrip("-") in out, f"{shell} completion is missing {flag}"
 
@@ -79,7 +89,7 @@ def test_per_command_flags_reach_every_shell(command, flag, capsys):
 def test_cache_actions_are_offered(subparsers, capsys):
     for shell in SHELLS:
         out = emit(shell, capsys)
-        for action in ("info", "stats", "clear"):
+        for action in ("info", "stats", "clear", "warm", "export", "import"):
             assert action in out, f"{shell} completion is missing cache {action}"
 
 
@@ -90,6 +100,13 @@ def test_cache_clear_flags_are_offered(capsys):
             assert flag in out, f"{shell} completion is missing cache clear --{flag}"
 
 
+def test_cache_warm_flags_are_offered(capsys):
+    for shell in SHELLS:
+        out = emit(shell, capsys)
+        for flag in ("all", "from-usage", "from-repo", "from-file", "jobs", "refresh"):
+            assert flag in out, f"{shell} completion is missing cache warm --{flag}"
+
+
 def test_zsh_script_declares_itself_compdef(capsys):
     """Without #compdef on the first line, zsh will not load it from $fpath."""
     assert emit("zsh", capsys).lstrip().startswith("#compdef igntui")
@@ -99,3 +116,42 @@ def test_both_console_scripts_are_completed(capsys):
     """`gitignore-tui` is a real entry point; completion should cover it too."""
     for shell in ("zsh", "fish"):
         assert "gitignore-tui" in emit(shell, capsys)
+
+
+@pytest.mark.parametrize("shell", SHELLS)
+def test_template_names_come_from_the_catalogue_file(shell, capsys):
+    """Read by the shell itself: `igntui` must not run on each Tab."""
+    from igntui.core.cache import CATALOGUE_FILENAME
+
+    out = emit(shell, capsys)
+    assert f"$HOME/.cache/igntui/{CATALOGUE_FILENAME}" in out
+    assert "igntui list" not in out
+
+
+@pytest.mark.skipif(shutil.which("bash") is None, reason="needs bash")
+def test_bash_completes_template_names_by_prefix(capsys, tmp_path):
+    catalogue = tmp_path / ".cache" / "igntui" / "catalogue.txt"
+    catalogue.parent.mkdir(parents=True)
+    catalogue.write_text("go\npython\npythonvanilla\nrust\n")
+    script = emit("bash", capsys)
+
+    def complete(*words):
+        # `_init_completion` comes from bash-completion; stand in for it.
+        driver = f"""
+_init_completion() {{ cur="${{COMP_WORDS[COMP_CWORD]}}"; prev="${{COMP_WORDS[COMP_CWORD-1]}}"; words=("${{COMP_WORDS[@]}}"); cword=$COMP_CWORD; }}
+{script}
+COMP_WORDS=({" ".join(words)}); COMP_CWORD={len(words) - 1}
+_igntui_complete
+printf '%s\\n' "${{COMPREPLY[@]}}"
+"""
+        result = subprocess.run(
+            ["bash", "-c", driver],
+            capture_output=True,
+            text=True,
+            env={"HOME": str(tmp_path), "PATH": "/usr/bin:/bin"},
+        )
+        return result.stdout.split()
+
+    assert complete("igntui", "generate", "pyth") == ["python", "pythonvanilla"]
+    assert complete("igntui", "generate", "go", "r") == ["rust"]
+    assert complete("igntui", "generate", "--dr") == ["--dry-run"]
@@ -5,11 +5,15 @@ Covers:
 - managed-block preserves user content on re-save (Phase 2.5)
 - sidecar written on default save, skipped with --no-sidecar (Phase 2.4)
 - --dry-run prints content + writes nothing (Phase 1.5)
+- --format / --null output for scripts
 """
 
 import argparse
+import json
 from unittest.mock import MagicMock
 
+import pytest
+
 from igntui.cli.commands.generate_cmd import GenerateCommand
 from igntui.core.api.response import APIResponse
 from igntui.core.managed_block import BEGIN_MARKER, END_MARKER
@@ -33,6 +37,7 @@ def _make_args(**overrides) -> argparse.Namespace:
 def _command_with_response(content: str) -> GenerateCommand:
     cli = MagicMock()
     cli.api.get_templates.return_value = APIResponse(success=True, data=content)
+    cli.remote_api = cli.api
     return GenerateCommand(cli)
 
 
@@ -115,9 +120,104 @@ def test_no_output_prints_to_stdout(capsys):
 
 def test_failure_response_returns_nonzero(capsys):
     cli = MagicMock()
-    cli.api.get_templates.return_value = APIResponse(success=False, data="", error_message="boom")
+    cli.remote_api.get_templates.return_value = APIResponse(
+        success=False, data="", error_message="boom"
+    )
     cmd = GenerateCommand(cli)
     rc = cmd.execute(_make_args())
     out = capsys.readouterr()
     assert rc == 1
     assert "boom" in out.out
+
+
+def test_plain_null_ends_the_content_with_nul(capsys):
+    cmd = _command_with_response("GEN\n")
+    assert cmd.execute(_make_args(format=None, null=True)) == 0
+    assert capsys.readouterr().out == "GEN\n\0"
+
+
+def test_json_output_describes_the_content(capsys):
+    cmd = _command_with_response("# python\n*.pyc\n")
+    assert cmd.execute(_make_args(templates=["python"], format="json", null=False)) == 0
+    assert json.loads(capsys.readouterr().out) == {
+        "templates": ["python"],
+        "from_cache": False,
+        "content": "# python\n*.pyc\n",
+    }
+
+
+def test_ndjson_output_is_one_line(capsys):
+    cmd = _command_with_response("é\n")
+    args = _make_args(format="ndjson", null=False, dry_run=True, verbose=True)
+    assert cmd.execute(args) == 0
+    out, err = capsys.readouterr()
+    assert out.count("\n") == 1
+    assert json.loads(out)["content"] == "é\n"
+    assert "Generating" in err and "dry-run" in err
+
+
+def test_json_with_null_is_refused(capsys):
+    cmd = _command_with_response("GEN")
+    assert cmd.execute(_make_args(format="json", null=True)) == 1
+    assert "--null" in capsys.readouterr().err
+    cmd.cli.api.get_templates.assert_not_called()
+
+
+def test_manifest_fetches_each_selection_once_and_reports_every_entry(tmp_path, capsys):
+    for name in ("api", "worker", "web"):
+        (tmp_path / name).mkdir()
+    manifest = tmp_path / "outputs.toml"
+    manifest.write_text(
+        '[[output]]\npath = "api/.gitignore"\ntemplates = ["python", "docker"]\n'
+        '[[output]]\npath = "worker/.gitignore"\ntemplates = ["Docker", "python"]\n'
+        '[[output]]\npath = "web/.gitignore"\ntemplates = ["node"]\n'
+    )
+    cmd = _command_with_response("GEN\n")
+    cmd.cli.remote_api = MagicMock()
+
+    rc = cmd.execute(_make_args(templates=[], manifest=manifest))
+    out = capsys.readouterr().out
+
+    assert rc == 0
+    # A manifest is fetched in-process, never through a daemon client.
+    cmd.cli.remote_api.get_templates.assert_not_called()
+    assert cmd.cli.api.get_templates.call_count == 2
+    for name in ("api", "worker", "web"):
+        text = (tmp_path / name / ".gitignore").read_text()
+        assert BEGIN_MARKER in text and "GEN" in text
+        assert f"{name}/.gitignore (fetch " in out
+        assert not (tmp_path / name / SIDECAR_FILENAME).exists()
+    assert "3 outputs from 2 distinct selections" in out
+
+
+def test_manifest_errors_are_reported_without_fetching(tmp_path, capsys):
+    manifest = tmp_path / "outputs.toml"
+    manifest.write_text('[[output]]\npath = "/etc/.gitignore"\ntemplates = ["go"]\n')
+    cmd = _command_with_response("GEN")
+
+    assert cmd.execute(_make_args(templates=[], manifest=manifest)) == 1
+    assert "leaves the manifest's directory" in capsys.readouterr().out
+
+    assert cmd.execute(_make_args(templates=["go"], manifest=manifest)) == 1
+    assert "cannot be combined with template names" in capsys.readouterr().out
+    cmd.cli.api.get_templates.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "flag, extra", [("--force", {"force": True}), ("--no-sidecar", {"no_sidecar": True})]
+)
+def test_manifest_refuses_flags_it_would_ignore(tmp_path, capsys, flag, extra):
+    manifest = tmp_path / "outputs.toml"
+    manifest.write_text('[[output]]\npath = ".gitignore"\ntemplates = ["go"]\n')
+    cmd = _command_with_response("GEN")
+
+    assert cmd.execute(_make_args(templates=[], manifest=manifest, **extra)) == 1
+    assert f"cannot be combined with {flag}" in capsys.readouterr().out
+    assert not (tmp_path / ".gitignore").exists()
+    cmd.cli.api.get_templates.assert_not_called()
+
+
+def test_no_templates_and_no_manifest_is_an_error(capsys):
+    cmd = _command_with_response("GEN")
+    assert cmd.execute(_make_args(templates=[])) == 1
+    assert "--manifest" in capsys.readouterr().out
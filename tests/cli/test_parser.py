@@ -17,12 +17,43 @@ from igntui.cli.parser import (
 
 # Every subcommand the CLI advertises, and the flags each one owns. The
 # completion scripts hardcode the same lists — see test_completion_cmd.py.
-SUBCOMMANDS = ["tui", "list", "generate", "cache", "test", "completion"]
-GLOBAL_FLAGS = ["--version", "--verbose", "--log-level", "--config", "--no-cache"]
+SUBCOMMANDS = [
+    "tui",
+    "list",
+    "generate",
+    "cache",
+    "sync",
+    "check",
+    "mirror",
+    "serve",
+    "test",
+    "completion",
+]
+GLOBAL_FLAGS = [
+    "--version",
+    "--verbose",
+    "--log-level",
+    "--config",
+    "--no-cache",
+    "--network",
+    "--offline",
+]
 COMMAND_FLAGS = {
     "tui": ["--no-splash"],
-    "list": ["--filter", "--count"],
-    "generate": ["--output", "--append", "--force", "--dry-run", "--no-sidecar"],
+    "list": ["--filter", "--count", "--format", "--null"],
+    "generate": [
+        "--output",
+        "--append",
+        "--force",
+        "--dry-run",
+        "--no-sidecar",
+        "--format",
+        "--null",
+        "--manifest",
+        "--jobs",
+    ],
+    "sync": ["--jobs", "--dry-run"],
+    "serve": ["--socket"],
     "test": ["--timeout"],
 }
 
@@ -45,7 +76,7 @@ def test_every_subcommand_is_registered(parser):
 
 @pytest.mark.parametrize("flag", GLOBAL_FLAGS)
 def test_global_flag_parses(parser, flag):
-    value = {"--log-level": "DEBUG", "--config": "cfg.toml"}.get(flag)
+    value = {"--log-level": "DEBUG", "--config": "cfg.toml", "--network": "prefer-cache"}.get(flag)
     argv = [flag, value] if value else [flag]
     if flag == "--version":
         # argparse exits on --version; that it is registered is the assertion.
@@ -79,24 +110,36 @@ def test_completion_requires_a_supported_shell(parser):
         parser.parse_args(["completion", "powershell"])
 
 
-def test_generate_requires_at_least_one_template(parser):
+def test_generate_takes_templates_or_a_manifest(parser):
     assert parser.parse_args(["generate", "python"]).templates == ["python"]
     assert parser.parse_args(["generate", "python", "node"]).templates == [
         "python",
         "node",
     ]
-    with pytest.raises(SystemExit):
-        parser.parse_args(["generate"])
+    # Neither is an error too, reported by the command: see test_generate_cmd.py.
+    args = parser.parse_args(["generate", "--manifest", "outputs.toml"])
+    assert args.templates == []
+    assert str(args.manifest) == "outputs.toml"
 
 
 def test_cache_actions_are_registered(parser):
-    for action in ("clear", "stats", "info"):
+    for action in ("clear", "stats", "info", "warm"):
         assert parser.parse_args(["cache", action]).cache_action == action
     assert parser.parse_args(["cache", "clear", "--force"]).force is True
     assert parser.parse_args(["cache", "clear", "--expired"]).expired is True
     assert parser.parse_args(["cache", "clear"]).expired is False
 
 
+def test_cache_warm_takes_a_selection_and_sources(parser):
+    parsed = parser.parse_args(["cache", "warm", "python", "node", "--from-repo", "-j", "4"])
+    assert parsed.templates == ["python", "node"]
+    assert parsed.from_repo is True
+    assert parsed.jobs == 4
+    bare = parser.parse_args(["cache", "warm"])
+    assert bare.templates == []
+    assert (bare.all, bare.from_usage, bare.from_file, bare.jobs) == (False, False, None, None)
+
+
 def test_no_command_leaves_command_unset(parser):
     """`igntui` with no arguments falls through to the TUI in main()."""
     assert parser.parse_args([]).command is None
@@ -110,3 +153,9 @@ def test_every_subcommand_has_a_dispatch_entry(command):
 
 def test_unknown_command_dispatches_to_nothing():
     assert get_command_instance("nope", cli_instance=None) is None
+
+
+def test_offline_is_shorthand_for_network_offline(parser):
+    assert parser.parse_args(["--offline", "list"]).network == "offline"
+    assert parser.parse_args(["--network", "prefer-cache", "list"]).network == "prefer-cache"
+    assert parser.parse_args(["list"]).network is None
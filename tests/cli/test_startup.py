@@ -0,0 +1,98 @@
+"""Startup cost of the CLI, measured with `python -X importtime`.
+
+Every igntui invocation pays for what `igntui.main` imports before argparse
+runs, and completion scripts run igntui on every Tab press. The cache, the HTTP
+client, curses and pyfiglet are imported where they are used. One eager import
+in a package `__init__` undoes that silently, so these tests check the import
+graph of a bare `import igntui.main`.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+# Imported by `igntui.main` only if something regressed.
+DEFERRED = [
+    "igntui.core.api.client",
+    "igntui.core.cache",
+    "igntui.core.daemon",
+    "igntui.tui",
+    "urllib.request",
+    "http.client",
+    "ssl",
+    "curses",
+    "pyfiglet",
+]
+
+# Cumulative microseconds for `igntui.main`: about 35 ms on a laptop. The budget
+# leaves room for slow CI machines; `urllib.request` alone costs ~45 ms.
+BUDGET_US = 120_000
+
+
+def importtime(module: str) -> dict[str, int]:
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, total_us, name = line.split("|")
+        cumulative[name.strip()] = int(total_us)
+    return cumulative
+
+
+@pytest.fixture(scope="module")
+def main_imports() -> dict[str, int]:
+    importtime("igntui.main")  # write the .pyc files first
+    return importtime("igntui.main")
+
+
+@pytest.mark.parametrize("module", DEFERRED)
+def test_heavy_modules_are_not_imported_at_startup(main_imports, module):
+    assert module not in main_imports
+
+
+def test_import_time_is_within_budget(main_imports):
+    assert main_imports["igntui.main"] < BUDGET_US
+
+
+def test_a_command_runs_from_a_fresh_interpreter(tmp_path):
+    # The test session has every module imported already, which hides lazy
+    # imports that only fail on first use.
+    env = {**os.environ, "PYTHONPATH": str(SRC), "HOME": str(tmp_path)}
+    result = subprocess.run(
+        [sys.executable, "-m", "igntui.main", "completion", "bash"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "complete -F" in result.stdout
+
+
+def test_a_command_leaves_its_cache_stats_behind(tmp_path):
+    # The manager is gone by the time the interpreter exits; its counters must
+    # not go with it.
+    env = {**os.environ, "PYTHONPATH": str(SRC), "HOME": str(tmp_path)}
+    env.pop("IGNTUI_SOCKET", None)
+    subprocess.run(
+        [sys.executable, "-m", "igntui.main", "--offline", "list"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    stats = json.loads((tmp_path / ".cache" / "igntui" / "cache-stats.json").read_text())
+    assert stats["misses"] == 1
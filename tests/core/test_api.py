@@ -3,12 +3,23 @@
 Mocks at the urllib.request layer since igntui uses stdlib HTTP.
 """
 
+import io
+import threading
+import time
 import urllib.error
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from igntui.core.api import APIError, GitIgnoreAPI, NetworkError, RateLimitError
+from igntui.core.api import (
+    APIError,
+    DeadlineExceededError,
+    GitIgnoreAPI,
+    NetworkError,
+    RateLimitError,
+    RequestCancelledError,
+)
+from igntui.core.api.rate_limiter import RateLimiter
 from igntui.core.api.request_handler import RequestHandler
 from igntui.core.cache import CacheManager
 
@@ -116,3 +127,266 @@ def test_request_handler_raises_api_error_on_4xx_other():
     with patch("urllib.request.urlopen", side_effect=err):
         with pytest.raises(APIError):
             rh.make_request("https://example.invalid")
+
+
+# --- retry budget ------------------------------------------------------------
+
+
+def _handler(**kwargs):
+    kwargs.setdefault("retry_attempts", 5)
+    return RequestHandler(user_agent="test", **kwargs)
+
+
+def test_retry_backoff_is_jittered_and_capped():
+    rh = _handler(backoff_max=2.0)
+    waits = [rh._backoff(attempt) for attempt in range(10) for _ in range(20)]
+    assert all(0 <= w <= 2.0 for w in waits)
+    assert len(set(waits)) > 1
+
+
+def test_retry_gives_up_when_the_deadline_runs_out():
+    rh = _handler(deadline=0.3, backoff_max=0.1)
+    err = urllib.error.URLError("connection refused")
+
+    start = time.monotonic()
+    with (
+        patch("urllib.request.urlopen", side_effect=err),
+        patch("random.uniform", return_value=0.2),
+    ):
+        with pytest.raises(DeadlineExceededError) as excinfo:
+            rh.make_request_with_retry("https://example.invalid")
+
+    assert time.monotonic() - start < 0.3
+    assert isinstance(excinfo.value, NetworkError)
+    assert "connection refused" in str(excinfo.value)
+
+
+def test_retry_attempt_timeout_never_exceeds_the_remaining_budget():
+    rh = _handler(timeout=30.0, deadline=2.0)
+    with patch("urllib.request.urlopen", return_value=_fake_response("ok")) as urlopen:
+        rh.make_request_with_retry("https://example.invalid")
+    assert urlopen.call_args.kwargs["timeout"] <= 2.0
+
+
+def test_retry_after_beyond_the_deadline_fails_without_sleeping():
+    rh = _handler(deadline=5.0, retry_after_max=60.0)
+    err = urllib.error.HTTPError("u", 429, "Too Many", {"Retry-After": "30"}, None)
+
+    with (
+        patch("urllib.request.urlopen", side_effect=err) as urlopen,
+        patch("time.sleep", side_effect=AssertionError("slept past the deadline")),
+    ):
+        with pytest.raises(DeadlineExceededError):
+            rh.make_request_with_retry("https://example.invalid")
+
+    assert urlopen.call_count == 1
+
+
+def test_retry_after_is_capped():
+    rh = _handler(retry_attempts=2, retry_after_max=0.01)
+    err = urllib.error.HTTPError("u", 429, "Too Many", {"Retry-After": "3600"}, None)
+    with (
+        patch("urllib.request.urlopen", side_effect=[err, _fake_response("ok")]),
+        patch("time.sleep") as sleep,
+    ):
+        assert rh.make_request_with_retry("https://example.invalid").success
+    sleep.assert_called_once_with(0.01)
+
+
+def test_unparseable_retry_after_falls_back_to_backoff():
+    rh = _handler(retry_attempts=1)
+    headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    err = urllib.error.HTTPError("u", 429, "Too Many", headers, None)
+    with patch("urllib.request.urlopen", side_effect=err):
+        with pytest.raises(RateLimitError) as excinfo:
+            rh.make_request("https://example.invalid")
+    assert excinfo.value.retry_after is None
+
+
+def test_cancel_interrupts_a_retry_wait():
+    rh = _handler(deadline=60.0)
+    err = urllib.error.HTTPError("u", 429, "Too Many", {"Retry-After": "10"}, None)
+    cancel = threading.Event()
+    threading.Timer(0.05, cancel.set).start()
+
+    start = time.monotonic()
+    with patch("urllib.request.urlopen", side_effect=err):
+        with pytest.raises(RequestCancelledError):
+            rh.make_request_with_retry("https://example.invalid", cancel=cancel)
+
+    assert time.monotonic() - start < 2.0
+
+
+def test_a_throttled_request_stays_within_its_deadline():
+    rh = _handler(deadline=1.0)
+    rh.rate_limiter = RateLimiter(rate=0.1, burst=1)
+    rh.rate_limiter.wait_if_needed()
+
+    with (
+        patch("urllib.request.urlopen", side_effect=AssertionError("network used")),
+        patch("time.sleep", side_effect=AssertionError("slept past the deadline")),
+    ):
+        with pytest.raises(DeadlineExceededError, match="Rate limited"):
+            rh.make_request_with_retry("https://example.invalid")
+
+
+def test_cancelled_fetch_returns_a_failed_response(api):
+    cancel = threading.Event()
+    cancel.set()
+    with patch("urllib.request.urlopen", side_effect=AssertionError("network used")):
+        result = api.get_templates(["python"], cancel=cancel)
+    assert not result.success
+    assert "cancelled" in result.error_message
+
+
+# --- network policy ----------------------------------------------------------
+
+
+def test_offline_mode_serves_expired_entries_without_the_network(api):
+    api.cache_manager.set("gitignore_templates_list", ["python"], ttl=-1)
+    api.template_cache.cache_manager.set(
+        api.template_cache._make_content_key(["python"]), "### Python ###\n", ttl=-1
+    )
+    api.network_policy = "offline"
+
+    with patch("urllib.request.urlopen", side_effect=AssertionError("network used")):
+        listed = api.list_templates(force_refresh=True)
+        content = api.get_templates(["python"])
+
+    assert listed.success and listed.data == ["python"]
+    assert content.success and content.from_cache
+
+
+def test_offline_mode_miss_fails_with_a_hint(api):
+    api.network_policy = "offline"
+
+    with patch("urllib.request.urlopen", side_effect=AssertionError("network used")):
+        result = api.get_templates(["python"])
+        connection = api.test_connection()
+
+    assert not result.success
+    assert "cache import" in result.error_message
+    assert not connection.success
+
+
+def test_prefer_cache_serves_expired_entries_without_the_network(api):
+    api.cache_manager.set("gitignore_templates_list", ["python"], ttl=-1)
+    api.network_policy = "prefer-cache"
+
+    with patch("urllib.request.urlopen", side_effect=AssertionError("network used")):
+        result = api.list_templates()
+
+    assert result.success and result.from_cache
+
+
+def test_prefer_cache_miss_makes_one_attempt_and_no_backoff(api):
+    api.network_policy = "prefer-cache"
+    err = urllib.error.URLError("Name or service not known")
+
+    with (
+        patch("urllib.request.urlopen", side_effect=err) as urlopen,
+        patch("time.sleep", side_effect=AssertionError("backoff sleep")),
+    ):
+        result = api.get_templates(["python"])
+
+    assert not result.success
+    assert urlopen.call_count == 1
+
+
+def test_online_policy_refetches_expired_entries(api):
+    api.cache_manager.set("gitignore_templates_list", ["stale"], ttl=-1)
+
+    with patch("urllib.request.urlopen", return_value=_fake_response("python,node")):
+        result = api.list_templates()
+
+    assert not result.from_cache
+    assert result.data == ["node", "python"]
+
+
+def test_online_policy_falls_back_to_the_expired_copy_when_the_fetch_fails(api):
+    api.request_handler.retry_attempts = 1
+    api.cache_manager.set("gitignore_templates_list", ["python"], ttl=-1)
+    api.cache_manager.set(api.template_cache._make_content_key(["python"]), "OLD", ttl=-1)
+
+    err = urllib.error.URLError("Connection refused")
+    with patch("urllib.request.urlopen", side_effect=err):
+        listed = api.list_templates()
+        content = api.get_templates(["python"])
+        forced = api.get_templates(["python"], force_refresh=True)
+
+    assert listed.success and listed.from_cache and listed.data == ["python"]
+    assert content.success and content.from_cache and content.data == "OLD"
+    assert not forced.success
+
+
+def test_checking_names_keeps_the_expired_catalogue_for_the_fallback(api):
+    api.request_handler.retry_attempts = 1
+    api.cache_manager.set("gitignore_templates_list", ["python"], ttl=-1)
+
+    err = urllib.error.URLError("Connection refused")
+    with patch("urllib.request.urlopen", side_effect=err):
+        content = api.get_templates(["nosuch"])
+        listed = api.list_templates()
+
+    assert not content.success
+    assert listed.success and listed.from_cache and listed.data == ["python"]
+
+
+def test_unknown_configured_policy_falls_back_to_online(tmp_cache_dir, monkeypatch):
+    from igntui.core.api import client
+
+    monkeypatch.setitem(client.config._config["api"], "network", "sometimes")
+    assert GitIgnoreAPI(cache_manager=CacheManager(str(tmp_cache_dir))).network_policy == "online"
+
+
+# --- unknown names -----------------------------------------------------------
+
+
+def _not_found(body: str):
+    return urllib.error.HTTPError("u", 404, "Not Found", {}, io.BytesIO(body.encode()))
+
+
+def test_typo_is_rejected_from_the_catalogue_without_a_request(api):
+    api.template_cache.set_template_list(["Python", "Node", "Go"])
+    with patch("urllib.request.urlopen", side_effect=AssertionError("network used")):
+        result = api.get_templates(["pyhton", "go"])
+
+    assert not result.success
+    assert result.status_code == 404
+    assert result.error_message == "Unknown template: pyhton (did you mean Python?)"
+
+
+def test_catalogue_lookup_does_not_count_as_a_cache_hit(api):
+    api.template_cache.set_template_list(["python"])
+    with patch("urllib.request.urlopen", return_value=_fake_response("PY")):
+        api.get_templates(["python"])
+
+    stats = api.cache_manager.get_stats()
+    assert (stats["hits"], stats["misses"]) == (0, 1)
+
+
+def test_404_is_negatively_cached(api):
+    body = "#!! ERROR: nosuch is undefined. Use list command to see defined gitignore types !!#\n"
+    with patch("urllib.request.urlopen", side_effect=_not_found(body)) as urlopen:
+        first = api.get_templates(["python", "nosuch"])
+        second = api.get_templates(["nosuch"])
+
+    assert urlopen.call_count == 1
+    assert first.error_message == "Unknown template: nosuch"
+    assert second.error_message == "Unknown template: nosuch"
+
+
+def test_404_without_a_body_caches_nothing_for_several_names(api):
+    with patch("urllib.request.urlopen", side_effect=_not_found("")) as urlopen:
+        api.get_templates(["python", "nosuch"])
+        api.get_templates(["nosuch"])
+
+    assert urlopen.call_count == 2
+
+
+def test_force_refresh_skips_name_validation(api):
+    api.template_cache.set_template_list(["python"])
+    with patch("urllib.request.urlopen", return_value=_fake_response("NEW")):
+        result = api.get_templates(["brandnew"], force_refresh=True)
+
+    assert result.success and result.data == "NEW"
@@ -3,7 +3,7 @@
 Locks in the Phase 2.1 fix (sha256 keys + cross-process disk hits).
 """
 
-from igntui.core.cache import CacheManager, TemplateCache
+from igntui.core.cache import CATALOGUE_FILENAME, CacheManager, TemplateCache
 
 
 def test_set_then_get_in_memory(tmp_cache_dir):
@@ -140,6 +140,21 @@ def test_lazy_start_still_serves_and_promotes_disk_entries(tmp_cache_dir):
     assert fresh.get_stats()["disk_reads"] == reads_before
 
 
+def test_memory_limit_drops_the_least_recently_used_entry(tmp_cache_dir):
+    manager = CacheManager(str(tmp_cache_dir))
+    manager.memory_limit = 2
+    manager.set("a", "1")
+    manager.set("b", "2")
+    assert manager.get("a") == "1"
+    manager.set("c", "3")
+
+    assert list(manager._memory_cache) == ["a", "c"]
+    # Dropped from memory only: the disk copy still answers.
+    assert manager.get("b") == "2"
+    assert list(manager._memory_cache) == ["c", "b"]
+    assert manager.get_stats()["disk_entries"] == 3
+
+
 def test_expired_entry_is_dropped_on_read_not_at_startup(tmp_cache_dir):
     CacheManager(str(tmp_cache_dir)).set("stale", "v", ttl=-1)
 
@@ -202,7 +217,7 @@ def test_successful_write_leaves_no_temp_files_behind(tmp_cache_dir):
 
 
 def test_overwriting_a_key_never_exposes_a_partial_file(tmp_cache_dir):
-    """Every rewrite of the same key must land as valid JSON, start to finish."""
+    """Every rewrite of the same key must land whole: header and payload."""
     import json
 
     cache = CacheManager(str(tmp_cache_dir))
@@ -211,5 +226,362 @@ def test_overwriting_a_key_never_exposes_a_partial_file(tmp_cache_dir):
     for i in range(20):
         cache.set("k", f"value-{i}" * 200)
         # Read the raw file the way a second process would.
-        payload = json.loads(cache_file.read_text(encoding="utf-8"))
-        assert payload["data"] == f"value-{i}" * 200
+        header, _, body = cache_file.read_bytes().partition(b"\n")
+        assert header.startswith(b"igntui-cache/2 ")
+        assert json.loads(body) == f"value-{i}" * 200
+
+
+# --- metadata index --------------------------------------------------------
+
+
+def test_stats_come_from_the_index_not_a_directory_scan(tmp_cache_dir, monkeypatch):
+    """`cache stats` used to glob every entry file on each call."""
+    seed = CacheManager(str(tmp_cache_dir))
+    for i in range(3):
+        seed.set(f"k{i}", "v")
+
+    fresh = CacheManager(str(tmp_cache_dir))
+
+    def no_scanning(*_args, **_kwargs):
+        raise AssertionError("the cache directory must not be globbed")
+
+    monkeypatch.setattr("pathlib.Path.glob", no_scanning)
+    assert fresh.get_stats()["disk_entries"] == 3
+
+
+def test_cleanup_expired_never_parses_entry_bodies(tmp_cache_dir, monkeypatch):
+    seed = CacheManager(str(tmp_cache_dir))
+    seed.set("fresh", "v")
+    seed.set("stale", "v", ttl=-1)
+
+    def no_parsing(*_args, **_kwargs):
+        raise AssertionError("expiry must be decided from the index")
+
+    cold = CacheManager(str(tmp_cache_dir))
+    monkeypatch.setattr("json.load", no_parsing)
+    monkeypatch.setattr("json.loads", no_parsing)
+
+    assert cold.cleanup_expired() == 1
+    assert sorted(p.stem for p in tmp_cache_dir.glob("*.cache")) == ["fresh"]
+
+
+def test_index_sees_writes_from_another_manager(tmp_cache_dir):
+    """Two processes share the directory; each catches up on the other's appends."""
+    first = CacheManager(str(tmp_cache_dir))
+    second = CacheManager(str(tmp_cache_dir))
+    first.set("a", 1)
+    assert second.get_stats()["disk_entries"] == 1
+
+    first.set("b", 2)
+    first.delete("a")
+    assert second.get_stats()["disk_entries"] == 1
+
+
+def test_index_is_rebuilt_for_a_cache_written_without_one(tmp_cache_dir):
+    """Caches from before the index existed are indexed once, on first use."""
+    from igntui.core.cache_index import INDEX_FILENAME
+
+    seed = CacheManager(str(tmp_cache_dir))
+    TemplateCache(seed).set_template_list(["python"])
+    TemplateCache(seed).set_template_content(["python"], "BODY")
+    (tmp_cache_dir / INDEX_FILENAME).unlink()
+
+    summary = CacheManager(str(tmp_cache_dir)).get_disk_summary()
+
+    assert summary["entries"] == 2
+    assert summary["template_lists"] == 1
+    assert summary["content_blobs"] == 1
+    assert (tmp_cache_dir / INDEX_FILENAME).exists()
+
+
+def test_a_write_to_a_cache_without_an_index_indexes_the_older_entries(tmp_cache_dir):
+    """The first `set()` must not start a journal that holds only itself."""
+    from igntui.core.cache_index import INDEX_FILENAME
+
+    seed = CacheManager(str(tmp_cache_dir))
+    for i in range(5):
+        seed.set(f"old{i}", "v", ttl=-1)
+    (tmp_cache_dir / INDEX_FILENAME).unlink()
+
+    CacheManager(str(tmp_cache_dir)).set("new", "v")
+
+    cache = CacheManager(str(tmp_cache_dir))
+    assert cache.get_stats()["disk_entries"] == 6
+    assert cache.cleanup_expired() == 5
+    assert [p.stem for p in tmp_cache_dir.glob("*.cache")] == ["new"]
+
+
+def test_disk_summary_reports_sizes_and_write_times(tmp_cache_dir):
+    cache = CacheManager(str(tmp_cache_dir))
+    cache.set("a", "x" * 100)
+    cache.set("b", "y" * 10)
+
+    summary = cache.get_disk_summary()
+    on_disk = sum(p.stat().st_size for p in tmp_cache_dir.glob("*.cache"))
+
+    assert summary["total_bytes"] == on_disk
+    assert summary["oldest"] <= summary["newest"]
+
+
+def test_clear_resets_the_index(tmp_cache_dir):
+    cache = CacheManager(str(tmp_cache_dir))
+    cache.set("a", 1)
+    cache.clear()
+
+    assert CacheManager(str(tmp_cache_dir)).get_stats()["disk_entries"] == 0
+
+
+# --- per-template invalidation ----------------------------------------------
+
+
+def test_invalidate_removes_every_combination_with_the_template(tmp_cache_dir):
+    templates = TemplateCache(CacheManager(str(tmp_cache_dir)))
+    templates.set_template_list(["go", "node", "python"])
+    templates.set_template_content(["python"], "PY")
+    templates.set_template_content(["Node", "python"], "NODE+PY")
+    templates.set_template_content(["go"], "GO")
+
+    assert templates.invalidate_template("Python") == 2
+
+    assert templates.get_template_content(["python"]) is None
+    assert templates.get_template_content(["node", "python"]) is None
+    assert templates.get_template_content(["go"]) == "GO"
+    assert templates.get_template_list() == ["go", "node", "python"]
+
+
+def test_invalidate_uses_the_index_of_another_process(tmp_cache_dir):
+    TemplateCache(CacheManager(str(tmp_cache_dir))).set_template_content(["python"], "PY")
+    other = TemplateCache(CacheManager(str(tmp_cache_dir)))
+    other.cache_manager.keys_for_name("python")  # builds the name map
+    TemplateCache(CacheManager(str(tmp_cache_dir))).set_template_content(["go", "python"], "X")
+
+    assert other.invalidate_template("python") == 2
+    assert not list(tmp_cache_dir.glob("gitignore_content_*.cache"))
+
+
+def test_invalidate_forgets_a_cached_404(tmp_cache_dir):
+    templates = TemplateCache(CacheManager(str(tmp_cache_dir)))
+    templates.set_unknown("brandnew", "HTTP 404", ttl=600)
+
+    assert templates.invalidate_template("brandnew") == 1
+    assert templates.get_unknown("brandnew") is None
+
+
+def test_invalidate_finds_entries_after_the_index_is_rebuilt(tmp_cache_dir):
+    from igntui.core.cache_index import INDEX_FILENAME
+
+    seed = TemplateCache(CacheManager(str(tmp_cache_dir)))
+    seed.set_template_content(["python"], "PY")
+    seed.set_template_content(["C++", "python"], "CPP+PY")
+    seed.set_template_content(["go"], "GO")
+    (tmp_cache_dir / INDEX_FILENAME).unlink()
+
+    templates = TemplateCache(CacheManager(str(tmp_cache_dir)))
+    assert templates.invalidate_template("python") == 2
+    assert templates.invalidate_template("c++") == 0
+    assert templates.get_template_content(["go"]) == "GO"
+
+
+def test_invalidate_finds_migrated_version_1_content_by_its_body(tmp_cache_dir):
+    import json
+    import time
+
+    from igntui.core.cache import content_key
+    from igntui.core.cache_index import INDEX_FILENAME
+
+    body = "# Created by https://www.toptal.com/developers/gitignore/api/python,node\n"
+    for names in (["node", "python"], ["rust"]):
+        (tmp_cache_dir / f"{content_key(names)}.cache").write_text(
+            json.dumps({"data": body, "timestamp": time.time(), "ttl": 3600}),
+            encoding="utf-8",
+        )
+
+    templates = TemplateCache(CacheManager(str(tmp_cache_dir)))
+    assert templates.get_template_content(["node", "python"]) == body  # rewritten as v2
+    (tmp_cache_dir / INDEX_FILENAME).unlink()
+
+    templates = TemplateCache(CacheManager(str(tmp_cache_dir)))
+    # The rust entry's body names another selection, so it is not attributed.
+    assert templates.invalidate_template("node") == 1
+    assert templates.invalidate_template("rust") == 0
+
+
+def test_names_survive_a_journal_compaction(tmp_cache_dir):
+    cache = CacheManager(str(tmp_cache_dir))
+    TemplateCache(cache).set_template_content(["python"], "PY")
+    for i in range(300):
+        cache.set("churn", i)
+
+    fresh = CacheManager(str(tmp_cache_dir))
+    fresh.get_stats()
+    assert len(fresh.keys_for_name("python")) == 1
+
+
+# --- header/payload split --------------------------------------------------
+
+
+def test_expired_entry_is_evicted_without_reading_its_payload(tmp_cache_dir):
+    """The header alone decides expiry; a body that isn't JSON is never touched."""
+    (tmp_cache_dir / "stale.cache").write_bytes(b"igntui-cache/2 0.0 1\n<<not json>>")
+
+    cache = CacheManager(str(tmp_cache_dir))
+
+    assert cache.get("stale") is None
+    assert cache.get_stats()["evictions"] == 1
+    assert not (tmp_cache_dir / "stale.cache").exists()
+
+
+def test_version_1_entries_are_read_and_rewritten_as_version_2(tmp_cache_dir):
+    import json
+    import time
+
+    legacy = tmp_cache_dir / "k.cache"
+    legacy.write_text(
+        json.dumps(
+            {
+                "data": ["python", "node"],
+                "timestamp": time.time(),
+                "ttl": 3600,
+                "access_count": 0,
+                "last_access": None,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    assert CacheManager(str(tmp_cache_dir)).get("k") == ["python", "node"]
+    assert legacy.read_bytes().startswith(b"igntui-cache/2 ")
+    assert CacheManager(str(tmp_cache_dir)).get("k") == ["python", "node"]
+
+
+def test_expired_version_1_entries_are_still_swept(tmp_cache_dir):
+    import json
+
+    (tmp_cache_dir / "old.cache").write_text(
+        json.dumps({"data": "x", "timestamp": 0, "ttl": 1}), encoding="utf-8"
+    )
+
+    assert CacheManager(str(tmp_cache_dir)).cleanup_expired() == 1
+    assert list(tmp_cache_dir.glob("*.cache")) == []
+
+
+def test_malformed_header_is_treated_as_a_corrupt_entry(tmp_cache_dir):
+    (tmp_cache_dir / "bad.cache").write_bytes(b'igntui-cache/2 not-a-number\n"x"')
+
+    assert CacheManager(str(tmp_cache_dir)).get("bad") is None
+    assert not (tmp_cache_dir / "bad.cache").exists()
+
+
+# --- cross-process safety ----------------------------------------------------
+
+
+def test_expired_read_does_not_evict_a_fresh_rewrite(tmp_cache_dir):
+    """Another process rewrote the key between our header read and our unlink."""
+    writer = CacheManager(str(tmp_cache_dir))
+    (tmp_cache_dir / "k.cache").write_bytes(b'igntui-cache/2 0.0 1\n"old"')
+
+    reader = CacheManager(str(tmp_cache_dir))
+    original = reader._load_disk_cache
+
+    def load_then_race(key, **kwargs):
+        entry = original(key, **kwargs)
+        writer.set(key, "new")
+        return entry
+
+    reader._load_disk_cache = load_then_race
+
+    assert reader.get("k") is None
+    assert CacheManager(str(tmp_cache_dir)).get("k") == "new"
+
+
+def test_shared_stats_accumulate_across_managers(tmp_cache_dir):
+    first = CacheManager(str(tmp_cache_dir), persist_stats=True)
+    first.set("k", "v")
+    first.get("k")
+    first.get("missing")
+    first.flush_stats()
+    first.flush_stats()  # nothing new since the last flush
+
+    second = CacheManager(str(tmp_cache_dir), persist_stats=True)
+    second.get("k")
+
+    stats = second.get_stats()
+    assert stats["hits"] == 1
+    assert stats["lifetime_hits"] == 2
+    assert stats["lifetime_misses"] == 1
+    assert stats["lifetime_requests"] == 3
+    assert stats["lifetime_since"] is not None
+
+
+def test_counters_are_flushed_when_the_manager_is_collected(tmp_cache_dir):
+    """`serve` and `mirror` create managers for the life of the process."""
+    import gc
+    import weakref
+
+    manager = CacheManager(str(tmp_cache_dir), persist_stats=True)
+    manager.get("missing")
+    ref = weakref.ref(manager)
+
+    del manager
+    gc.collect()
+
+    assert ref() is None
+    assert CacheManager(str(tmp_cache_dir), persist_stats=True).get_stats()["lifetime_misses"] == 1
+
+
+def test_stats_are_not_persisted_unless_asked(tmp_cache_dir):
+    cache = CacheManager(str(tmp_cache_dir))
+    cache.get("missing")
+    cache.flush_stats()
+
+    assert "lifetime_hits" not in cache.get_stats()
+    assert not (tmp_cache_dir / "cache-stats.json").exists()
+
+
+def test_corrupt_shared_stats_file_is_ignored(tmp_cache_dir):
+    (tmp_cache_dir / "cache-stats.json").write_text("{not json", encoding="utf-8")
+    cache = CacheManager(str(tmp_cache_dir), persist_stats=True)
+    cache.get("missing")
+
+    assert cache.get_stats()["lifetime_misses"] == 1
+    cache.flush_stats()
+    assert CacheManager(str(tmp_cache_dir), persist_stats=True).get_stats()["lifetime_misses"] == 1
+
+
+def test_allow_stale_returns_an_expired_entry_without_evicting_it(tmp_cache_dir):
+    CacheManager(str(tmp_cache_dir)).set("k", "old", ttl=-1)
+
+    cache = CacheManager(str(tmp_cache_dir))
+    assert cache.get("k", allow_stale=True) == "old"
+    assert (tmp_cache_dir / "k.cache").exists()
+    assert cache.get("k") is None
+
+
+def test_storing_the_template_list_writes_the_catalogue(tmp_cache_dir):
+    templates = TemplateCache(CacheManager(str(tmp_cache_dir)))
+    templates.set_template_list(["go", "python"])
+    assert (tmp_cache_dir / CATALOGUE_FILENAME).read_text() == "go\npython\n"
+
+    templates.set_template_list(["go", "python", "rust"])
+    assert (tmp_cache_dir / CATALOGUE_FILENAME).read_text() == "go\npython\nrust\n"
+    assert [p.name for p in tmp_cache_dir.glob("*.tmp")] == []
+
+
+def test_catalogue_follows_imports_and_clears(tmp_cache_dir, tmp_path):
+    source = CacheManager(str(tmp_path / "source"))
+    TemplateCache(source).set_template_list(["node", "rust"])
+
+    target = CacheManager(str(tmp_cache_dir))
+    target.import_entries(source.export_entries())
+    assert (tmp_cache_dir / CATALOGUE_FILENAME).read_text() == "node\nrust\n"
+
+    target.clear()
+    assert not (tmp_cache_dir / CATALOGUE_FILENAME).exists()
+
+
+def test_a_list_cached_without_a_catalogue_gets_one_when_read(tmp_cache_dir):
+    TemplateCache(CacheManager(str(tmp_cache_dir))).set_template_list(["go"])
+    (tmp_cache_dir / CATALOGUE_FILENAME).unlink()
+
+    assert TemplateCache(CacheManager(str(tmp_cache_dir))).get_template_list() == ["go"]
+    assert (tmp_cache_dir / CATALOGUE_FILENAME).read_text() == "go\n"
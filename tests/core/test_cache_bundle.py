@@ -0,0 +1,195 @@
+"""Tests for portable cache bundles."""
+
+import hashlib
+import io
+import json
+import tarfile
+
+import pytest
+
+from igntui.core.cache import CacheManager, TemplateCache
+from igntui.core.cache_bundle import (
+    MANIFEST_NAME,
+    BundleError,
+    export_bundle,
+    import_bundle,
+)
+
+
+@pytest.fixture
+def source(tmp_path):
+    cache = CacheManager(str(tmp_path / "source"))
+    templates = TemplateCache(cache)
+    templates.set_template_list(["node", "python"])
+    templates.set_template_content(["python"], "### Python ###\n")
+    templates.set_template_content(["node", "python"], "### Node ###\n### Python ###\n")
+    return cache
+
+
+def test_bundle_round_trip(source, tmp_path):
+    bundle = tmp_path / "cache.tar.gz"
+    assert export_bundle(source, bundle) == 3
+
+    target = CacheManager(str(tmp_path / "target"))
+    report = import_bundle(target, bundle)
+
+    assert (report.imported, report.skipped, report.corrupt) == (3, 0, [])
+    templates = TemplateCache(CacheManager(str(tmp_path / "target")))
+    assert templates.get_template_list() == ["node", "python"]
+    assert templates.get_template_content(["python", "node"]) == "### Node ###\n### Python ###\n"
+
+
+def test_export_skips_an_entry_with_a_malformed_header(source, tmp_path, monkeypatch):
+    entries = list(source.export_entries())
+    entries.append(("gitignore_content_0000000000000000", b'igntui-cache/2 not-a-time\n"x"'))
+    monkeypatch.setattr(source, "export_entries", lambda: iter(entries))
+
+    assert export_bundle(source, tmp_path / "cache.tar.gz") == 3
+
+
+def test_manifest_records_versions_timestamps_and_checksums(source, tmp_path):
+    bundle = tmp_path / "cache.tar.gz"
+    export_bundle(source, bundle)
+
+    with tarfile.open(bundle, "r:gz") as tar:
+        manifest = json.load(tar.extractfile(MANIFEST_NAME))
+
+    assert manifest["format"] == "igntui-cache-bundle"
+    assert manifest["version"] == 1
+    assert manifest["igntui_version"]
+    entry = next(e for e in manifest["entries"] if e["kind"] == "list")
+    assert entry["key"] == "gitignore_templates_list"
+    assert len(entry["sha256"]) == 64
+    assert entry["timestamp"] > 0 and entry["ttl"] == 3600
+
+
+def test_import_is_one_bulk_write_not_a_set_per_entry(source, tmp_path, monkeypatch):
+    bundle = tmp_path / "cache.tar.gz"
+    export_bundle(source, bundle)
+    target = CacheManager(str(tmp_path / "target"))
+
+    def no_set(*_a, **_k):
+        raise AssertionError("import must not go through set()")
+
+    appends = []
+    monkeypatch.setattr(target, "set", no_set)
+    original_append = target._index._append
+    monkeypatch.setattr(
+        target._index, "_append", lambda text: (appends.append(text), original_append(text))
+    )
+
+    import_bundle(target, bundle)
+
+    assert len(appends) == 1
+    assert appends[0].count("\n") == 3
+
+
+def test_import_keeps_a_newer_cached_entry(source, tmp_path):
+    bundle = tmp_path / "cache.tar.gz"
+    export_bundle(source, bundle)
+    target = CacheManager(str(tmp_path / "target"))
+    TemplateCache(target).set_template_list(["fresher"])
+
+    report = import_bundle(target, bundle)
+
+    assert report.skipped == 1
+    assert TemplateCache(target).get_template_list() == ["fresher"]
+
+
+def test_entries_failing_their_checksum_are_skipped(source, tmp_path):
+    bundle = tmp_path / "cache.tar.gz"
+    export_bundle(source, bundle)
+
+    tampered = tmp_path / "tampered.tar.gz"
+    with tarfile.open(bundle, "r:gz") as src, tarfile.open(tampered, "w:gz") as dst:
+        for member in src.getmembers():
+            data = src.extractfile(member).read()
+            if member.name == "entries/gitignore_templates_list.cache":
+                data = data.replace(b"python", b"pwned!")
+            dst.addfile(member, io.BytesIO(data))
+
+    target = CacheManager(str(tmp_path / "target"))
+    report = import_bundle(target, tampered)
+
+    assert report.corrupt == ["gitignore_templates_list"]
+    assert report.imported == 2
+    assert TemplateCache(target).get_template_list() is None
+
+
+def test_imported_entries_can_be_invalidated_by_name(source, tmp_path):
+    bundle = tmp_path / "cache.tar.gz"
+    export_bundle(source, bundle)
+    target = TemplateCache(CacheManager(str(tmp_path / "target")))
+    import_bundle(target.cache_manager, bundle)
+
+    assert target.invalidate_template("python") == 2
+    assert target.get_template_list() == ["node", "python"]
+
+
+def test_imported_names_survive_an_index_rebuild(source, tmp_path):
+    from igntui.core.cache_index import INDEX_FILENAME
+
+    # Entry files whose headers predate names: only the manifest carries them.
+    for path in (tmp_path / "source").glob("gitignore_content_*.cache"):
+        header, _, body = path.read_bytes().partition(b"\n")
+        path.write_bytes(b" ".join(header.split()[:3]) + b"\n" + body)
+    bundle = tmp_path / "cache.tar.gz"
+    export_bundle(source, bundle)
+    import_bundle(CacheManager(str(tmp_path / "target")), bundle)
+    (tmp_path / "target" / INDEX_FILENAME).unlink()
+
+    target = TemplateCache(CacheManager(str(tmp_path / "target")))
+    assert target.invalidate_template("python") == 2
+
+
+def test_not_a_bundle_is_rejected(tmp_path):
+    junk = tmp_path / "junk.tar.gz"
+    junk.write_bytes(b"not a tarball")
+    with pytest.raises(BundleError):
+        import_bundle(CacheManager(str(tmp_path / "target")), junk)
+
+
+def test_newer_bundle_version_is_rejected(tmp_path):
+    bundle = tmp_path / "future.tar.gz"
+    manifest = json.dumps({"format": "igntui-cache-bundle", "version": 99, "entries": []})
+    with tarfile.open(bundle, "w:gz") as tar:
+        info = tarfile.TarInfo(MANIFEST_NAME)
+        info.size = len(manifest)
+        tar.addfile(info, io.BytesIO(manifest.encode()))
+
+    with pytest.raises(BundleError, match="newer"):
+        import_bundle(CacheManager(str(tmp_path / "target")), bundle)
+
+
+def test_unsafe_keys_are_not_written_outside_the_cache(tmp_path):
+    target = CacheManager(str(tmp_path / "target"))
+    raw = b'igntui-cache/2 1.0 3600\n"x"'
+    assert target.import_entries([("../escape", raw), ("ok", raw)]) == 1
+    assert not (tmp_path / "escape.cache").exists()
+
+
+def test_rejected_entries_are_not_counted_as_kept(tmp_path):
+    """A checksummed entry the cache refuses is reported, not called 'newer'."""
+    good = b'igntui-cache/2 1.0 3600\n"x"'
+    bad = b'{"not": "a v2 entry"}'
+    entries = [("ok", good), ("../escape", good), ("malformed", bad)]
+    manifest = {
+        "format": "igntui-cache-bundle",
+        "version": 1,
+        "entries": [
+            {"key": key, "sha256": hashlib.sha256(raw).hexdigest()} for key, raw in entries
+        ],
+    }
+    bundle = tmp_path / "crafted.tar.gz"
+    with tarfile.open(bundle, "w:gz") as tar:
+        for name, data in [(MANIFEST_NAME, json.dumps(manifest).encode())] + [
+            (f"entries/{key}.cache", raw) for key, raw in entries
+        ]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+
+    report = import_bundle(CacheManager(str(tmp_path / "target")), bundle)
+
+    assert (report.imported, report.skipped, report.corrupt) == (1, 0, [])
+    assert sorted(report.rejected) == ["../escape", "malformed"]
@@ -0,0 +1,85 @@
+"""Tests for `igntui check` drift detection."""
+
+from igntui.core.api.response import APIResponse
+from igntui.core.check import CheckReport, check_targets
+from igntui.core.managed_block import content_digest, extract_managed, merge
+from igntui.core.project_config import SIDECAR_FILENAME, ProjectConfig
+from igntui.core.sync import find_sidecars, load_targets
+
+
+class FakeAPI:
+    def __init__(self, content=None):
+        self.calls = []
+        self.content = content or {}
+
+    def get_templates(self, technologies, force_refresh=False):
+        self.calls.append(tuple(technologies))
+        key = ",".join(sorted(t.lower() for t in technologies))
+        if key not in self.content:
+            return APIResponse(success=False, data="", error_message="not cached")
+        return APIResponse(success=True, data=self.content[key])
+
+
+def _project(root, name, templates, body=None):
+    directory = root / name
+    ProjectConfig(templates=templates).dump(directory / SIDECAR_FILENAME)
+    if body is not None:
+        (directory / ".gitignore").write_text(body)
+    return directory / ".gitignore"
+
+
+def _check(root, api):
+    report = CheckReport()
+    return check_targets(api, load_targets(find_sidecars(root), report.failed), report)
+
+
+def test_digest_of_a_merged_block_matches_the_content():
+    content = "### Python ###\n__pycache__/\n\n"
+    assert content_digest(extract_managed(merge("mine/\n", content))) == content_digest(content)
+
+
+def test_current_files_pass_and_one_resolution_serves_a_selection(tmp_path):
+    api = FakeAPI({"python": "### Python ###\n"})
+    paths = [
+        _project(tmp_path, f"p{i}", ["python"], merge(None, "### Python ###\n")) for i in range(50)
+    ]
+
+    report = _check(tmp_path, api)
+
+    assert report.ok
+    assert report.current == sorted(paths)
+    assert len(api.calls) == 1
+
+
+def test_hand_edited_block_is_drift_but_custom_patterns_are_not(tmp_path):
+    api = FakeAPI({"python": "### Python ###\n"})
+    clean = merge(None, "### Python ###\n")
+    edited = _project(
+        tmp_path, "edited", ["python"], clean.replace("### Python ###", "### Pyth ###")
+    )
+    custom = _project(
+        tmp_path,
+        "custom",
+        ["python"],
+        clean.replace("preserves this block) <<<\n", "preserves this block) <<<\nmine/\n", 1),
+    )
+
+    report = _check(tmp_path, api)
+
+    assert report.drifted == [edited]
+    assert report.current == [custom]
+    assert not report.ok
+
+
+def test_missing_unmanaged_and_unresolvable_files_are_reported(tmp_path):
+    api = FakeAPI({"python": "### Python ###\n"})
+    missing = _project(tmp_path, "missing", ["python"])
+    unmanaged = _project(tmp_path, "plain", ["python"], "*.log\n")
+    uncached = _project(tmp_path, "uncached", ["rust"], merge(None, "### Rust ###\n"))
+
+    report = _check(tmp_path, api)
+
+    assert report.missing == [missing]
+    assert report.unmanaged == [unmanaged]
+    assert report.failed == [(uncached, "not cached")]
+    assert report.total == 3
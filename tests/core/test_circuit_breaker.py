@@ -0,0 +1,155 @@
+"""Tests for the circuit breaker in front of the API."""
+
+import time
+import urllib.error
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from igntui.core.api import CircuitOpenError, GitIgnoreAPI
+from igntui.core.api.circuit_breaker import CircuitBreaker
+from igntui.core.cache import CacheManager
+
+
+def trip(breaker: CircuitBreaker, times: int) -> None:
+    for _ in range(times):
+        breaker.before_request()
+        breaker.record_failure()
+
+
+def test_opens_after_the_threshold_and_refuses_requests(tmp_path):
+    breaker = CircuitBreaker(tmp_path / "c.json", failure_threshold=3, cooldown=60)
+    trip(breaker, 2)
+    assert not breaker.is_open()
+
+    trip(breaker, 1)
+
+    assert breaker.is_open()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    assert breaker.snapshot()["state"] == "open"
+
+
+def test_a_success_resets_the_failure_streak(tmp_path):
+    breaker = CircuitBreaker(tmp_path / "c.json", failure_threshold=3, cooldown=60)
+    trip(breaker, 2)
+    breaker.record_success()
+    trip(breaker, 2)
+
+    assert not breaker.is_open()
+
+
+def test_half_open_lets_one_probe_through_after_the_cooldown(tmp_path):
+    breaker = CircuitBreaker(tmp_path / "c.json", failure_threshold=1, cooldown=0.05)
+    trip(breaker, 1)
+    time.sleep(0.06)
+
+    breaker.before_request()  # the probe
+    assert breaker.snapshot()["state"] == "half-open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()  # everyone else waits for it
+
+    breaker.record_success()
+    assert breaker.snapshot()["state"] == "closed"
+    assert not (tmp_path / "c.json").exists()
+
+
+def test_a_failed_probe_reopens_the_circuit(tmp_path):
+    breaker = CircuitBreaker(tmp_path / "c.json", failure_threshold=1, cooldown=0.05)
+    trip(breaker, 1)
+    time.sleep(0.06)
+
+    breaker.before_request()
+    breaker.record_failure()
+
+    assert breaker.is_open()
+
+
+def test_state_is_shared_through_the_state_file(tmp_path):
+    trip(CircuitBreaker(tmp_path / "c.json", failure_threshold=2, cooldown=60), 2)
+
+    other_process = CircuitBreaker(tmp_path / "c.json", failure_threshold=2, cooldown=60)
+
+    assert other_process.is_open()
+
+
+def test_is_open_reads_the_state_file_once(tmp_path, monkeypatch):
+    trip(CircuitBreaker(tmp_path / "c.json", failure_threshold=2, cooldown=60), 2)
+    breaker = CircuitBreaker(tmp_path / "c.json", failure_threshold=2, cooldown=60)
+    assert breaker.is_open()
+
+    def no_reading(*_a, **_k):
+        raise AssertionError("is_open must answer from memory")
+
+    monkeypatch.setattr("builtins.open", no_reading)
+    assert breaker.is_open()
+
+
+def test_threshold_zero_disables_the_breaker(tmp_path):
+    breaker = CircuitBreaker(tmp_path / "c.json", failure_threshold=0)
+    trip(breaker, 10)
+
+    assert not breaker.is_open()
+    assert not (tmp_path / "c.json").exists()
+
+
+# --- through GitIgnoreAPI ----------------------------------------------------
+
+
+@pytest.fixture
+def api(tmp_cache_dir):
+    api = GitIgnoreAPI(cache_manager=CacheManager(str(tmp_cache_dir)))
+    api.request_handler.retry_attempts = 1
+    api.circuit_breaker.failure_threshold = 2
+    return api
+
+
+def test_open_circuit_fails_fast_without_touching_the_network(api):
+    err = urllib.error.URLError("Connection refused")
+    with patch("urllib.request.urlopen", side_effect=err) as urlopen:
+        api.get_templates(["python"])
+        api.get_templates(["node"])
+        assert urlopen.call_count == 2
+
+        result = api.get_templates(["rust"])
+
+    assert urlopen.call_count == 2
+    assert not result.success
+    assert "unavailable" in result.error_message
+
+
+def test_open_circuit_serves_an_expired_copy(api):
+    api.cache_manager.set("gitignore_templates_list", ["python"], ttl=-1)
+    api.circuit_breaker.record_failure()
+    api.circuit_breaker.record_failure()
+
+    with patch("urllib.request.urlopen", side_effect=AssertionError("network used")):
+        result = api.list_templates(force_refresh=True)
+
+    assert result.success and result.from_cache
+    assert result.data == ["python"]
+
+
+def test_a_404_does_not_count_as_the_service_failing(api):
+    err = urllib.error.HTTPError("u", 404, "Not Found", {}, None)
+    with patch("urllib.request.urlopen", side_effect=err):
+        for name in ("a", "b", "c"):
+            api.get_templates([name])
+
+    assert api.circuit_breaker.snapshot()["state"] == "closed"
+
+
+def test_connection_test_probes_through_an_open_circuit_and_reports_it(api):
+    api.circuit_breaker.record_failure()
+    api.circuit_breaker.record_failure()
+    response = MagicMock()
+    response.read.return_value = b"python"
+    response.getcode.return_value = 200
+    response.__enter__.return_value = response
+
+    with patch("urllib.request.urlopen", return_value=response):
+        result = api.test_connection()
+
+    assert result.success
+    assert result.data["circuit"]["state"] == "closed"
+    assert api.get_stats()["api_stats"]["circuit"]["state"] == "closed"
@@ -4,9 +4,12 @@ import os
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 import tomli_w
 
-from igntui.core.config import Config
+from igntui.core import config as config_module
+from igntui.core.config import Config, resolve_config
+from igntui.core.repo_config import REPO_CONFIG_FILENAME
 
 
 def _write_toml(path: Path, data: dict) -> None:
@@ -108,3 +111,59 @@ def test_user_config_legacy_json_is_migrated(tmp_path):
     assert target.exists()
     assert legacy.exists()  # left in place
     assert cfg.get("api", "timeout") == 42
+
+
+@pytest.fixture
+def shared_config():
+    """Restore the process-wide cascade after a test points it elsewhere."""
+    yield config_module
+    config_module.configure()
+
+
+def test_resolve_config_is_shared_until_a_file_changes(tmp_path):
+    user_path = tmp_path / "user.cfg.toml"
+    _write_toml(user_path, {"api": {"timeout": 30}})
+
+    first = resolve_config(user_path)
+    assert resolve_config(user_path) is first
+
+    _write_toml(user_path, {"api": {"timeout": 31, "retry_attempts": 9}})
+    second = resolve_config(user_path)
+    assert second is not first
+    assert second.get("api", "timeout") == 31
+
+
+def test_resolve_config_follows_env_overrides(tmp_path):
+    user_path = tmp_path / "absent.toml"
+    before = resolve_config(user_path)
+    with patch.dict(os.environ, {"IGNTUI_API_TIMEOUT": "4"}):
+        assert resolve_config(user_path).get("api", "timeout") == 4
+    assert resolve_config(user_path).get("api", "timeout") == before.get("api", "timeout")
+
+
+def test_configure_is_lazy_and_reaches_the_shared_view(tmp_path, shared_config):
+    user_path = tmp_path / "user.cfg.toml"
+    repo_path = tmp_path / "repo" / REPO_CONFIG_FILENAME
+    _write_toml(user_path, {"api": {"timeout": 30}})
+    _write_toml(repo_path, {"api": {"user_agent": "from-repo"}})
+
+    with patch.object(Config, "__init__", side_effect=AssertionError("read eagerly")):
+        shared_config.configure(user_path)
+
+    with patch.object(Path, "cwd", lambda: repo_path.parent):
+        assert shared_config.config.get("api", "timeout") == 30
+    assert shared_config.config.get("api", "user_agent") == "from-repo"
+    assert shared_config.config.repo_config_path == repo_path
+    assert shared_config.get_config() is resolve_config(user_path, repo_path)
+
+
+def test_cli_config_flag_reaches_the_api(tmp_path, shared_config):
+    from igntui.cli.base import BaseCLI
+
+    user_path = tmp_path / "user.cfg.toml"
+    _write_toml(user_path, {"api": {"base_url": "http://mirror.invalid"}})
+
+    cli = BaseCLI(config_path=user_path, command="generate")
+
+    assert cli.config is shared_config.get_config()
+    assert cli.api.base_url == "http://mirror.invalid"
@@ -0,0 +1,187 @@
+"""Tests for the `igntui serve` daemon and the client the CLI uses to reach it."""
+
+import json
+import socket
+import stat
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from igntui.cli.base import BaseCLI
+from igntui.core import daemon
+from igntui.core.api.response import APIResponse
+from igntui.core.daemon import DaemonClient, DaemonError, DaemonServer
+
+pytestmark = pytest.mark.skipif(not daemon.supported(), reason="needs AF_UNIX")
+
+
+class FakeAPI:
+    def __init__(self):
+        self.network_policy = "online"
+        self.force_refresh_default = False
+        self.cache_manager = MagicMock()
+        self.cache_manager.drop_memory.return_value = 3
+        self.calls = []
+
+    def list_templates(self, force_refresh=False, cancel=None):
+        self.calls.append(("list", force_refresh))
+        return APIResponse(success=True, data=["go", "python", "pythonvanilla"], from_cache=True)
+
+    def get_templates(self, technologies, force_refresh=False, cancel=None):
+        self.calls.append(("get", tuple(technologies), force_refresh))
+        return APIResponse(success=True, data=f"### {','.join(technologies)} ###\n")
+
+
+@pytest.fixture
+def served(tmp_path):
+    api = FakeAPI()
+    server = DaemonServer(tmp_path / "d.sock", api=api)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server, api
+    server.shutdown()
+    server.server_close()
+    thread.join(5)
+
+
+def _client(path, fallback=None, **kw):
+    return DaemonClient(path, fallback=fallback or FakeAPI, **kw)
+
+
+def test_requests_round_trip_over_one_connection(served):
+    server, api = served
+    client = _client(server.path)
+
+    listed = client.list_templates()
+    content = client.get_templates(["Python", "go"])
+    first_socket = client._sock
+    client.get_templates(["rust"])
+
+    assert listed == APIResponse(
+        success=True, data=["go", "python", "pythonvanilla"], from_cache=True
+    )
+    assert content.success and content.data == "### Python,go ###\n"
+    assert client._sock is first_socket
+    assert api.calls == [
+        ("list", False),
+        ("get", ("Python", "go"), False),
+        ("get", ("rust",), False),
+    ]
+    assert client.local is None
+    client.close()
+
+
+def test_no_cache_travels_with_the_request(served):
+    server, api = served
+    client = _client(server.path, force_refresh_default=True)
+    client.get_templates(["go"])
+    assert api.calls == [("get", ("go",), True)]
+    client.close()
+
+
+def test_socket_is_owner_only_and_removed_on_close(tmp_path):
+    server = DaemonServer(tmp_path / "d.sock", api=FakeAPI())
+    assert stat.S_IMODE(server.path.stat().st_mode) == 0o600
+    server.server_close()
+    assert not server.path.exists()
+
+
+def test_missing_socket_falls_back_in_process(tmp_path):
+    local = FakeAPI()
+    client = _client(tmp_path / "absent.sock", fallback=lambda: local, network_policy="offline")
+
+    response = client.get_templates(["go"])
+
+    assert response.data == "### go ###\n"
+    assert client.local is local
+    assert local.network_policy == "offline"
+
+
+def test_daemon_that_goes_away_mid_session_falls_back(served):
+    server, api = served
+    local = FakeAPI()
+    client = _client(server.path, fallback=lambda: local)
+    client.list_templates()
+
+    server.shutdown()
+    server.server_close()
+    client.list_templates()
+
+    assert client.local is local
+    assert local.calls == [("list", False)]
+
+
+def test_concurrent_fall_backs_build_one_configured_api(tmp_path):
+    built = []
+    ready = threading.Barrier(8)
+
+    def fallback():
+        local = FakeAPI()
+        built.append(local)
+        return local
+
+    client = _client(tmp_path / "absent.sock", fallback=fallback, network_policy="offline")
+    seen = []
+
+    def worker():
+        ready.wait()
+        api = client._fall_back()
+        seen.append((api, api.network_policy))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(built) == 1
+    assert seen == [(built[0], "offline")] * 8
+
+
+def test_other_protocol_versions_are_refused(served):
+    server, _ = served
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(server.path))
+        sock.sendall(b'{"v": 99, "op": "ping"}\n')
+        reply = json.loads(sock.makefile("rb").readline())
+    assert not reply["ok"] and "protocol" in reply["error"]
+
+
+def test_errors_are_reported_not_fallen_back_from(served):
+    server, _ = served
+    client = _client(server.path)
+    with pytest.raises(DaemonError, match="unknown op"):
+        client.request({"op": "frobnicate"})
+    with pytest.raises(DaemonError, match="network policy"):
+        client.request({"op": "list", "network": "sometimes"})
+    assert client.local is None
+    client.close()
+
+
+def test_flush(served):
+    server, api = served
+    client = _client(server.path)
+
+    assert client.request({"op": "flush"})["dropped"] == 3
+    api.cache_manager.drop_memory.assert_called_once()
+    client.close()
+
+
+def test_server_bounds_its_memory_cache(served):
+    _, api = served
+    assert api.cache_manager.memory_limit == daemon.MEMORY_ENTRIES
+
+
+def test_cli_uses_the_daemon_only_for_read_only_commands(served, monkeypatch):
+    server, _ = served
+    monkeypatch.setattr(daemon, "socket_path", lambda: server.path)
+
+    cli = BaseCLI(command="list")
+    assert isinstance(cli.remote_api, DaemonClient)
+    assert cli.api is not cli.remote_api
+    in_process = BaseCLI(command="cache")
+    assert in_process.remote_api is in_process.api
+    assert not BaseCLI(command="sync").use_daemon
+    assert not BaseCLI(command="generate", config_path=server.path.parent / "x.toml").use_daemon
+    assert not BaseCLI(command="completion").use_daemon
@@ -0,0 +1,49 @@
+"""Tests for the inter-process file lock."""
+
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from igntui.core.file_lock import HAS_FCNTL, FileLock
+
+
+def test_lock_is_reentrant_within_a_thread(tmp_path):
+    lock = FileLock(tmp_path / "x.lock")
+    with lock:
+        with lock:
+            assert lock._depth == 2
+    assert lock._depth == 0
+    assert lock._fd is None
+
+
+@pytest.mark.skipif(not HAS_FCNTL, reason="flock is POSIX-only")
+def test_lock_excludes_another_process(tmp_path):
+    path = tmp_path / "x.lock"
+    script = textwrap.dedent(
+        f"""
+        import time
+        from igntui.core.file_lock import FileLock
+        print("ready", flush=True)
+        start = time.monotonic()
+        with FileLock({str(path)!r}):
+            print(time.monotonic() - start, flush=True)
+        """
+    )
+    with FileLock(path):
+        child = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, text=True)
+        # Hold the lock for a while after the child is about to ask for it.
+        assert child.stdout.readline().strip() == "ready"
+        time.sleep(0.5)
+    out, _ = child.communicate(timeout=10)
+
+    assert child.returncode == 0
+    assert float(out) >= 0.3
+
+
+def test_unlockable_path_degrades_to_in_process_locking(tmp_path):
+    lock = FileLock(tmp_path / "missing-dir" / "x.lock")
+    with lock:
+        assert lock._fd is None
@@ -0,0 +1,61 @@
+"""Tests for reading `generate --manifest` files."""
+
+import pytest
+
+from igntui.core.manifest import ManifestError, load_manifest
+
+
+def _manifest(tmp_path, text):
+    path = tmp_path / "outputs.toml"
+    path.write_text(text)
+    return path
+
+
+def test_entries_become_targets_in_file_order(tmp_path):
+    path = _manifest(
+        tmp_path,
+        """
+[[output]]
+path = "web/.gitignore"
+templates = ["node"]
+
+[[output]]
+path = "api/.gitignore"
+templates = ["python", "docker"]
+""",
+    )
+
+    targets = load_manifest(path)
+
+    assert [t.output for t in targets] == [
+        tmp_path / "web" / ".gitignore",
+        tmp_path / "api" / ".gitignore",
+    ]
+    assert targets[1].templates == ["python", "docker"]
+    assert targets[1].selection == ("docker", "python")
+
+
+@pytest.mark.parametrize(
+    "text, message",
+    [
+        ("not toml = = 1", "cannot read"),
+        ("[selection]\ntemplates = []", "no [[output]] entries"),
+        ('[[output]]\ntemplates = ["go"]', "needs a `path`"),
+        ('[[output]]\npath = "a/.gitignore"\ntemplates = []', "non-empty list"),
+        ('[[output]]\npath = "a/.gitignore"\ntemplates = "go"', "non-empty list"),
+        ('[[output]]\npath = "../x/.gitignore"\ntemplates = ["go"]', "leaves the manifest"),
+        (
+            '[[output]]\npath = "a/.gitignore"\ntemplates = ["go"]\n'
+            '[[output]]\npath = "a/../a/.gitignore"\ntemplates = ["node"]',
+            "already entry #1",
+        ),
+    ],
+)
+def test_malformed_manifests_are_refused_whole(tmp_path, text, message):
+    with pytest.raises(ManifestError, match=message.replace("[", r"\[")):
+        load_manifest(_manifest(tmp_path, text))
+
+
+def test_a_missing_manifest_is_a_manifest_error(tmp_path):
+    with pytest.raises(ManifestError, match="cannot read"):
+        load_manifest(tmp_path / "missing.toml")
@@ -0,0 +1,129 @@
+"""Tests for `igntui mirror serve`, the cache-backed gitignore.io stand-in."""
+
+import gzip
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from igntui.core.api.client import GitIgnoreAPI
+from igntui.core.cache import CacheManager, TemplateCache
+from igntui.core.mirror import MirrorServer
+
+ORIGIN = "https://www.toptal.com/developers/gitignore"
+
+
+def _upstream(*names):
+    """A body framed the way gitignore.io frames it."""
+    joined = ",".join(names)
+    sections = "\n\n".join(f"### {n.title()} ###\n{n}-build/" for n in names)
+    return (
+        f"# Created by {ORIGIN}/api/{joined}\n"
+        f"# Edit at {ORIGIN}?templates={joined}\n\n"
+        f"{sections}\n\n"
+        f"# End of {ORIGIN}/api/{joined}\n"
+    )
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    cache = CacheManager(tmp_path / "mirror-cache")
+    templates = TemplateCache(cache)
+    templates.set_template_list(["go", "node", "python", "rust"])
+    for name in ("go", "python", "node"):
+        templates.set_template_content([name], _upstream(name))
+    templates.set_template_content(["go", "node"], "cached as a whole\n")
+
+    server = MirrorServer(("127.0.0.1", 0), cache)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(5)
+
+
+def _get(server, path, headers=None):
+    request = urllib.request.Request(server.url + path, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, dict(response.headers), response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, dict(e.headers), e.read()
+
+
+def test_list_is_the_catalogue(mirror):
+    status, _, body = _get(mirror, "/list")
+    assert status == 200
+    assert body.decode().strip().split(",") == ["go", "node", "python", "rust"]
+
+
+def test_selection_is_composed_from_fragments(mirror):
+    status, _, body = _get(mirror, "/python,go")
+    assert status == 200
+    assert body.decode() == _upstream("python", "go")
+
+
+def test_selection_cached_as_a_whole_is_served_as_cached(mirror):
+    assert _get(mirror, "/node,go")[2] == b"cached as a whole\n"
+
+
+def test_a_refreshed_entry_is_served_fresh(mirror, tmp_path):
+    assert _get(mirror, "/python,go")[2].decode() == _upstream("python", "go")
+
+    # Another process refreshes the cache underneath the running mirror.
+    other = TemplateCache(CacheManager(tmp_path / "mirror-cache"))
+    other.set_template_content(["python"], _upstream("python").replace("python-build", "venv"))
+    assert "venv/" in _get(mirror, "/python,go")[2].decode()
+
+    other.set_template_content(["python", "go"], "cached as a whole\n")
+    assert _get(mirror, "/python,go")[2] == b"cached as a whole\n"
+
+
+def test_unknown_names_get_gitignore_io_404(mirror):
+    status, _, body = _get(mirror, "/python,pythn")
+    assert status == 404
+    assert body.decode().startswith("#!! ERROR: pythn is undefined")
+
+
+def test_catalogued_but_uncached_is_404_with_a_reason(mirror):
+    with pytest.raises(urllib.error.HTTPError) as e:
+        urllib.request.urlopen(mirror.url + "/rust", timeout=5)
+    assert e.value.code == 404
+    assert "rust" in e.value.reason
+
+
+def test_etag_revalidates_and_gzip_is_negotiated(mirror):
+    _, headers, plain = _get(mirror, "/python,go")
+    etag = headers["ETag"]
+
+    assert _get(mirror, "/python,go", {"If-None-Match": etag})[0] == 304
+
+    _, headers, body = _get(mirror, "/python,go", {"Accept-Encoding": "gzip"})
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["ETag"] == etag
+    assert gzip.decompress(body) == plain
+
+
+def test_stats_are_kept_per_endpoint(mirror):
+    _get(mirror, "/list")
+    _get(mirror, "/go")
+    _get(mirror, "/nope")
+
+    stats = json.loads(_get(mirror, "/_mirror/stats")[2])
+
+    assert stats["list"]["requests"] == 1
+    assert stats["templates"] == {**stats["templates"], "requests": 2, "errors": 1}
+    assert stats["templates"]["max_ms"] >= stats["templates"]["p50_ms"]
+
+
+def test_an_igntui_client_can_use_it(mirror, tmp_path):
+    api = GitIgnoreAPI(cache_manager=CacheManager(tmp_path / "client-cache"))
+    api.base_url = mirror.url
+
+    assert api.list_templates().data == ["go", "node", "python", "rust"]
+    response = api.get_templates(["go", "python"])
+    assert response.success and "### Python ###" in response.data
+    assert "pythn" in api.get_templates(["pythn"]).error_message
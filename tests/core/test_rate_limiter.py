@@ -0,0 +1,91 @@
+"""Tests for the token-bucket rate limiter."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from igntui.core.api.errors import DeadlineExceededError, RequestCancelledError
+from igntui.core.api.rate_limiter import RATE_LIMIT_FILENAME, RateLimiter
+
+
+def test_burst_goes_out_without_waiting():
+    limiter = RateLimiter(rate=1.0, burst=3)
+    with patch("time.sleep", side_effect=AssertionError("slept inside the burst")):
+        for _ in range(3):
+            limiter.wait_if_needed()
+
+
+def test_empty_bucket_waits_for_the_refill():
+    limiter = RateLimiter(rate=100.0, burst=1)
+    limiter.wait_if_needed()
+    with patch("time.sleep") as sleep:
+        sleep.side_effect = lambda s: limiter._save(1.0, limiter._updated)
+        limiter.wait_if_needed()
+    (wait,), _ = sleep.call_args
+    assert 0 < wait <= 0.01
+
+
+def test_a_wait_past_the_deadline_gives_up_without_sleeping():
+    limiter = RateLimiter(rate=0.1, burst=1)
+    limiter.wait_if_needed()
+    with patch("time.sleep", side_effect=AssertionError("slept past the deadline")):
+        with pytest.raises(DeadlineExceededError):
+            limiter.wait_if_needed(give_up_at=time.monotonic() + 2.0)
+
+
+def test_cancel_interrupts_the_wait():
+    limiter = RateLimiter(rate=0.1, burst=1)
+    limiter.wait_if_needed()
+    cancel = threading.Event()
+    threading.Timer(0.05, cancel.set).start()
+
+    start = time.monotonic()
+    with pytest.raises(RequestCancelledError):
+        limiter.wait_if_needed(cancel=cancel)
+    assert time.monotonic() - start < 2.0
+
+
+def test_zero_rate_disables_the_limiter():
+    limiter = RateLimiter(rate=0, burst=1)
+    with patch("time.sleep", side_effect=AssertionError("slept while disabled")):
+        for _ in range(10):
+            limiter.wait_if_needed()
+
+
+def test_threads_never_take_more_than_the_bucket_holds():
+    limiter = RateLimiter(rate=0.001, burst=5)
+    taken = []
+
+    def take():
+        if limiter._take() == 0.0:
+            taken.append(1)
+
+    threads = [threading.Thread(target=take) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(taken) == 5
+
+
+def test_state_file_shares_one_budget_between_limiters(tmp_cache_dir):
+    state_file = tmp_cache_dir / RATE_LIMIT_FILENAME
+    first = RateLimiter(rate=0.001, burst=2, state_file=state_file)
+    second = RateLimiter(rate=0.001, burst=2, state_file=state_file)
+
+    assert first._take() == 0.0
+    assert second._take() == 0.0
+    assert first._take() > 0
+    assert second._take() > 0
+
+
+def test_unreadable_state_file_starts_a_full_bucket(tmp_cache_dir):
+    state_file = tmp_cache_dir / RATE_LIMIT_FILENAME
+    state_file.write_text("not json")
+    limiter = RateLimiter(rate=0.001, burst=1, state_file=state_file)
+
+    assert limiter._take() == 0.0
+    assert limiter._take() > 0
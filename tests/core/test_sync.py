@@ -0,0 +1,164 @@
+"""Tests for `igntui sync`'s discovery, deduplication and writes."""
+
+import threading
+
+from igntui.core.api.response import APIResponse
+from igntui.core.managed_block import BEGIN_MARKER
+from igntui.core.project_config import LEGACY_SIDECAR_FILENAME, SIDECAR_FILENAME, ProjectConfig
+from igntui.core.sync import SyncReport, find_sidecars, load_targets, sync_targets
+
+
+class FakeAPI:
+    def __init__(self, failing=()):
+        self.calls = []
+        self.failing = set(failing)
+        self._lock = threading.Lock()
+
+    def get_templates(self, technologies, force_refresh=False):
+        with self._lock:
+            self.calls.append(tuple(technologies))
+        if set(technologies) & self.failing:
+            return APIResponse(success=False, data="", error_message="HTTP 503")
+        return APIResponse(success=True, data=f"### {','.join(technologies)} ###\n")
+
+
+def _project(root, name, templates, output=".gitignore"):
+    directory = root / name
+    ProjectConfig(templates=templates, output_path=output).dump(directory / SIDECAR_FILENAME)
+    return directory
+
+
+def _sync(root, api, **kwargs):
+    report = SyncReport()
+    targets = load_targets(find_sidecars(root), report.failed)
+    return sync_targets(api, targets, report, **kwargs)
+
+
+def test_discovery_prunes_dependency_and_vcs_directories(tmp_path):
+    _project(tmp_path, "app", ["python"])
+    _project(tmp_path, "app/node_modules/pkg", ["node"])
+    _project(tmp_path, ".git/hooks", ["go"])
+    _project(tmp_path, ".github", ["go"])
+
+    found = find_sidecars(tmp_path)
+
+    assert found == sorted(
+        [tmp_path / "app" / SIDECAR_FILENAME, tmp_path / ".github" / SIDECAR_FILENAME]
+    )
+
+
+def test_discovery_prefers_the_current_name_over_the_legacy_one(tmp_path):
+    directory = _project(tmp_path, "app", ["python"])
+    (directory / LEGACY_SIDECAR_FILENAME).write_text((directory / SIDECAR_FILENAME).read_text())
+
+    assert find_sidecars(tmp_path) == [directory / SIDECAR_FILENAME]
+
+
+def test_identical_selections_are_fetched_once(tmp_path):
+    for i in range(5):
+        _project(tmp_path, f"svc{i}", ["Python", "node"] if i % 2 else ["node", "python"])
+    _project(tmp_path, "web", ["go"])
+    api = FakeAPI()
+
+    report = _sync(tmp_path, api)
+
+    assert len(api.calls) == 2
+    assert report.selections == 2
+    assert len(report.changed) == 6
+    assert (tmp_path / "svc0" / ".gitignore").read_text().startswith(BEGIN_MARKER)
+
+
+def test_second_run_leaves_files_untouched(tmp_path):
+    _project(tmp_path, "app", ["python"])
+    _sync(tmp_path, FakeAPI())
+    target = tmp_path / "app" / ".gitignore"
+    mtime = target.stat().st_mtime_ns
+
+    report = _sync(tmp_path, FakeAPI())
+
+    assert report.changed == [] and report.unchanged == [target]
+    assert target.stat().st_mtime_ns == mtime
+
+
+def test_custom_patterns_survive_a_sync(tmp_path):
+    _project(tmp_path, "app", ["python"])
+    _sync(tmp_path, FakeAPI())
+    target = tmp_path / "app" / ".gitignore"
+    target.write_text(
+        target.read_text().replace(
+            "preserves this block) <<<\n", "preserves this block) <<<\nmine/\n", 1
+        )
+    )
+
+    _sync(tmp_path, FakeAPI())
+
+    assert "mine/" in target.read_text()
+
+
+def test_dry_run_writes_nothing(tmp_path):
+    _project(tmp_path, "app", ["python"])
+
+    report = _sync(tmp_path, FakeAPI(), dry_run=True)
+
+    assert report.changed == [tmp_path / "app" / ".gitignore"]
+    assert not (tmp_path / "app" / ".gitignore").exists()
+
+
+def test_a_failed_fetch_fails_only_its_targets(tmp_path):
+    _project(tmp_path, "a", ["python"])
+    _project(tmp_path, "b", ["broken"])
+
+    report = _sync(tmp_path, FakeAPI(failing={"broken"}))
+
+    assert report.changed == [tmp_path / "a" / ".gitignore"]
+    assert report.failed == [(tmp_path / "b" / ".gitignore", "HTTP 503")]
+
+
+def test_output_paths_outside_the_sidecar_directory_are_refused(tmp_path):
+    _project(tmp_path, "app", ["python"], output="../elsewhere/.gitignore")
+
+    report = _sync(tmp_path, FakeAPI())
+
+    assert [reason for _, reason in report.failed] == [
+        "output path '../elsewhere/.gitignore' leaves its directory"
+    ]
+    assert not (tmp_path / "elsewhere").exists()
+
+
+def test_rewrites_replace_the_file_and_keep_its_mode(tmp_path):
+    _project(tmp_path, "app", ["python"])
+    target = tmp_path / "app" / ".gitignore"
+    target.write_text("old\n")
+    target.chmod(0o640)
+
+    report = _sync(tmp_path, FakeAPI())
+
+    assert report.changed == [target]
+    assert target.stat().st_mode & 0o777 == 0o640
+    assert sorted(p.name for p in target.parent.iterdir()) == [".gitignore", SIDECAR_FILENAME]
+
+
+def test_each_written_target_is_timed(tmp_path):
+    _project(tmp_path, "a", ["python"])
+    _project(tmp_path, "b", ["python"])
+
+    report = _sync(tmp_path, FakeAPI())
+
+    assert set(report.timings) == {tmp_path / "a" / ".gitignore", tmp_path / "b" / ".gitignore"}
+    fetch_a, write_a = report.timings[tmp_path / "a" / ".gitignore"]
+    assert fetch_a == report.timings[tmp_path / "b" / ".gitignore"][0]
+    assert fetch_a >= 0 and write_a >= 0
+
+
+def test_an_output_that_is_not_utf8_fails_only_its_own_target(tmp_path):
+    _project(tmp_path, "a", ["python"])
+    _project(tmp_path, "b", ["python"])
+    latin1 = tmp_path / "b" / ".gitignore"
+    latin1.write_bytes("# caf\xe9\n".encode("latin-1"))
+
+    report = _sync(tmp_path, FakeAPI())
+
+    assert report.changed == [tmp_path / "a" / ".gitignore"]
+    assert [path for path, _ in report.failed] == [latin1]
+    assert "utf-8" in report.failed[0][1]
+    assert latin1.read_bytes() == "# caf\xe9\n".encode("latin-1")
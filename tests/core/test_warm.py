@@ -0,0 +1,21 @@
+"""Tests for cache warming's selection handling."""
+
+from igntui.core.warm import expand_selections, parse_selections
+
+
+def test_a_selection_expands_to_its_members_and_the_combination():
+    assert expand_selections([["python", "node"]]) == [("python",), ("node",), ("node", "python")]
+
+
+def test_expansion_deduplicates_case_and_order_insensitively():
+    keys = expand_selections([["Python", "node"], ["node", "python"], ["PYTHON"]])
+    assert keys == [("python",), ("node",), ("node", "python")]
+
+
+def test_single_template_selection_is_not_repeated():
+    assert expand_selections([["rust"]]) == [("rust",)]
+
+
+def test_selection_file_format():
+    text = "# targets\npython,node\n  rust go  # trailing comment\n\n"
+    assert parse_selections(text) == [["python", "node"], ["rust", "go"]]
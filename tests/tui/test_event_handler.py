@@ -180,6 +180,28 @@ def test_c_clears_selections_and_content(handler):
     assert handler.state.generated_content == ""
 
 
+def test_p_toggles_preview_of_the_highlighted_template(handler):
+    press(handler, curses.KEY_DOWN, ord("p"))
+
+    assert handler.state.preview_mode
+    assert handler.state.get_highlighted_template() == "node"
+
+    press(handler, ord("p"))
+    assert not handler.state.preview_mode
+
+
+def test_content_keys_scroll_a_long_preview(handler):
+    press(handler, ord("p"))
+    handler.state.preview_lines = [f"line {i}" for i in range(40)]
+    handler.state.current_panel = 3
+
+    handler.handle_input(curses.KEY_END)
+    assert handler.state.content_scroll == 30
+
+    press(handler, ord("p"))
+    assert handler.state.content_scroll == 0
+
+
 def test_arrows_move_the_highlight_without_leaving_bounds(handler):
     handler.handle_input(curses.KEY_UP)
     assert handler.state.template_selected == 0
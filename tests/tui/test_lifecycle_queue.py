@@ -5,6 +5,7 @@ ever touching state directly.
 """
 
 import queue
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -18,6 +19,7 @@ from igntui.tui.updates import (
     GenerationCompleted,
     LoadCompleted,
     StateUpdate,
+    TemplatesChanged,
     TemplatesLoaded,
     TemplatesLoadFailed,
 )
@@ -92,6 +94,150 @@ def test_generate_empty_template_list_posts_failure_synchronously():
     api.get_templates.assert_not_called()
 
 
+def test_newer_generation_cancels_the_one_in_flight():
+    started = threading.Event()
+    cancels = []
+
+    def get_templates(templates, cancel=None):
+        cancels.append(cancel)
+        if templates == ["slow"]:
+            started.set()
+            cancel.wait(5)
+            return APIResponse(success=False, data="", error_message="Request cancelled")
+        return APIResponse(success=True, data="FAST")
+
+    api = MagicMock()
+    api.get_templates.side_effect = get_templates
+    lc = TemplateLifecycle(api, SearchManager())
+
+    q: queue.Queue[StateUpdate] = queue.Queue()
+    lc.generate_content_async(["slow"], q)
+    assert started.wait(1)
+    lc.generate_content_async(["fast"], q)
+    msgs = _drain(q) + _drain(q)
+
+    assert cancels[0].is_set() and not cancels[1].is_set()
+    assert not any(isinstance(m, ContentGenerationFailed) for m in msgs)
+    assert [m.content for m in msgs if isinstance(m, ContentGenerated)] == ["FAST"]
+
+
+def test_cancel_pending_abandons_a_template_load():
+    def list_templates(cancel=None):
+        cancel.wait(5)
+        return APIResponse(success=False, data=[], error_message="Request cancelled")
+
+    api = MagicMock()
+    api.list_templates.side_effect = list_templates
+    lc = TemplateLifecycle(api, SearchManager())
+
+    q: queue.Queue[StateUpdate] = queue.Queue()
+    lc.load_templates_async(q)
+    lc.cancel_pending()
+    msgs = _drain(q)
+
+    assert [type(m) for m in msgs] == [LoadCompleted]
+
+
+# --- background refresh --------------------------------------------------------
+
+
+@pytest.fixture
+def refreshing(monkeypatch):
+    from igntui.tui import lifecycle
+
+    monkeypatch.setattr(lifecycle, "_REFRESH_PAUSE", 0)
+    api = MagicMock()
+    api.network_policy = "online"
+    api.circuit_breaker.is_open.return_value = False
+    api.list_templates.return_value = APIResponse(success=True, data=["python", "Go", "rust"])
+    lc = TemplateLifecycle(api, SearchManager())
+    lc.usage = MagicMock()
+    lc.usage.top.return_value = ["python", "go"]
+    return api, lc
+
+
+def _pending(q):
+    msgs = []
+    while not q.empty():
+        msgs.append(q.get_nowait())
+    return msgs
+
+
+def test_refresh_posts_only_the_changes(refreshing):
+    api, lc = refreshing
+    lc.remember_templates(["python", "node", "rust"])
+
+    q: queue.Queue[StateUpdate] = queue.Queue()
+    lc.refresh_once(q)
+
+    assert _pending(q) == [TemplatesChanged(added=["Go"], removed=["node"])]
+    api.list_templates.assert_called_once()
+    assert api.list_templates.call_args.kwargs["force_refresh"] is True
+
+
+def test_unchanged_catalogue_posts_nothing_but_refreshes_recent_content(refreshing):
+    api, lc = refreshing
+    lc.remember_templates(["Go", "python", "rust"])
+
+    q: queue.Queue[StateUpdate] = queue.Queue()
+    lc.refresh_once(q)
+
+    assert _pending(q) == []
+    refreshed = [c.args[0] for c in api.get_templates.call_args_list]
+    assert refreshed == [["python"], ["go"]]
+    assert all(c.kwargs["force_refresh"] for c in api.get_templates.call_args_list)
+
+
+def test_refresh_without_a_known_catalogue_posts_the_whole_list(refreshing):
+    _, lc = refreshing
+
+    q: queue.Queue[StateUpdate] = queue.Queue()
+    lc.refresh_once(q)
+
+    assert _pending(q) == [TemplatesLoaded(["Go", "python", "rust"])]
+
+
+def test_failed_or_cached_refresh_is_silent(refreshing):
+    api, lc = refreshing
+    lc.remember_templates(["python"])
+    q: queue.Queue[StateUpdate] = queue.Queue()
+
+    api.list_templates.return_value = APIResponse(success=False, data=[], error_message="down")
+    lc.refresh_once(q)
+    api.list_templates.return_value = APIResponse(success=True, data=["go"], from_cache=True)
+    lc.refresh_once(q)
+
+    assert _pending(q) == []
+    api.get_templates.assert_not_called()
+
+
+def test_refresh_is_skipped_offline(refreshing):
+    api, lc = refreshing
+    api.network_policy = "offline"
+
+    lc.refresh_once(queue.Queue())
+
+    api.list_templates.assert_not_called()
+
+
+def test_auto_refresh_runs_on_its_interval_until_cancelled(refreshing):
+    api, lc = refreshing
+    lc.remember_templates(["python"])
+    q: queue.Queue[StateUpdate] = queue.Queue()
+
+    lc.start_auto_refresh(q, interval=0.01)
+    msg = q.get(timeout=2)
+    lc.cancel_pending()
+
+    assert isinstance(msg, TemplatesChanged)
+
+
+def test_zero_interval_disables_auto_refresh(refreshing):
+    api, lc = refreshing
+    lc.start_auto_refresh(queue.Queue(), interval=0)
+    assert lc._refresh_stop is None
+
+
 def test_state_updates_are_immutable():
     """`@dataclass(frozen=True)` should prevent post-construction mutation."""
     import dataclasses
@@ -0,0 +1,108 @@
+"""Tests for the TUI's idle-time prefetcher."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from igntui.core.api.response import APIResponse
+from igntui.tui.prefetch import TemplatePrefetcher
+
+
+@pytest.fixture
+def api():
+    api = MagicMock()
+    api.network_policy = "online"
+    api.circuit_breaker.is_open.return_value = False
+    api.get_templates.return_value = APIResponse(success=True, data="X")
+    return api
+
+
+def _settle(prefetcher, highlighted, selected=()):
+    prefetcher.update(highlighted, selected)
+    prefetcher.update(highlighted, selected)
+    if prefetcher._pool is not None:
+        prefetcher._pool.shutdown(wait=True)
+        prefetcher._pool = None
+
+
+def _fetched(api):
+    return sorted(tuple(c.args[0]) for c in api.get_templates.call_args_list)
+
+
+def test_nothing_is_fetched_until_the_cursor_rests(api):
+    prefetcher = TemplatePrefetcher(api, recent=lambda: [], delay=60)
+    prefetcher.update("python", set())
+    prefetcher.update("python", set())
+    api.get_templates.assert_not_called()
+
+
+def test_warms_the_selection_toggling_each_candidate_would_produce(api):
+    prefetcher = TemplatePrefetcher(api, recent=lambda: ["node", "python"], delay=0)
+    _settle(prefetcher, "go", {"python"})
+
+    # go: {python} + go; node: {python} + node; python: toggled off -> empty, skipped.
+    assert _fetched(api) == [("go", "python"), ("node", "python")]
+
+
+def test_moving_on_cancels_the_batch(api):
+    started = threading.Event()
+    cancels = []
+
+    def slow(selection, cancel=None):
+        cancels.append(cancel)
+        started.set()
+        cancel.wait(5)
+        return APIResponse(success=False, data="", error_message="Request cancelled")
+
+    api.get_templates.side_effect = slow
+    prefetcher = TemplatePrefetcher(api, recent=lambda: [], delay=0, max_workers=1)
+    prefetcher.update("go", set())
+    prefetcher.update("go", set())
+    assert started.wait(1)
+
+    prefetcher.update("rust", set())
+
+    assert cancels[0].is_set()
+    prefetcher.cancel()
+
+
+def test_concurrency_is_capped(api):
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fetch(selection, cancel=None):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return APIResponse(success=True, data="X")
+
+    api.get_templates.side_effect = fetch
+    recent = ["a", "b", "c", "d", "e", "f"]
+    prefetcher = TemplatePrefetcher(api, recent=lambda: recent, delay=0, max_workers=2)
+    _settle(prefetcher, None)
+
+    assert api.get_templates.call_count == 6
+    assert peak <= 2
+
+
+def test_warmed_selections_are_not_fetched_again(api):
+    prefetcher = TemplatePrefetcher(api, recent=lambda: [], delay=0)
+    _settle(prefetcher, "go")
+    _settle(prefetcher, "rust")
+    _settle(prefetcher, "go")
+
+    assert _fetched(api) == [("go",), ("rust",)]
+
+
+def test_offline_prefetches_nothing(api):
+    api.network_policy = "offline"
+    prefetcher = TemplatePrefetcher(api, recent=lambda: ["python"], delay=0)
+    _settle(prefetcher, "go")
+    api.get_templates.assert_not_called()
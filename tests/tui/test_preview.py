@@ -0,0 +1,68 @@
+"""Tests for the preview LRU and line rendering."""
+
+import queue
+from unittest.mock import MagicMock, patch
+
+from igntui.core.api.response import APIResponse
+from igntui.core.search import SearchManager
+from igntui.tui.lifecycle import TemplateLifecycle
+from igntui.tui.preview import PreviewCache, render_preview
+from igntui.tui.updates import PreviewFailed, PreviewLoaded
+from igntui.ui.components.content_panel import ContentPanel
+
+
+def test_cache_evicts_the_least_recently_used():
+    cache = PreviewCache(capacity=2)
+    cache.put("python", ["a"])
+    cache.put("node", ["b"])
+    cache.get("python")
+    cache.put("rust", ["c"])
+
+    assert cache.get("node") is None
+    assert cache.get("python") == ["a"]
+    assert cache.get("rust") == ["c"]
+    assert len(cache) == 2
+
+
+def test_render_expands_tabs_and_drops_trailing_blank_lines():
+    assert render_preview("# Python\n\t*.pyc  \n\n\n") == ["# Python", "    *.pyc"]
+
+
+def test_preview_worker_posts_rendered_lines():
+    api = MagicMock()
+    api.get_templates.return_value = APIResponse(success=True, data="*.pyc\n__pycache__/\n")
+    lc = TemplateLifecycle(api, SearchManager())
+
+    q: queue.Queue = queue.Queue()
+    lc.preview_async("python", q)
+
+    assert q.get(timeout=1) == PreviewLoaded("python", ["*.pyc", "__pycache__/"])
+    assert api.get_templates.call_args.args[0] == ["python"]
+
+
+def test_preview_worker_reports_failures():
+    api = MagicMock()
+    api.get_templates.return_value = APIResponse(
+        success=False, data="", error_message="HTTP 404: Not Found"
+    )
+    lc = TemplateLifecycle(api, SearchManager())
+
+    q: queue.Queue = queue.Queue()
+    lc.preview_async("nosuch", q)
+
+    assert q.get(timeout=1) == PreviewFailed("nosuch", "HTTP 404: Not Found")
+
+
+def test_a_long_preview_scrolls_with_the_content_offset():
+    stdscr = MagicMock()
+    panel = ContentPanel(stdscr, 0, 0, height=7, width=40)
+    panel.preview_mode = True
+    panel.preview_template = "python"
+    panel.preview_lines = [f"line {i}" for i in range(30)]
+    panel.content_scroll = 100  # past the end: clamped to the last page
+
+    with patch("curses.color_pair", return_value=0):
+        panel.draw()
+
+    drawn = [c.args[2] for c in stdscr.addstr.call_args_list if c.args[0] in range(1, 6)]
+    assert drawn[:5] == [f"line {i}" for i in range(25, 30)]
@@ -0,0 +1,76 @@
+"""The splash is one frame of the main loop, drawn from pre-rendered data."""
+
+import curses
+import sys
+
+import pytest
+
+from igntui.ui.components import splash
+from igntui.ui.components.splash import SplashScreen, logo_for_width
+from igntui.ui.components.splash_logo import LOGOS
+
+
+class FakeScreen:
+    def __init__(self, height=30, width=100):
+        self.size = (height, width)
+        self.calls: list[str] = []
+        self.text: dict[int, str] = {}
+
+    def getmaxyx(self):
+        return self.size
+
+    def addstr(self, y, x, text, attr=0):
+        if y >= self.size[0] or x + len(text) > self.size[1]:
+            raise curses.error("addstr outside the window")
+        self.text[y] = self.text.get(y, "") + text
+
+    def erase(self):
+        self.calls.append("erase")
+
+    def clear(self):
+        self.calls.append("clear")
+
+    def refresh(self):
+        self.calls.append("refresh")
+
+
+@pytest.fixture(autouse=True)
+def no_terminal(monkeypatch):
+    monkeypatch.setattr(curses, "color_pair", lambda n: 0)
+
+
+def _width(logo):
+    return max(len(line) for line in logo)
+
+
+def test_logos_are_widest_first_and_end_in_plain_text():
+    widths = [_width(logo) for logo in LOGOS]
+    assert widths == sorted(widths, reverse=True)
+    assert LOGOS[-1] == ("igntui",)
+
+
+def test_widest_logo_that_fits_is_chosen():
+    assert logo_for_width(200) == LOGOS[0]
+    assert logo_for_width(_width(LOGOS[0]) - 1) == LOGOS[1]
+    assert logo_for_width(3) == LOGOS[-1]
+
+
+def test_a_frame_erases_rather_than_clears():
+    screen = FakeScreen()
+    SplashScreen(screen).draw("Loading templates...")
+
+    assert screen.calls == ["erase", "refresh"]
+    assert any("Loading templates..." in line for line in screen.text.values())
+    assert any("█" in line for line in screen.text.values())
+
+
+def test_a_narrow_terminal_still_gets_a_frame():
+    screen = FakeScreen(height=12, width=20)
+    SplashScreen(screen).draw("Loading templates...")
+    assert any("igntui" in line for line in screen.text.values())
+
+
+def test_pyfiglet_is_not_needed(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyfiglet", None)
+    SplashScreen(FakeScreen()).draw("Loading templates...")
+    assert splash.LOGOS is LOGOS